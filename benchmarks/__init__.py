@@ -0,0 +1 @@
+"""lawg.py benchmarks, run as modules from the repository root, e.g. `python -m benchmarks.prepare_response`."""
@@ -0,0 +1,47 @@
+"""Benchmark decoding large event pages through marshmallow and through `RecordDecoder`.
+
+    python -m benchmarks.decoders [--events 1000] [--number 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import statistics
+import timeit
+
+from benchmarks.prepare_response import page
+from lawg.decoders import RecordDecoder, msgspec
+from lawg.schemas import EventSchema, prebuilt
+from lawg.syncio.client import Client
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=1000)
+    parser.add_argument("--number", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    response = page(args.events)
+    schema = prebuilt(EventSchema, many=True)
+
+    backends = ["marshmallow", "python"] + ([] if msgspec is None else ["msgspec"])
+    results = {}
+    for backend in backends:
+        decoder = None if backend == "marshmallow" else RecordDecoder(backend)
+        rest = Client(token="benchmark", project="benchmark", record_decoder=decoder).rest
+        events = rest.prepare_response(response, schema)
+        assert len(events) == args.events
+
+        runs = timeit.repeat(functools.partial(rest.prepare_response, response, schema), number=args.number, repeat=args.repeat)
+        results[backend] = statistics.median(runs) / args.number
+        speedup = results["marshmallow"] / results[backend]
+        print(f"{backend:>12}: {results[backend] * 1e3:8.3f} ms per {args.events}-event page ({speedup:.2f}x)")
+
+    if msgspec is None:
+        print("msgspec isn't installed, skipped its backend")
+
+
+if __name__ == "__main__":
+    main()
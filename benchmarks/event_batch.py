@@ -0,0 +1,68 @@
+"""Benchmark holding and aggregating a large page of events as `Event` objects and as an `EventBatch`.
+
+    python -m benchmarks.event_batch [--events 200000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import time
+import tracemalloc
+import typing as t
+
+from benchmarks.prepare_response import pika
+from lawg.batch import EventBatch
+from lawg.syncio.client import Client
+
+
+def events_data(events: int) -> t.Iterator[dict[str, object]]:
+    # fresh objects per event, like a parsed response, so whatever is kept alive is measured
+    for i in range(events):
+        yield {
+            "id": pika("event", i),
+            "project_id": pika("project", 0),
+            "feed_id": pika("feed", 0),
+            "title": f"signup {i % 8}",
+            "description": f"a benchmark event {i}",
+            "emoji": None,
+            "tags": {"region": "eu", "attempt": i, "ok": True},
+        }
+
+
+def measure(build: t.Callable[[], object]) -> tuple[object, float, float]:
+    start = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    built = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return built, elapsed, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=200_000)
+    args = parser.parse_args()
+
+    client = Client(token="benchmark", project="benchmark")
+    events, events_time, events_size = measure(
+        lambda: [client._construct_event("benchmark", event_data) for event_data in events_data(args.events)]
+    )
+    batch, batch_time, batch_size = measure(lambda: EventBatch(client, "benchmark", events_data(args.events)))
+    print(f"{'events':>8}: built in {events_time:6.3f} s, {events_size / 1e6:8.1f} MB")
+    print(f"{'batch':>8}: built in {batch_time:6.3f} s, {batch_size / 1e6:8.1f} MB ({events_size / batch_size:.1f}x smaller)")
+
+    start = time.perf_counter()
+    counts = collections.Counter(event.title for event in events)  # type: ignore
+    events_time = time.perf_counter() - start
+    start = time.perf_counter()
+    batch_counts = batch.value_counts("title")  # type: ignore
+    batch_time = time.perf_counter() - start
+    assert batch_counts == dict(counts)
+    print(f"count titles: events {events_time * 1e3:.1f} ms, batch {batch_time * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Benchmark incrementing one insight from 1 to 64 threads, through a lock, the increment buffer and a sharded counter.
+
+Every run makes the same number of increments in total, split evenly between the threads.
+Requests are answered from memory, and nothing is flushed while the increments are timed.
+
+    python -m benchmarks.insight_counter [--increments 1000000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import threading
+import time
+import typing as t
+
+import httpx
+
+from benchmarks.prepare_response import pika
+from lawg.syncio.client import Client
+
+THREADS = (1, 2, 4, 8, 16, 32, 64)
+
+
+def client() -> Client:
+    insight = {
+        "id": pika("insight", 0),
+        "title": "benchmark",
+        "description": None,
+        "value": 0.0,
+        "emoji": None,
+        "updated_at": None,
+        "created_at": "2023-01-01T00:00:00+00:00",
+    }
+    benchmark_client = Client(token="benchmark", project="benchmark")
+    benchmark_client.rest.http_client = httpx.Client(
+        transport=httpx.MockTransport(lambda _: httpx.Response(200, json={"success": True, "data": insight})),
+        headers=benchmark_client.rest.headers,
+    )
+    return benchmark_client
+
+
+def add_locked(lock: threading.Lock, totals: dict[str, float], insight_id: str) -> None:
+    with lock:
+        totals[insight_id] = totals.get(insight_id, 0.0) + 1.0
+
+
+def run(threads: int, increments: int, add: t.Callable[[], None]) -> float:
+    per_thread = increments // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def work() -> None:
+        barrier.wait()
+        for _ in range(per_thread):
+            add()
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--increments", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    insight_id = pika("insight", 0)
+    print(f"{'threads':>8} {'lock':>12} {'buffer':>12} {'sharded':>12}   (million increments/s)")
+    for threads in THREADS:
+        increments = args.increments // threads * threads
+
+        totals: dict[str, float] = {}
+        with client() as buffered_client:
+            buffer = buffered_client.buffer_increments(interval=3600, threshold=increments + 1)
+            buffer_time = run(threads, increments, functools.partial(buffer.add, insight_id, 1.0))
+
+        with client() as counter_client:
+            counter = counter_client.counter(id=insight_id)
+            counter_time = run(threads, increments, counter.add)
+            assert counter.pending == increments
+        lock_time = run(threads, increments, functools.partial(add_locked, threading.Lock(), totals, insight_id))
+        assert totals[insight_id] == increments
+
+        rates = (increments / elapsed / 1e6 for elapsed in (lock_time, buffer_time, counter_time))
+        print(f"{threads:>8}", *(f"{rate:>12.2f}" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark `BaseRest.prepare_response` on pages of 100 events.
+
+Compares the current path (envelope check without copying, then the event schema's compiled
+function) against building `APISuccessSchema` and `EventSchema` and loading the envelope through
+them on every call.
+
+    python -m benchmarks.prepare_response [--events 100] [--number 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import statistics
+import time
+import timeit
+
+import httpx
+
+from lawg.schemas import APISuccessSchema, EventSchema, prebuilt
+from lawg.syncio.client import Client
+
+EPOCH = 1640995200000
+
+
+def pika(prefix: str, seq: int) -> str:
+    snowflake = ((int(time.time() * 1000) - EPOCH) << 22) | (1 << 12) | (seq & 0xFFF)
+    return f"{prefix}_{base64.urlsafe_b64encode(str(snowflake).encode()).decode().rstrip('=')}"
+
+
+def page(events: int) -> httpx.Response:
+    data = [
+        {
+            "id": pika("event", i),
+            "project_id": pika("project", 0),
+            "feed_id": pika("feed", 0),
+            "title": f"event {i}",
+            "description": "a benchmark event " * 4,
+            "emoji": None,
+            "tags": {"region": "eu", "attempt": i, "ok": True},
+        }
+        for i in range(events)
+    ]
+    body = json.dumps({"success": True, "data": data}).encode()
+    request = httpx.Request("GET", "https://api.lawg.dev/v1/projects/benchmark/feeds/benchmark/events")
+    return httpx.Response(200, content=body, headers={"content-type": "application/json"}, request=request)
+
+
+def previous(response: httpx.Response) -> object:
+    api_data = APISuccessSchema().load(response.json())
+    return EventSchema(many=True).load(api_data["data"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=100)
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rest = Client(token="benchmark", project="benchmark").rest
+    response = page(args.events)
+    schema = prebuilt(EventSchema, many=True)
+    assert previous(response) == rest.prepare_response(response, schema)
+
+    cases = {
+        "previous": lambda: previous(response),
+        "prepare_response": lambda: rest.prepare_response(response, schema),
+    }
+    results = {}
+    for name, case in cases.items():
+        runs = timeit.repeat(case, number=args.number, repeat=args.repeat)
+        results[name] = statistics.median(runs) / args.number
+        print(f"{name:>18}: {results[name] * 1e3:8.3f} ms per {args.events}-event page")
+    print(f"{'speedup':>18}: {results['previous'] / results['prepare_response']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Benchmark exporting every feed of a project, one feed at a time and with `export_project()`.
+
+Pages are served from memory after a simulated network latency, so the timings show how the
+export scales with connections and encoding processes rather than with the API.
+
+    python -m benchmarks.project_export [--feeds 8] [--events 5000] [--latency 0.02] [--compression xz]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+import httpx
+
+from benchmarks.prepare_response import pika
+from lawg.asyncio.client import AsyncClient
+
+
+def pages(feeds: int, events: int) -> dict[str, list[dict[str, object]]]:
+    return {
+        f"feed-{feed}": [
+            {
+                "id": pika("event", feed * events + i),
+                "project_id": pika("project", 0),
+                "feed_id": pika("feed", feed),
+                "title": f"signup {i % 8}",
+                "description": f"a benchmark event {i} " * 4,
+                "emoji": None,
+                "tags": {"region": "eu", "attempt": i, "ok": True},
+            }
+            for i in range(events)
+        ]
+        for feed in range(feeds)
+    }
+
+
+def client(events_by_feed: dict[str, list[dict[str, object]]], latency: float) -> AsyncClient:
+    project = {
+        "id": pika("project", 0),
+        "namespace": "benchmark",
+        "name": "benchmark",
+        "flags": 0,
+        "icon": None,
+        "feeds": [
+            {"id": pika("feed", index), "project_id": pika("project", 0), "name": name, "description": None, "emoji": None}
+            for index, name in enumerate(events_by_feed)
+        ],
+        "members": [],
+    }
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency)
+        parts = request.url.path.split("/")
+        if parts[-1] == "events":
+            body = json.loads(request.content or b"{}")
+            offset, limit = body.get("offset") or 0, body.get("limit") or 25
+            data: object = events_by_feed[parts[-2]][offset : offset + limit]
+        else:
+            data = project
+        return httpx.Response(200, json={"success": True, "data": data})
+
+    benchmark_client = AsyncClient(token="benchmark", project="benchmark")
+    benchmark_client.rest.http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handle), headers=benchmark_client.rest.headers
+    )
+    return benchmark_client
+
+
+async def run(args: argparse.Namespace) -> None:
+    events_by_feed = pages(args.feeds, args.events)
+    total = args.feeds * args.events
+    options = {"format": args.format, "compression": args.compression, "page_size": args.page_size}
+
+    with tempfile.TemporaryDirectory() as directory:
+        async with client(events_by_feed, args.latency) as benchmark_client:
+            start = time.perf_counter()
+            for feed in events_by_feed:
+                path = os.path.join(directory, "sequential", feed)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                await benchmark_client.export_events(feed=feed, path=path, resume=False, **options)
+            elapsed = time.perf_counter() - start
+            print(f"{'one feed at a time':>34}: {elapsed:6.2f} s, {total / elapsed:9.0f} events/s")
+
+            runs = dict.fromkeys([(1, 1), (args.connections, 1), (args.connections, args.processes)])
+            for connections, processes in runs:
+                start = time.perf_counter()
+                await benchmark_client.export_project(
+                    os.path.join(directory, f"project-{connections}-{processes}"),
+                    resume=False,
+                    connections=connections,
+                    processes=processes,
+                    **options,
+                )
+                elapsed = time.perf_counter() - start
+                label = f"{connections} connections, {processes} processes"
+                print(f"{label:>34}: {elapsed:6.2f} s, {total / elapsed:9.0f} events/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--feeds", type=int, default=8)
+    parser.add_argument("--events", type=int, default=5_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.02, help="the simulated latency of each request, in seconds")
+    parser.add_argument("--format", default="ndjson")
+    parser.add_argument("--compression", default="xz")
+    parser.add_argument("--connections", type=int, default=8)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Benchmark the insight writes of worker processes buffering their own increments and sharing them in memory.
+
+Each worker increments a few insights for the same number of seconds, flushing every interval, and
+counts the requests it sends. Requests are answered from memory.
+
+    python -m benchmarks.shared_increments [--workers 1,2,4,8,16] [--insights 4] [--seconds 3] [--interval 0.5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import time
+
+import httpx
+
+from benchmarks.prepare_response import pika
+from lawg.syncio.client import Client
+
+
+def client(writes: list[int]) -> Client:
+    def handle(request: httpx.Request) -> httpx.Response:
+        writes.append(1)
+        insight = {
+            "id": request.url.path.rsplit("/", 1)[-1],
+            "title": "benchmark",
+            "description": None,
+            "value": 0.0,
+            "emoji": None,
+            "updated_at": None,
+            "created_at": "2023-01-01T00:00:00+00:00",
+        }
+        return httpx.Response(200, json={"success": True, "data": insight})
+
+    benchmark_client = Client(token="benchmark", project="benchmark")
+    benchmark_client.rest.http_client = httpx.Client(
+        transport=httpx.MockTransport(handle),
+        headers=benchmark_client.rest.headers,
+    )
+    return benchmark_client
+
+
+def work(mode: str, ids: list[str], name: str, seconds: float, interval: float, start: float, results) -> None:
+    writes: list[int] = []
+    worker_client = client(writes)
+    if mode == "shared":
+        worker_client.share_increments(ids=ids, name=name, interval=interval)
+    else:
+        worker_client.buffer_increments(interval=interval, threshold=1_000_000_000)
+
+    time.sleep(max(0.0, start - time.time()))
+    increments = 0
+    while time.time() - start < seconds:
+        for insight_id in ids:
+            worker_client.increment_insight(id=insight_id, value=1.0)
+        increments += len(ids)
+    worker_client.close()
+    results.put((increments, len(writes)))
+
+
+def run(mode: str, workers: int, ids: list[str], seconds: float, interval: float) -> tuple[int, int]:
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    name = f"lawg-benchmark-{os.getpid()}-{workers}"
+    start = time.time() + 0.5
+    processes = [
+        context.Process(target=work, args=(mode, ids, name, seconds, interval, start, results)) for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    totals = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return sum(increments for increments, _ in totals), sum(writes for _, writes in totals)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", default="1,2,4,8,16")
+    parser.add_argument("--insights", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--interval", type=float, default=0.5)
+    args = parser.parse_args()
+
+    ids = [pika("insight", i) for i in range(args.insights)]
+    print(f"{'workers':>8} {'buffer writes':>14} {'shared writes':>14} {'buffer M inc/s':>15} {'shared M inc/s':>15}")
+    for workers in map(int, args.workers.split(",")):
+        buffer_increments, buffer_writes = run("buffer", workers, ids, args.seconds, args.interval)
+        shared_increments, shared_writes = run("shared", workers, ids, args.seconds, args.interval)
+        rates = (increments / args.seconds / 1e6 for increments in (buffer_increments, shared_increments))
+        print(f"{workers:>8} {buffer_writes:>14} {shared_writes:>14}", *(f"{rate:>15.2f}" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
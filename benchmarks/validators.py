@@ -0,0 +1,57 @@
+"""Benchmark loading request bodies through marshmallow and through their compiled validators.
+
+    python -m benchmarks.validators [--number 20000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import timeit
+
+from lawg import compiler
+from lawg.schemas import EventCreateBodySchema, EventCreateSlugSchema, InsightPatchBodySchema, prebuilt
+
+CASES = {
+    "EventCreateBodySchema": (
+        EventCreateBodySchema,
+        {
+            "title": "user signed up",
+            "description": "a new user signed up from the landing page",
+            "emoji": "🎉",
+            "tags": {"plan": "pro", "seats": 5, "trial": False},
+            "notify": True,
+        },
+    ),
+    "EventCreateSlugSchema": (EventCreateSlugSchema, {"namespace": "benchmark", "feed": "signups"}),
+    "InsightPatchBodySchema": (InsightPatchBodySchema, {"title": "signups", "value": {"increment": 1}}),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, (schema_cls, data) in CASES.items():
+        schema = prebuilt(schema_cls)
+        assert compiler.load(schema, data) == schema.load(data)
+
+        cases = {
+            "marshmallow": lambda: schema.load(data),  # noqa: B023
+            "compiled": lambda: compiler.load(schema, data),  # noqa: B023
+        }
+        results = {}
+        for path, call in cases.items():
+            runs = timeit.repeat(call, number=args.number, repeat=args.repeat)
+            results[path] = statistics.median(runs) / args.number
+        speedup = results["marshmallow"] / results["compiled"]
+        print(
+            f"{name:>24}: marshmallow {results['marshmallow'] * 1e6:7.2f} us,"
+            f" compiled {results['compiled'] * 1e6:6.2f} us ({speedup:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
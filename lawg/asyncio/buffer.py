@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import typing as t
+import weakref
+
+from lawg.base.buffer import BaseIncrementBuffer
+from lawg.exceptions import LawgBufferClosedError, LawgNotFoundError
+
+if t.TYPE_CHECKING:
+    from lawg.asyncio.client import AsyncClient
+
+
+logger = logging.getLogger(__name__)
+
+
+class _LoopState:
+    __slots__ = ("pending", "count", "wake", "task", "closed")
+
+    def __init__(self) -> None:
+        self.pending: dict[str, float] = {}
+        self.count = 0
+        self.wake = asyncio.Event()
+        self.task: asyncio.Task[None] | None = None
+        self.closed = False
+
+
+class AsyncIncrementBuffer(BaseIncrementBuffer["AsyncClient"]):
+    """
+    An async increment buffer, flushed by a background task.
+
+    Pending increments are kept per event loop and only touched from that loop, so adding
+    needs no locks. Closing the buffer from any loop closes it for every loop.
+    """
+
+    def __init__(self, client: AsyncClient, *, interval: float = 1.0, threshold: int = 1000) -> None:
+        super().__init__(client, interval=interval, threshold=threshold)
+        self._states: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState] = weakref.WeakKeyDictionary()
+        # the states of loops that were garbage collected before the buffer was closed
+        self._orphans: list[_LoopState] = []
+        self._closed = False
+
+    def add(self, id: str, value: float) -> None:
+        if self._closed:
+            raise LawgBufferClosedError
+        state = self._state()
+        if state.closed:
+            raise LawgBufferClosedError
+        state.pending[id] = state.pending.get(id, 0.0) + value
+        state.count += 1
+
+        if state.task is None and not state.closed:
+            state.task = asyncio.ensure_future(self._run(state))
+        if state.count >= self.threshold:
+            state.wake.set()
+
+    async def flush(self) -> None:
+        await self._flush(self._state())
+
+    async def _flush(self, state: _LoopState) -> None:
+        pending, state.pending = state.pending, {}
+        state.count = 0
+
+        unsent = [(insight_id, total) for insight_id, total in pending.items() if total]
+        try:
+            while unsent:
+                insight_id, total = unsent[-1]
+                try:
+                    insight_data = await self.client.rest.edit_insight(
+                        project=self.client.project,
+                        insight_id=insight_id,
+                        value={"increment": total},
+                    )
+                except LawgNotFoundError:
+                    # the insight is gone, retrying would never succeed
+                    logger.warning("dropping increments of deleted insight %s", insight_id)
+                    unsent.pop()
+                    continue
+                unsent.pop()
+                if self.client.identity_map is not None:
+                    self.client._construct_insight(insight_data)
+        finally:
+            # put anything that wasn't sent back, so a failed flush doesn't lose increments
+            for insight_id, total in unsent:
+                state.pending[insight_id] = state.pending.get(insight_id, 0.0) + total
+
+    async def close(self) -> None:
+        self._closed = True
+        current = asyncio.get_running_loop()
+        closing: list[t.Awaitable[None]] = []
+        for loop, state in list(self._states.items()):
+            if loop is current or not loop.is_running():
+                closing.append(self._close_state(state, loop is current))
+            else:
+                # the state's task and pending increments belong to the loop, close them on it
+                future = asyncio.run_coroutine_threadsafe(self._close_state(state, True), loop)
+                closing.append(asyncio.wrap_future(future))
+        closing += [self._close_state(state, False) for state in self._orphans]
+        self._orphans = []
+        # every state is closed even if one fails to flush
+        errors = [error for error in await asyncio.gather(*closing, return_exceptions=True) if error is not None]
+        if errors:
+            raise errors[0]
+
+    async def _close_state(self, state: _LoopState, running: bool) -> None:
+        state.closed = True
+        if running:
+            state.wake.set()
+            if state.task is not None:
+                await state.task
+        # otherwise the loop is stopped, nothing runs its task or adds to it anymore
+        state.task = None
+        await self._flush(state)
+
+    def _state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        state = self._states.get(loop)
+        if state is None:
+            state = self._states[loop] = _LoopState()
+            # a loop can go away unclosed, e.g. at the end of asyncio.run, its increments are sent on close
+            weakref.finalize(loop, self._orphans.append, state)
+        return state
+
+    async def _run(self, state: _LoopState) -> None:
+        while not state.closed:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(state.wake.wait(), self.interval)
+            state.wake.clear()
+            if state.closed:
+                return
+            try:
+                await self._flush(state)
+            except Exception:
+                logger.exception("failed to flush insight increments, retrying next interval")
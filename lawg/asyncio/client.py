@@ -1,32 +1,77 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
+import os
 import typing as t
+import weakref
+from concurrent.futures import ProcessPoolExecutor
 
+from lawg import pika
 from lawg.base.client import BaseClient
+from lawg.batch import EventBatch
+from lawg.export import FeedExport, encode_page, export_path
 from lawg.asyncio.feed import AsyncFeed
 from lawg.asyncio.rest import AsyncRest
 from lawg.asyncio.event import AsyncEvent
 from lawg.asyncio.insight import AsyncInsight
-
+from lawg.asyncio.buffer import AsyncIncrementBuffer
+from lawg.asyncio.counter import AsyncShardedCounter
+from lawg.asyncio.metrics import AsyncMetrics
+from lawg.asyncio.shared import AsyncSharedIncrements
+from lawg.asyncio.subscription import AsyncSubscription
+from lawg.asyncio.tail import AsyncFeedPoller
+
+from lawg.exceptions import LawgConflictError, LawgNotFoundError
+from lawg.snapshot import ProjectSnapshot
 from lawg.typings import STR_DICT, UNDEFINED, Undefined
 
 if t.TYPE_CHECKING:
     import datetime
+    from lawg.cache import ResponseCache
+    from lawg.decoders import RecordDecoder
+    from lawg.mirror import EventMirror
+    from lawg.typings import PATH
+    from lawg.typings import ProgressCallback
+
+    T = t.TypeVar("T")
 
 
-class AsyncClient(BaseClient["AsyncFeed", "AsyncEvent", "AsyncInsight", "AsyncRest"]):
+class AsyncClient(BaseClient["AsyncFeed", "AsyncEvent", "AsyncInsight", "AsyncRest", "AsyncIncrementBuffer"]):
     """
     The syncio client for lawg.
     """
 
+    shared_increments: AsyncSharedIncrements | None
+
     def __init__(
         self,
         *,
         token: str,
         project: str,
+        cache: ResponseCache | None = None,
+        identity_map: bool = False,
+        insight_cache_path: PATH | None = None,
+        auto_create_feeds: bool = False,
+        max_retries: int = 0,
+        record_decoder: RecordDecoder | None = None,
+        max_concurrency: int = 16,
+        mirror: EventMirror | None = None,
     ) -> None:
-        super().__init__(token, project)
-        self.rest = AsyncRest(self)
+        super().__init__(token, project, identity_map, insight_cache_path, auto_create_feeds, mirror)
+        self.rest = AsyncRest(self, cache=cache, max_retries=max_retries, record_decoder=record_decoder)
+        # in-flight feed provisioning, shared by every event waiting on the same feed
+        self._feed_tasks: dict[str | None, asyncio.Task[None]] = {}
+        # in-flight creation of insights looked up by title
+        self._title_tasks: dict[str, asyncio.Task[AsyncInsight]] = {}
+        # shared by every bulk helper so concurrent bulk calls can't exceed the limit together
+        self.max_concurrency = max_concurrency
+        self._limiters: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = weakref.WeakKeyDictionary()
+        # the poller of each tailed feed, shared by its tails
+        self._pollers: dict[str, AsyncFeedPoller] = {}
+        # the counter of each insight, shared by its callers
+        self._counters: dict[str, AsyncShardedCounter] = {}
 
     # --- ASYNCIO --- #
 
@@ -37,6 +82,19 @@ class AsyncClient(BaseClient["AsyncFeed", "AsyncEvent", "AsyncInsight", "AsyncRe
         await self.close()
 
     async def close(self) -> None:
+        for poller in list(self._pollers.values()):
+            await poller.close()
+        for counter in list(self._counters.values()):
+            await counter.close()
+        self._counters.clear()
+        if self._metrics is not None:
+            await self._metrics.close()
+        if self.shared_increments is not None:
+            await self.shared_increments.close()
+        if self.increment_buffer is not None:
+            await self.increment_buffer.close()
+            # increments made after closing are sent straight away
+            self.increment_buffer = None
         await self.rest.close()
 
     # --- MANAGERS --- #
@@ -44,6 +102,45 @@ class AsyncClient(BaseClient["AsyncFeed", "AsyncEvent", "AsyncInsight", "AsyncRe
     def feed(self, *, name: str):
         return AsyncFeed(self, name=name)
 
+    # --- SNAPSHOT --- #
+
+    async def warm(self, *, path: PATH | None = None, max_age: float | None = None):
+        if path is not None:
+            snapshot = ProjectSnapshot.load(path, max_age=max_age)
+            if snapshot is not None:
+                return self._use_snapshot(snapshot, None)
+
+        project_data, insights_data = await asyncio.gather(
+            self.rest.fetch_project(project=self.project),
+            self.rest.fetch_insights(project=self.project),
+        )
+        return self._use_snapshot(ProjectSnapshot(project_data, insights_data), path)
+
+    # --- FEEDS --- #
+
+    async def ensure_feed(self, name: str) -> None:
+        if self.known_feeds is None:
+            await self._single_flight(None, self._load_known_feeds)
+        if name not in self.known_feeds:  # type: ignore
+            await self._single_flight(name, functools.partial(self._create_feed, name))
+
+    async def _single_flight(self, key: str | None, factory: t.Callable[[], t.Awaitable[None]]) -> None:
+        task = self._feed_tasks.get(key)
+        if task is None:
+            task = self._feed_tasks[key] = asyncio.ensure_future(factory())
+            task.add_done_callback(lambda _: self._feed_tasks.pop(key, None))
+        await asyncio.shield(task)
+
+    async def _load_known_feeds(self) -> None:
+        project_data = await self.rest.fetch_project(project=self.project)
+        self.known_feeds = {feed["name"] for feed in project_data["feeds"]}
+
+    async def _create_feed(self, name: str) -> None:
+        # a conflict means another client created it in the meantime
+        with contextlib.suppress(LawgConflictError):
+            await self.rest.create_feed(project=self.project, feed=name)
+        self.known_feeds.add(name)  # type: ignore
+
     # --- EVENTS --- #
 
     async def event(
@@ -57,8 +154,10 @@ class AsyncClient(BaseClient["AsyncFeed", "AsyncEvent", "AsyncInsight", "AsyncRe
         timestamp: datetime.datetime | None = None,
         notify: bool | None = None,
         metadata: dict[str, str | int | float | bool] | None = None,
+        idempotency_key: str | None = None,
     ):
-        event_data = await self.rest.create_event(
+        create_event = functools.partial(
+            self.rest.create_event,
             project=self.project,
             feed=feed,
             title=title,
@@ -68,7 +167,19 @@ class AsyncClient(BaseClient["AsyncFeed", "AsyncEvent", "AsyncInsight", "AsyncRe
             timestamp=timestamp,
             notify=notify,
             metadata=metadata,
+            idempotency_key=idempotency_key or self.rest.new_idempotency_key(),
         )
+        if not self.auto_create_feeds:
+            return self._construct_event(feed, await create_event())
+
+        await self.ensure_feed(feed)
+        try:
+            event_data = await create_event()
+        except LawgNotFoundError:
+            # the feed was deleted since it was last seen, create it again and replay the event
+            self.known_feeds.discard(feed)  # type: ignore
+            await self.ensure_feed(feed)
+            event_data = await create_event()
         return self._construct_event(feed, event_data)
 
     async def edit_event(
@@ -92,7 +203,9 @@ class AsyncClient(BaseClient["AsyncFeed", "AsyncEvent", "AsyncInsight", "AsyncRe
             tags=tags,
             timestamp=timestamp,
         )
-        return self._construct_event(feed, event_data)
+        event = self._construct_event(feed, event_data)
+        self._mirror_store(event)
+        return event
 
     async def fetch_event(self, *, feed: str, id: str):
         event_data = await self.rest.fetch_event(
@@ -109,15 +222,241 @@ class AsyncClient(BaseClient["AsyncFeed", "AsyncEvent", "AsyncInsight", "AsyncRe
         )
         return self._construct_events(feed, events_data)
 
+    async def stream_events(self, *, feed: str, limit: int | None = None, offset: int | None = None):
+        async for event_data in self.rest.stream_events(project=self.project, feed=feed, limit=limit, offset=offset):
+            yield self._construct_event(feed, event_data)
+
+    async def fetch_event_batch(self, *, feed: str, limit: int | None = None, offset: int | None = None):
+        batch: EventBatch[AsyncEvent] = EventBatch(self, feed)
+        async for event_data in self.rest.stream_events(project=self.project, feed=feed, limit=limit, offset=offset):
+            batch.append(event_data)
+        return batch
+
+    async def export_events(
+        self,
+        *,
+        feed: str,
+        path: PATH,
+        format: str = "ndjson",
+        compression: str | None = None,
+        page_size: int = 100,
+        resume: bool = True,
+    ):
+        # file writes and compression run in the default executor, off the event loop
+        loop = asyncio.get_running_loop()
+        export = await loop.run_in_executor(
+            None,
+            functools.partial(
+                FeedExport, path, feed=feed, format=format, compression=compression, page_size=page_size, resume=resume
+            ),
+        )
+        while not export.done:
+            batch = await self.fetch_event_batch(feed=feed, limit=page_size, offset=export.offset)
+            await loop.run_in_executor(None, export.add, batch)
+        return await loop.run_in_executor(None, export.finish)
+
+    async def export_project(
+        self,
+        directory: PATH,
+        *,
+        format: str = "ndjson",
+        compression: str | None = None,
+        page_size: int = 100,
+        resume: bool = True,
+        connections: int = 4,
+        processes: int | None = None,
+    ):
+        project_data = await self.rest.fetch_project(project=self.project)
+        feeds = [feed["name"] for feed in project_data["feeds"]]
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, functools.partial(os.makedirs, directory, exist_ok=True))
+        limiter = asyncio.Semaphore(connections)
+
+        async def export_feed(feed: str) -> int:
+            async with limiter:
+                path = export_path(directory, feed, format, compression)
+                return await self._export_feed(
+                    feed, path, pool, format=format, compression=compression, page_size=page_size, resume=resume
+                )
+
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            tasks = {feed: asyncio.ensure_future(export_feed(feed)) for feed in feeds}
+            try:
+                await asyncio.gather(*tasks.values())
+            except BaseException:
+                for task in tasks.values():
+                    task.cancel()
+                await asyncio.gather(*tasks.values(), return_exceptions=True)
+                raise
+        return {feed: task.result() for feed, task in tasks.items()}
+
+    async def _export_feed(
+        self,
+        feed: str,
+        path: str,
+        pool: ProcessPoolExecutor,
+        *,
+        format: str,
+        compression: str | None,
+        page_size: int,
+        resume: bool,
+    ) -> int:
+        # file writes run in the default executor, encoding and compression in the pool
+        loop = asyncio.get_running_loop()
+        export = await loop.run_in_executor(
+            None,
+            functools.partial(
+                FeedExport, path, feed=feed, format=format, compression=compression, page_size=page_size, resume=resume
+            ),
+        )
+        encode = functools.partial(encode_page, format=export.format, compression=export.compression)
+        # fetched pages wait here while the last one is encoded; the fetcher hands over its error, if any
+        pages: asyncio.Queue[EventBatch[AsyncEvent] | Exception] = asyncio.Queue(maxsize=1)
+
+        async def fetch(offset: int) -> None:
+            try:
+                while True:
+                    batch = await self.fetch_event_batch(feed=feed, limit=page_size, offset=offset)
+                    await pages.put(batch)
+                    if len(batch) < page_size:
+                        return
+                    offset += len(batch)
+            except Exception as exc:
+                await pages.put(exc)
+
+        fetcher = asyncio.ensure_future(fetch(export.offset)) if not export.done else None
+        try:
+            while not export.done:
+                batch = await pages.get()
+                if isinstance(batch, Exception):
+                    raise batch
+                start = export.start(batch)
+                data = None
+                if start < len(batch):
+                    data = await loop.run_in_executor(pool, functools.partial(encode, batch, start, header=export.header))
+                await loop.run_in_executor(None, export.write, batch, start, data)
+        finally:
+            if fetcher is not None:
+                fetcher.cancel()
+        return await loop.run_in_executor(None, export.finish)
+
+    async def iter_events(
+        self,
+        *,
+        feed: str,
+        since: pika.Bound | None = None,
+        until: pika.Bound | None = None,
+        page_size: int = 100,
+    ):
+        lower, upper = pika.window(since, until)
+        offset = 0
+        while True:
+            count = 0
+            events = self.rest.stream_events(project=self.project, feed=feed, limit=page_size, offset=offset)
+            try:
+                async for event_data in events:
+                    count += 1
+                    snowflake = pika.snowflake(event_data["id"])
+                    if upper is not None and snowflake >= upper:
+                        continue
+                    if snowflake < lower:
+                        return
+                    yield self._construct_event(feed, event_data)
+            finally:
+                await events.aclose()
+            if count < page_size:
+                return
+            offset += count
+
+    async def sync_mirror(self, mirror: EventMirror, *, feed: str, page_size: int = 100):
+        loop = asyncio.get_running_loop()
+        newest = None
+        count = 0
+        batch: list[AsyncEvent] = []
+        async for event in self.iter_events(feed=feed, since=mirror.last_id(feed), page_size=page_size):
+            if newest is None:
+                newest = event.id
+            batch.append(event)
+            if len(batch) >= mirror.batch_size:
+                count += await loop.run_in_executor(None, mirror.store, feed, batch)
+                batch = []
+        if batch:
+            count += await loop.run_in_executor(None, mirror.store, feed, batch)
+        # only advance once everything older was stored, an interrupted sync is simply repeated
+        if newest is not None:
+            mirror.advance(feed, newest)
+        return count
+
+    def subscribe(
+        self,
+        *,
+        feed: str,
+        mirror: EventMirror | None = None,
+        since: str | None = None,
+        url: str | None = None,
+    ):
+        return AsyncSubscription(self, feed, mirror=mirror, since=since, url=url)
+
+    async def tail(
+        self,
+        *,
+        feed: str,
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        page_size: int = 100,
+    ):
+        poller = self._pollers.get(feed)
+        if poller is None:
+            poller = self._pollers[feed] = AsyncFeedPoller(
+                self, feed, min_interval=min_interval, max_interval=max_interval, page_size=page_size
+            )
+        try:
+            await poller.start()
+        except Exception:
+            if not poller.tails and self._pollers.get(feed) is poller:
+                del self._pollers[feed]
+            raise
+        return poller.attach()
+
     async def delete_event(self, *, feed: str, id: str):
         await self.rest.delete_event(
             project=self.project,
             feed=feed,
             event_id=id,
         )
+        self._forget(id)
+        self._mirror_delete(id)
 
     # --- INSIGHTS --- #
 
+    def buffer_increments(self, *, interval: float = 1.0, threshold: int = 1000):
+        if self.increment_buffer is None:
+            self.increment_buffer = AsyncIncrementBuffer(self, interval=interval, threshold=threshold)
+        return self.increment_buffer
+
+    def share_increments(
+        self,
+        *,
+        ids: t.Iterable[str],
+        name: str | None = None,
+        interval: float = 1.0,
+        processes: int = 64,
+    ):
+        if self.shared_increments is None:
+            self.shared_increments = AsyncSharedIncrements(self, ids, name=name, interval=interval, processes=processes)
+        return self.shared_increments
+
+    def counter(self, *, id: str, interval: float | None = None):
+        counter = self._counters.get(id)
+        if counter is None:
+            counter = self._counters[id] = AsyncShardedCounter(self, id, interval=interval)
+        return counter
+
+    def metrics(self, *, interval: float = 10.0) -> AsyncMetrics:
+        if self._metrics is None:
+            self._metrics = AsyncMetrics(self, interval=interval)
+        return self._metrics
+
     async def insight(self, *, title: str, description: str, value: int, emoji: str | None = None):
         insight_data = await self.rest.create_insight(
             project=self.project,
@@ -126,8 +465,66 @@ class AsyncClient(BaseClient["AsyncFeed", "AsyncEvent", "AsyncInsight", "AsyncRe
             value=value,
             emoji=emoji,
         )
+        self.insight_titles.update({insight_data["title"]: insight_data["id"]})
         return self._construct_insight(insight_data)
 
+    async def insight_by_title(
+        self,
+        title: str,
+        *,
+        create: bool = True,
+        description: str | None = None,
+        emoji: str | None = None,
+        value: float = 0,
+    ):
+        insight = await self._insight_from_cache(title)
+        if insight is None:
+            insights = await self.fetch_insights()
+            self.insight_titles.update({insight.title: insight.id for insight in insights})
+            insight = next((insight for insight in insights if insight.title == title), None)
+        if insight is not None or not create:
+            return insight
+
+        # one task creates a missing insight, shared by every caller waiting on the same title
+        task = self._title_tasks.get(title)
+        if task is None:
+            task = self._title_tasks[title] = asyncio.ensure_future(
+                self._create_titled_insight(title, description=description, emoji=emoji, value=value)
+            )
+            task.add_done_callback(lambda _: self._title_tasks.pop(title, None))
+        return await asyncio.shield(task)
+
+    async def _insight_from_cache(self, title: str) -> AsyncInsight | None:
+        insight_id = self.insight_titles.get(title)
+        if insight_id is None:
+            return None
+        # only contacts the API when neither the identity map nor the snapshot holds the insight
+        insight = self._cached_insight(insight_id)
+        if insight is None:
+            try:
+                insight = await self.fetch_insight(id=insight_id)
+            except LawgNotFoundError:
+                return None
+        if insight.title != title:
+            # renamed since it was cached
+            self.insight_titles.discard(title)
+            return None
+        return insight
+
+    async def _create_titled_insight(
+        self,
+        title: str,
+        *,
+        description: str | None,
+        emoji: str | None,
+        value: float,
+    ) -> AsyncInsight:
+        # created by a task that finished after this caller listed the insights
+        insight = await self._insight_from_cache(title)
+        if insight is not None:
+            return insight
+        return await self.insight(title=title, description=description, value=value, emoji=emoji)  # type: ignore
+
     async def edit_insight(
         self,
         *,
@@ -136,36 +533,47 @@ class AsyncClient(BaseClient["AsyncFeed", "AsyncEvent", "AsyncInsight", "AsyncRe
         description: str | None | Undefined = UNDEFINED,
         emoji: str | None | Undefined = UNDEFINED,
     ):
-        insight_data = await self.rest.edit_insight(
-            project=self.project,
-            insight_id=id,
-            title=title,
-            description=description,
-            emoji=emoji,
-        )
+        with self._invalidating(id):
+            insight_data = await self.rest.edit_insight(
+                project=self.project,
+                insight_id=id,
+                title=title,
+                description=description,
+                emoji=emoji,
+            )
         return self._construct_insight(insight_data)
 
     async def increment_insight(self, *, id: str, value: float):
-        insight_data = await self.rest.edit_insight(
-            project=self.project,
-            insight_id=id,
-            value={"increment": value},
-        )
+        if self.shared_increments is not None and id in self.shared_increments:
+            self.shared_increments.add(id, value)
+            return self._recall(id)
+        if self.increment_buffer is not None:
+            self.increment_buffer.add(id, value)
+            return self._recall(id)
+
+        with self._invalidating(id):
+            insight_data = await self.rest.edit_insight(
+                project=self.project,
+                insight_id=id,
+                value={"increment": value},
+            )
         return self._construct_insight(insight_data)
 
     async def set_insight(self, *, id: str, value: int):
-        insight_data = await self.rest.edit_insight(
-            project=self.project,
-            insight_id=id,
-            value={"set": value},
-        )
+        with self._invalidating(id):
+            insight_data = await self.rest.edit_insight(
+                project=self.project,
+                insight_id=id,
+                value={"set": value},
+            )
         return self._construct_insight(insight_data)
 
     async def fetch_insight(self, *, id: str):
-        insight_data = await self.rest.fetch_insight(
-            project=self.project,
-            insight_id=id,
-        )
+        with self._invalidating(id):
+            insight_data = await self.rest.fetch_insight(
+                project=self.project,
+                insight_id=id,
+            )
         return self._construct_insight(insight_data)
 
     async def fetch_insights(self):
@@ -174,11 +582,130 @@ class AsyncClient(BaseClient["AsyncFeed", "AsyncEvent", "AsyncInsight", "AsyncRe
         )
         return self._construct_insights(insights_data)
 
+    async def stream_insights(self):
+        async for insight_data in self.rest.stream_insights(project=self.project):
+            yield self._construct_insight(insight_data)
+
     async def delete_insight(self, *, id: str):
         await self.rest.delete_insight(
             project=self.project,
             insight_id=id,
         )
+        self._forget_insight(id)
+
+    # --- BULK --- #
+
+    async def events_many(
+        self,
+        *,
+        feed: str,
+        events: t.Iterable[STR_DICT],
+        concurrency: int | None = None,
+        progress: ProgressCallback | None = None,
+    ) -> list[AsyncEvent | Exception]:
+        """
+        Create many events with bounded concurrency.
+
+        Give each event an `idempotency_key` to replay a partially failed batch without creating
+        the delivered events twice.
+
+        Args:
+            feed (str): The name of the feed.
+            events (Iterable[dict[str, Any]]): The keyword arguments of each event, as accepted by `event`.
+            concurrency (int, optional): The maximum number of requests in flight for this call.
+                Defaults to `max_concurrency`, which also caps it, as it bounds every bulk call together.
+            progress (Callable[[int, int], None], optional): Called with (completed, total) as requests finish.
+        Returns:
+            The created events in input order, with the raised exception in place of each failed event.
+        """
+        calls = [functools.partial(self.event, feed=feed, **event) for event in events]
+        return await self._gather_bounded(calls, concurrency=concurrency, progress=progress)
+
+    async def edit_events_many(
+        self,
+        *,
+        feed: str,
+        edits: t.Iterable[STR_DICT],
+        concurrency: int | None = None,
+        progress: ProgressCallback | None = None,
+    ) -> list[AsyncEvent | Exception]:
+        """
+        Edit many events with bounded concurrency.
+
+        Args:
+            feed (str): The name of the feed.
+            edits (Iterable[dict[str, Any]]): The keyword arguments of each edit, as accepted by `edit_event`.
+                Each edit must contain the `id` of the event.
+            concurrency (int, optional): The maximum number of requests in flight for this call.
+                Defaults to `max_concurrency`, which also caps it, as it bounds every bulk call together.
+            progress (Callable[[int, int], None], optional): Called with (completed, total) as requests finish.
+        Returns:
+            The edited events in input order, with the raised exception in place of each failed edit.
+        """
+        calls = [functools.partial(self.edit_event, feed=feed, **edit) for edit in edits]
+        return await self._gather_bounded(calls, concurrency=concurrency, progress=progress)
+
+    async def delete_events_many(
+        self,
+        *,
+        feed: str,
+        ids: t.Iterable[str],
+        concurrency: int | None = None,
+        progress: ProgressCallback | None = None,
+    ) -> list[Exception | None]:
+        """
+        Delete many events with bounded concurrency.
+
+        Args:
+            feed (str): The name of the feed.
+            ids (Iterable[str]): The ids of the events.
+            concurrency (int, optional): The maximum number of requests in flight for this call.
+                Defaults to `max_concurrency`, which also caps it, as it bounds every bulk call together.
+            progress (Callable[[int, int], None], optional): Called with (completed, total) as requests finish.
+        Returns:
+            None for each deleted event in input order, with the raised exception in place of each failed delete.
+        """
+        calls = [functools.partial(self.delete_event, feed=feed, id=event_id) for event_id in ids]
+        return await self._gather_bounded(calls, concurrency=concurrency, progress=progress)
+
+    def _get_limiter(self) -> asyncio.Semaphore:
+        # one per running loop, as a semaphore binds to the loop it's first awaited on
+        loop = asyncio.get_running_loop()
+        limiter = self._limiters.get(loop)
+        if limiter is None:
+            limiter = self._limiters[loop] = asyncio.Semaphore(self.max_concurrency)
+        return limiter
+
+    async def _gather_bounded(
+        self,
+        calls: t.Sequence[t.Callable[[], t.Awaitable[T]]],
+        *,
+        concurrency: int | None,
+        progress: ProgressCallback | None,
+    ) -> list[T | Exception]:
+        limiter = self._get_limiter()
+        total = len(calls)
+        results: list[T | Exception] = [None] * total  # type: ignore
+        pending = iter(enumerate(calls))
+        completed = 0
+
+        async def worker() -> None:
+            nonlocal completed
+            # workers share one iterator, so at most `concurrency` tasks exist regardless of input size
+            for index, call in pending:
+                async with limiter:
+                    try:
+                        results[index] = await call()
+                    except Exception as exc:
+                        results[index] = exc
+                completed += 1
+                if progress is not None:
+                    progress(completed, total)
+
+        # more workers than the shared limit would only wait on it
+        workers = min(concurrency or self.max_concurrency, self.max_concurrency, total)
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        return results
 
     # --- MANAGER CONSTRUCTORS --- #
 
@@ -189,8 +716,9 @@ class AsyncClient(BaseClient["AsyncFeed", "AsyncEvent", "AsyncInsight", "AsyncRe
         title = event_data["title"]
         description = event_data["description"]
         emoji = event_data["emoji"]
-        return AsyncEvent(
-            self,
+        tags = event_data["tags"]
+        return self._identity(
+            AsyncEvent,
             feed=feed,
             id=id,
             project_id=project_id,
@@ -198,6 +726,7 @@ class AsyncClient(BaseClient["AsyncFeed", "AsyncEvent", "AsyncInsight", "AsyncRe
             title=title,
             description=description,
             emoji=emoji,
+            tags=tags,
         )
 
     def _construct_insight(
@@ -212,8 +741,8 @@ class AsyncClient(BaseClient["AsyncFeed", "AsyncEvent", "AsyncInsight", "AsyncRe
         updated_at = insight_data["updated_at"]
         created_at = insight_data["created_at"]
 
-        return AsyncInsight(
-            self,
+        return self._identity(
+            AsyncInsight,
             id=id,
             title=title,
             description=description,
@@ -225,7 +754,6 @@ class AsyncClient(BaseClient["AsyncFeed", "AsyncEvent", "AsyncInsight", "AsyncRe
 
 
 if __name__ == "__main__":
-    import os, asyncio
     from rich import print
 
     token = os.getenv("LAWG_DEV_API_TOKEN")
@@ -233,24 +761,15 @@ if __name__ == "__main__":
 
     async def main():
         feed = AsyncClient(token=token, project="lawg-py").feed(name="test-feed")
-        tasks_1: list[asyncio.Task[AsyncEvent]] = []
-
-        for i in range(10):
-            coro = feed.event(title=str(i + 1), description="async event :)")
-            task = asyncio.create_task(coro)
-            tasks_1.append(task)
-
-        events: list[AsyncEvent] = await asyncio.gather(*tasks_1)
-        tasks_2: list[asyncio.Task[None]] = []
 
+        events = await feed.events_many(
+            events=[{"title": str(i + 1), "description": "async event :)"} for i in range(10)],
+            progress=lambda done, total: print(f"created {done}/{total}"),
+        )
         print(events)
 
-        for event in events:
-            coro = event.delete()
-            task = asyncio.create_task(coro)
-            tasks_2.append(task)
-
-        await asyncio.gather(*tasks_2)
+        ids = [event.id for event in events if isinstance(event, AsyncEvent)]
+        await feed.delete_events_many(ids=ids)
         await feed.close()
 
     asyncio.run(main())
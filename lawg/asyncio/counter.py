@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import typing as t
+
+from lawg.base.counter import BaseShardedCounter
+from lawg.exceptions import LawgNotFoundError
+
+if t.TYPE_CHECKING:
+    from lawg.asyncio.client import AsyncClient
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncShardedCounter(BaseShardedCounter["AsyncClient"]):
+    """
+    A sharded insight counter, flushed explicitly or every `interval` seconds by a background task.
+
+    Increments may come from the event loop and from threads it hands work to alike.
+    """
+
+    __slots__ = ("_flushing", "_wake", "_task", "_closed")
+
+    def __init__(self, client: AsyncClient, id: str, *, interval: float | None = None) -> None:
+        super().__init__(client, id, interval=interval)
+        # created by the loop that flushes
+        self._flushing: asyncio.Lock | None = None
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    def add(self, value: float = 1.0) -> None:
+        super().add(value)
+        if self.interval is not None and self._task is None and not self._closed:
+            with contextlib.suppress(RuntimeError):
+                # only started from the loop, threads just add
+                asyncio.get_running_loop()
+                self._wake = asyncio.Event()
+                self._task = asyncio.ensure_future(self._run(self._wake))
+
+    async def flush(self) -> None:
+        if self._flushing is None:
+            self._flushing = asyncio.Lock()
+        async with self._flushing:
+            delta = self._collect() - self._flushed
+            if not delta:
+                return
+            try:
+                # through the increment buffer, if the client has one
+                await self.client.increment_insight(id=self.id, value=delta)
+            except LawgNotFoundError:
+                # the insight is gone, retrying would never succeed
+                logger.warning("dropping increments of deleted insight %s", self.id)
+            self._flushed += delta
+
+    async def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._wake is not None:
+            self._wake.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        await self.flush()
+
+    async def _run(self, wake: asyncio.Event) -> None:
+        while not self._closed:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(wake.wait(), self.interval)
+            if self._closed:
+                return
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("failed to flush insight counter %s, retrying next interval", self.id)
@@ -18,6 +18,7 @@ class AsyncEvent(BaseEvent["AsyncClient"]):
         title: str | Undefined | None = UNDEFINED,
         description: str | Undefined | None = UNDEFINED,
         emoji: str | Undefined | None = UNDEFINED,
+        tags: dict[str, str | int | float | bool] | Undefined | None = UNDEFINED,
     ) -> None:
         event_data = await self.client.rest.edit_event(
             project=self.client.project,
@@ -26,11 +27,14 @@ class AsyncEvent(BaseEvent["AsyncClient"]):
             title=title,
             description=description,
             emoji=emoji,
+            tags=tags,
         )
 
         self.title = event_data["title"]
         self.description = event_data["description"]
         self.emoji = event_data["emoji"]
+        self.tags = event_data["tags"]
+        self.client._mirror_store(self)
 
     async def delete(self) -> None:
         if self.is_deleted:
@@ -38,3 +42,5 @@ class AsyncEvent(BaseEvent["AsyncClient"]):
 
         await self.client.rest.delete_event(project=self.client.project, feed=self.feed, event_id=self.id)
         self.is_deleted = True
+        self.client._forget(self.id)
+        self.client._mirror_delete(self.id)
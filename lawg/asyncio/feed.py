@@ -4,8 +4,11 @@ from lawg.base.feed import BaseFeed
 from lawg.typings import UNDEFINED, Undefined
 
 if t.TYPE_CHECKING:
+    from lawg import pika
+    from lawg.mirror import EventMirror
     from lawg.asyncio.client import AsyncClient
     from lawg.asyncio.event import AsyncEvent
+    from lawg.typings import PATH, STR_DICT, ProgressCallback
 
 
 class AsyncFeed(BaseFeed["AsyncClient", "AsyncEvent"]):
@@ -24,11 +27,12 @@ class AsyncFeed(BaseFeed["AsyncClient", "AsyncEvent"]):
 
     # --- EVENTS --- #
 
-    async def event(self, *, title: str, description: str):
+    async def event(self, *, title: str, description: str, idempotency_key: str | None = None):
         return await self.client.event(
             feed=self.name,
             title=title,
             description=description,
+            idempotency_key=idempotency_key,
         )
 
     async def edit_event(
@@ -38,6 +42,7 @@ class AsyncFeed(BaseFeed["AsyncClient", "AsyncEvent"]):
         title: str | Undefined | None = UNDEFINED,
         description: str | Undefined | None = UNDEFINED,
         emoji: str | Undefined | None = UNDEFINED,
+        tags: "dict[str, str | int | float | bool] | Undefined | None" = UNDEFINED,
     ):
         return await self.client.edit_event(
             feed=self.name,
@@ -45,6 +50,7 @@ class AsyncFeed(BaseFeed["AsyncClient", "AsyncEvent"]):
             title=title,
             description=description,
             emoji=emoji,
+            tags=tags,
         )
 
     async def fetch_event(self, *, id: str):
@@ -53,5 +59,80 @@ class AsyncFeed(BaseFeed["AsyncClient", "AsyncEvent"]):
     async def fetch_events(self):
         return await self.client.fetch_events(feed=self.name)
 
+    def stream_events(self, *, limit: int | None = None, offset: int | None = None):
+        return self.client.stream_events(feed=self.name, limit=limit, offset=offset)
+
+    async def fetch_event_batch(self, *, limit: int | None = None, offset: int | None = None):
+        return await self.client.fetch_event_batch(feed=self.name, limit=limit, offset=offset)
+
+    async def export(
+        self,
+        path: "PATH",
+        *,
+        format: str = "ndjson",
+        compression: str | None = None,
+        page_size: int = 100,
+        resume: bool = True,
+    ):
+        return await self.client.export_events(
+            feed=self.name,
+            path=path,
+            format=format,
+            compression=compression,
+            page_size=page_size,
+            resume=resume,
+        )
+
+    def iter_events(
+        self,
+        *,
+        since: "pika.Bound | None" = None,
+        until: "pika.Bound | None" = None,
+        page_size: int = 100,
+    ):
+        return self.client.iter_events(feed=self.name, since=since, until=until, page_size=page_size)
+
+    async def sync_mirror(self, mirror: "EventMirror", *, page_size: int = 100):
+        return await self.client.sync_mirror(mirror, feed=self.name, page_size=page_size)
+
+    def subscribe(self, *, mirror: "EventMirror | None" = None, since: str | None = None, url: str | None = None):
+        return self.client.subscribe(feed=self.name, mirror=mirror, since=since, url=url)
+
+    async def tail(self, *, min_interval: float = 1.0, max_interval: float = 60.0, page_size: int = 100):
+        return await self.client.tail(
+            feed=self.name, min_interval=min_interval, max_interval=max_interval, page_size=page_size
+        )
+
     async def delete_event(self, *, id: str):
         return await self.client.delete_event(feed=self.name, id=id)
+
+    # --- BULK --- #
+
+    async def events_many(
+        self,
+        *,
+        events: "t.Iterable[STR_DICT]",
+        concurrency: int | None = None,
+        progress: "ProgressCallback | None" = None,
+    ):
+        return await self.client.events_many(feed=self.name, events=events, concurrency=concurrency, progress=progress)
+
+    async def edit_events_many(
+        self,
+        *,
+        edits: "t.Iterable[STR_DICT]",
+        concurrency: int | None = None,
+        progress: "ProgressCallback | None" = None,
+    ):
+        return await self.client.edit_events_many(
+            feed=self.name, edits=edits, concurrency=concurrency, progress=progress
+        )
+
+    async def delete_events_many(
+        self,
+        *,
+        ids: t.Iterable[str],
+        concurrency: int | None = None,
+        progress: "ProgressCallback | None" = None,
+    ):
+        return await self.client.delete_events_many(feed=self.name, ids=ids, concurrency=concurrency, progress=progress)
@@ -22,6 +22,20 @@ class AsyncInsight(BaseInsight["AsyncClient"]):
         self.value = return_value
 
     async def increment(self, value: float) -> None:
+        shared = self.client.shared_increments
+        if shared is not None and self.id in shared:
+            shared.add(self.id, value)
+            # optimistic, like a buffered increment
+            if self.value is not None:
+                self.value += value
+            return
+        if self.client.increment_buffer is not None:
+            self.client.increment_buffer.add(self.id, value)
+            # optimistic, the next flush replaces it with the api's value when the identity map is enabled
+            if self.value is not None:
+                self.value += value
+            return
+
         insight_data = await self.client.rest.edit_insight(
             project=self.client.project,
             insight_id=self.id,
@@ -36,3 +50,4 @@ class AsyncInsight(BaseInsight["AsyncClient"]):
 
         await self.client.rest.delete_insight(project=self.client.project, insight_id=self.id)
         self.is_deleted = True
+        self.client._forget(self.id)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import typing as t
+
+from lawg.base.metrics import BaseMetrics
+from lawg.exceptions import LawgNotFoundError
+
+if t.TYPE_CHECKING:
+    from lawg.metrics import Sample
+    from lawg.asyncio.client import AsyncClient
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncMetrics(BaseMetrics["AsyncClient"]):
+    """
+    An async metrics registry, published by a background task.
+    """
+
+    def __init__(self, client: AsyncClient, *, interval: float = 10.0) -> None:
+        super().__init__(client, interval=interval)
+        self._stop = asyncio.Event()
+        # created by the loop that flushes
+        self._flushing: asyncio.Lock | None = None
+        self._task = asyncio.ensure_future(self._run())
+
+    async def flush(self) -> None:
+        if self._flushing is None:
+            self._flushing = asyncio.Lock()
+        async with self._flushing:
+            for metric in list(self._metrics.values()):
+                samples = metric.collect()
+                for index, sample in enumerate(samples):
+                    try:
+                        await self._send(sample)
+                    except BaseException:
+                        # the next flush publishes them
+                        metric.restore(samples[index:])
+                        raise
+
+    async def close(self) -> None:
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        await self._task
+        await self.flush()
+
+    async def _send(self, sample: Sample) -> None:
+        try:
+            await self._publish(sample)
+        except LawgNotFoundError:
+            # the insight was deleted, create it again
+            self.client.insight_titles.discard(sample.title)
+            await self._publish(sample)
+
+    async def _publish(self, sample: Sample) -> None:
+        value = {"increment": sample.value} if sample.increment else {"set": sample.value}
+        await self.client.rest.edit_insight(
+            project=self.client.project,
+            insight_id=await self._resolve(sample.title),
+            value=value,
+        )
+
+    async def _resolve(self, title: str) -> str:
+        insight_id = self.client.insight_titles.get(title)
+        if insight_id is None:
+            insight = await self.client.insight_by_title(title)
+            insight_id = insight.id  # type: ignore
+        return insight_id
+
+    async def _run(self) -> None:
+        while not self._stop.is_set():
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._stop.wait(), self.interval)
+            if self._stop.is_set():
+                return
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("failed to publish metrics")
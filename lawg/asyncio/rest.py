@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import typing as t
 
 import httpx
@@ -18,7 +20,7 @@ from lawg.schemas import (
     InsightGetSlugSchema,
     InsightPatchBodySchema,
     InsightPatchSlugSchema,
-    InsightValueSchema,
+    InsightDeleteSlugSchema,
     EventCreateBodySchema,
     EventCreateSlugSchema,
     EventDeleteSlugSchema,
@@ -36,21 +38,32 @@ from lawg.schemas import (
     EventSchema,
     InsightSchema,
     ProjectCreateBodySchema,
+    prebuilt,
 )
 
 if t.TYPE_CHECKING:
     import datetime
     from marshmallow import Schema
     from lawg.asyncio.client import AsyncClient
+    from lawg.cache import CacheEntry, ResponseCache
+    from lawg.decoders import RecordDecoder
 
 
 class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
     """Async rest client for lawg."""
 
-    def __init__(self, client: AsyncClient) -> None:
-        super().__init__(client)
+    def __init__(
+        self,
+        client: AsyncClient,
+        cache: ResponseCache | None = None,
+        max_retries: int = 0,
+        retry_backoff: float = 0.5,
+        record_decoder: RecordDecoder | None = None,
+    ) -> None:
+        super().__init__(client, cache, max_retries, retry_backoff, record_decoder)
         self.http_client = httpx.AsyncClient()
         self.http_client.headers.update(self.headers)
+        self._flights: dict[str, asyncio.Task[STR_DICT]] = {}
 
     async def request(
         self,
@@ -60,12 +73,91 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         body_with_schema: DataWithSchema | None = None,
         slugs_with_schema: DataWithSchema | None = None,
         response_schema: Schema | None = None,
+        headers: dict[str, str] | None = None,
     ) -> STR_DICT:
+        endpoint = url
+        url, body_dict = self.prepare_request(url, body_with_schema, slugs_with_schema)
+
+        key, entry, cached = self.cache_lookup(method, url, body_dict)
+        if cached is not None:
+            return cached
+
+        flight_key = self.flight_key(method, url, body_dict, headers)
+        if flight_key is None:
+            return await self.send(
+                method, url, body_dict, response_schema, endpoint=endpoint, key=key, entry=entry, headers=headers
+            )
+
+        # single-flight: identical concurrent callers await one shared task, shielded so that
+        # cancelling any one caller doesn't cancel the request for the others
+        flight = self._flights.get(flight_key)
+        if flight is None:
+            coro = self.send(
+                method, url, body_dict, response_schema, endpoint=endpoint, key=key, entry=entry, headers=headers
+            )
+            flight = self._flights[flight_key] = asyncio.ensure_future(coro)
+            flight.add_done_callback(functools.partial(self._land, flight_key))
+
+        return await asyncio.shield(flight)
+
+    async def stream(
+        self,
+        *,
+        url: str,
+        method: str,
+        item_schema: Schema,
+        body_with_schema: DataWithSchema | None = None,
+        slugs_with_schema: DataWithSchema | None = None,
+    ) -> t.AsyncIterator[STR_DICT]:
         url, body_dict = self.prepare_request(url, body_with_schema, slugs_with_schema)
 
-        resp = await self.http_client.request(method=method, url=url, json=body_dict)
+        async with self.http_client.stream(method=method, url=url, json=body_dict) as resp:
+            if resp.is_error:
+                await resp.aread()
+            decoder = self.prepare_stream(resp)
+            async for chunk in resp.aiter_text():
+                for item in self.load_stream_chunk(decoder, chunk, item_schema):
+                    yield item
+            decoder.close()
 
-        return self.prepare_response(resp, response_schema=response_schema)
+    async def send(
+        self,
+        method: str,
+        url: str,
+        body: STR_DICT | None,
+        response_schema: Schema | None,
+        *,
+        endpoint: str,
+        key: str | None,
+        entry: CacheEntry | None,
+        headers: dict[str, str] | None = None,
+    ) -> STR_DICT:
+        can_retry = self.can_retry(method, headers)
+        headers = self.cache_headers(entry, headers)
+        attempt = 0
+
+        while True:
+            attempt += 1
+            retry = can_retry and attempt <= self.max_retries
+            resp = None
+            try:
+                resp = await self.http_client.request(method=method, url=url, json=body, headers=headers)
+            except httpx.TransportError:
+                if not retry:
+                    raise
+            else:
+                if not retry or resp.status_code not in self.RETRY_STATUSES:
+                    break
+            await asyncio.sleep(self.retry_delay(attempt, resp))
+
+        return self.prepare_cached_response(resp, response_schema, endpoint=endpoint, key=key, entry=entry)
+
+    def _land(self, flight_key: str, flight: asyncio.Task[STR_DICT]) -> None:
+        if self._flights.get(flight_key) is flight:
+            del self._flights[flight_key]
+        # every caller may have been cancelled, retrieve the exception so asyncio doesn't warn about it
+        if not flight.cancelled():
+            flight.exception()
 
     # --- ASYNCIO --- #
 
@@ -81,8 +173,8 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         project_data = await self.request(
             url=self.API_CREATE_PROJECT,
             method="POST",
-            body_with_schema=DataWithSchema(body, ProjectCreateBodySchema()),
-            response_schema=ProjectSchema(),
+            body_with_schema=DataWithSchema(body, prebuilt(ProjectCreateBodySchema)),
+            response_schema=prebuilt(ProjectSchema),
         )
         return project_data
 
@@ -93,8 +185,8 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         project_data = await self.request(
             url=self.API_GET_PROJECT,
             method="GET",
-            slugs_with_schema=DataWithSchema(slugs, ProjectGetSlugSchema()),
-            response_schema=ProjectSchema(),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(ProjectGetSlugSchema)),
+            response_schema=prebuilt(ProjectSchema),
         )
         return project_data
 
@@ -108,9 +200,9 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         project_data = await self.request(
             url=self.API_EDIT_PROJECT,
             method="PATCH",
-            slugs_with_schema=DataWithSchema(slugs, ProjectPatchSlugSchema()),
-            body_with_schema=DataWithSchema(body, ProjectPatchBodySchema()),
-            response_schema=ProjectSchema(),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(ProjectPatchSlugSchema)),
+            body_with_schema=DataWithSchema(body, prebuilt(ProjectPatchBodySchema)),
+            response_schema=prebuilt(ProjectSchema),
         )
         return project_data
 
@@ -121,7 +213,7 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         await self.request(
             url=self.API_DELETE_PROJECT,
             method="DELETE",
-            slugs_with_schema=DataWithSchema(slugs, ProjectDeleteSlugSchema()),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(ProjectDeleteSlugSchema)),
         )
 
     # --- FEEDS --- #
@@ -144,9 +236,9 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         feed_data = await self.request(
             url=self.API_CREATE_FEED,
             method="POST",
-            body_with_schema=DataWithSchema(data, FeedCreateBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, FeedCreateSlugSchema()),
-            response_schema=FeedSchema(),
+            body_with_schema=DataWithSchema(data, prebuilt(FeedCreateBodySchema)),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(FeedCreateSlugSchema)),
+            response_schema=prebuilt(FeedSchema),
         )
         return feed_data
 
@@ -170,9 +262,9 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         feed_data = await self.request(
             url=self.API_EDIT_FEED,
             method="PATCH",
-            body_with_schema=DataWithSchema(data, FeedPatchBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, FeedPatchSlugSchema()),
-            response_schema=FeedSchema(),
+            body_with_schema=DataWithSchema(data, prebuilt(FeedPatchBodySchema)),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(FeedPatchSlugSchema)),
+            response_schema=prebuilt(FeedSchema),
         )
         return feed_data
 
@@ -184,7 +276,7 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         await self.request(
             url=self.API_DELETE_FEED,
             method="DELETE",
-            slugs_with_schema=DataWithSchema(slugs, FeedDeleteSlugSchema()),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(FeedDeleteSlugSchema)),
         )
 
     # --- EVENTS --- #
@@ -200,7 +292,15 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         timestamp: datetime.datetime | None = None,
         notify: bool | None = None,
         metadata: dict[str, str | int | float | bool] | None = None,
+        idempotency_key: str | None = None,
     ):
+        if idempotency_key is None:
+            idempotency_key = self.new_idempotency_key()
+        else:
+            acknowledged = self.acknowledged.get(idempotency_key)
+            if acknowledged is not None:
+                return acknowledged
+
         slugs = {
             "namespace": project,
             "feed": feed,
@@ -217,10 +317,12 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         event_data = await self.request(
             url=self.API_CREATE_EVENT,
             method="POST",
-            body_with_schema=DataWithSchema(data, EventCreateBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, EventCreateSlugSchema()),
-            response_schema=EventSchema(),
+            body_with_schema=DataWithSchema(data, prebuilt(EventCreateBodySchema)),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(EventCreateSlugSchema)),
+            response_schema=prebuilt(EventSchema),
+            headers={self.IDEMPOTENCY_HEADER: idempotency_key},
         )
+        self.acknowledged.add(idempotency_key, event_data)
         return event_data
 
     async def fetch_event(self, project: str, feed: str, event_id: str):
@@ -232,8 +334,8 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         event_data = await self.request(
             url=self.API_GET_EVENT,
             method="GET",
-            slugs_with_schema=DataWithSchema(slugs, EventGetSlugSchema()),
-            response_schema=EventSchema(),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(EventGetSlugSchema)),
+            response_schema=prebuilt(EventSchema),
         )
         return event_data
 
@@ -252,15 +354,41 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
             "limit": limit,
             "offset": offset,
         }
+        data = {key: value for key, value in data.items() if value is not None}
         events_data: list[STR_DICT] = await self.request(
             url=self.API_GET_EVENTS,
             method="GET",
-            body_with_schema=DataWithSchema(data, EventGetMultipleBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, EventGetMultipleSlugSchema()),
-            response_schema=EventSchema(many=True),
+            body_with_schema=DataWithSchema(data, prebuilt(EventGetMultipleBodySchema)) if data else None,
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(EventGetMultipleSlugSchema)),
+            response_schema=prebuilt(EventSchema, many=True),
         )  # type: ignore
         return events_data
 
+    async def stream_events(
+        self,
+        project: str,
+        feed: str,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> t.AsyncIterator[STR_DICT]:
+        slugs = {
+            "namespace": project,
+            "feed": feed,
+        }
+        data = {
+            "limit": limit,
+            "offset": offset,
+        }
+        data = {key: value for key, value in data.items() if value is not None}
+        async for event_data in self.stream(
+            url=self.API_GET_EVENTS,
+            method="GET",
+            item_schema=prebuilt(EventSchema),
+            body_with_schema=DataWithSchema(data, prebuilt(EventGetMultipleBodySchema)) if data else None,
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(EventGetMultipleSlugSchema)),
+        ):
+            yield event_data
+
     async def edit_event(
         self,
         project: str,
@@ -287,9 +415,9 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         event_data = await self.request(
             url=self.API_EDIT_EVENT,
             method="PATCH",
-            body_with_schema=DataWithSchema(data, EventPatchBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, EventPatchSlugSchema()),
-            response_schema=EventSchema(),
+            body_with_schema=DataWithSchema(data, prebuilt(EventPatchBodySchema)),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(EventPatchSlugSchema)),
+            response_schema=prebuilt(EventSchema),
         )
         return event_data
 
@@ -302,7 +430,7 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         await self.request(
             url=self.API_DELETE_EVENT,
             method="DELETE",
-            slugs_with_schema=DataWithSchema(slugs, EventDeleteSlugSchema()),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(EventDeleteSlugSchema)),
         )
 
     # --- INSIGHTS --- #
@@ -327,9 +455,9 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         insight_data = await self.request(
             url=self.API_CREATE_INSIGHT,
             method="POST",
-            body_with_schema=DataWithSchema(data, InsightCreateBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, InsightCreateSlugSchema()),
-            response_schema=InsightSchema(),
+            body_with_schema=DataWithSchema(data, prebuilt(InsightCreateBodySchema)),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(InsightCreateSlugSchema)),
+            response_schema=prebuilt(InsightSchema),
         )
         return insight_data
 
@@ -343,10 +471,10 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
             "insight_id": insight_id,
         }
         insight_data = await self.request(
-            url=self.API_GET_INSIGHTS,
+            url=self.API_GET_INSIGHT,
             method="GET",
-            slugs_with_schema=DataWithSchema(slugs, InsightGetSlugSchema()),
-            response_schema=InsightSchema(),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(InsightGetSlugSchema)),
+            response_schema=prebuilt(InsightSchema),
         )
         return insight_data
 
@@ -360,11 +488,26 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         insights_data: list[STR_DICT] = await self.request(
             url=self.API_GET_INSIGHTS,
             method="GET",
-            slugs_with_schema=DataWithSchema(slugs, InsightGetMultipleBodySchema()),
-            response_schema=InsightSchema(many=True),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(InsightGetMultipleBodySchema)),
+            response_schema=prebuilt(InsightSchema, many=True),
         )  # type: ignore
         return insights_data
 
+    async def stream_insights(
+        self,
+        project: str,
+    ) -> t.AsyncIterator[STR_DICT]:
+        slugs = {
+            "namespace": project,
+        }
+        async for insight_data in self.stream(
+            url=self.API_GET_INSIGHTS,
+            method="GET",
+            item_schema=prebuilt(InsightSchema),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(InsightGetMultipleBodySchema)),
+        ):
+            yield insight_data
+
     async def edit_insight(
         self,
         project: str,
@@ -387,9 +530,9 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         insight_data = await self.request(
             url=self.API_EDIT_INSIGHT,
             method="PATCH",
-            body_with_schema=DataWithSchema(data, InsightPatchBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, InsightPatchSlugSchema()),
-            response_schema=InsightSchema(),
+            body_with_schema=DataWithSchema(data, prebuilt(InsightPatchBodySchema)),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(InsightPatchSlugSchema)),
+            response_schema=prebuilt(InsightSchema),
         )
         return insight_data
 
@@ -405,5 +548,5 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         await self.request(
             url=self.API_DELETE_INSIGHT,
             method="DELETE",
-            slugs_with_schema=DataWithSchema(slugs, InsightValueSchema()),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(InsightDeleteSlugSchema)),
         )
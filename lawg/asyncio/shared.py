@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import typing as t
+
+from lawg.base.shared import BaseSharedIncrements
+from lawg.exceptions import LawgNotFoundError
+
+if t.TYPE_CHECKING:
+    from lawg.asyncio.client import AsyncClient
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSharedIncrements(BaseSharedIncrements["AsyncClient"]):
+    """
+    Shared increments, flushed every `interval` seconds by a background task of the flusher.
+
+    The task starts with the first increment added from the event loop, and until then the
+    process doesn't try to become the flusher.
+    """
+
+    __slots__ = ("_flushing", "_wake", "_task")
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        ids: t.Iterable[str],
+        *,
+        name: str | None = None,
+        interval: float = 1.0,
+        processes: int = 64,
+    ) -> None:
+        super().__init__(client, ids, name=name, interval=interval, processes=processes)
+        # created by the loop that flushes
+        self._flushing: asyncio.Lock | None = None
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def add(self, id: str, value: float) -> None:
+        super().add(id, value)
+        if self._task is None and not self._closed:
+            with contextlib.suppress(RuntimeError):
+                # only started from the loop, threads just add
+                asyncio.get_running_loop()
+                self._wake = asyncio.Event()
+                self._task = asyncio.ensure_future(self._run(self._wake))
+
+    async def flush(self) -> None:
+        if self._flushing is None:
+            self._flushing = asyncio.Lock()
+        async with self._flushing:
+            if not self._elect():
+                return
+            for column, insight_id, total, delta in self._deltas():
+                try:
+                    insight_data = await self.client.rest.edit_insight(
+                        project=self.client.project,
+                        insight_id=insight_id,
+                        value={"increment": delta},
+                    )
+                except LawgNotFoundError:
+                    # the insight is gone, retrying would never succeed
+                    logger.warning("dropping increments of deleted insight %s", insight_id)
+                else:
+                    if self.client.identity_map is not None:
+                        self.client._construct_insight(insight_data)
+                # only once sent, so a failed request is sent again by the next flush, and as the
+                # total rather than adding the delta, which could leave a rounding error pending
+                self._sent[column] = total
+
+    async def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._wake is not None:
+            self._wake.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        try:
+            await self.flush()
+            while not self._leave():
+                await self.flush()
+        except BaseException:
+            self._leave(flush=False)
+            raise
+
+    def _forked(self) -> None:
+        self._flushing = None
+        self._wake = None
+        self._task = None
+
+    async def _run(self, wake: asyncio.Event) -> None:
+        while not self._closed:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(wake.wait(), self.interval)
+            if self._closed:
+                return
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("failed to flush shared insight increments, retrying next interval")
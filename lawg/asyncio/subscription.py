@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import typing as t
+
+from lawg.base.subscription import BaseSubscription, FeedChange
+
+try:
+    import websockets.asyncio.client
+    import websockets.exceptions
+except ImportError:  # pragma: no cover - optional dependency
+    websockets = None  # type: ignore[assignment]
+
+if t.TYPE_CHECKING:
+    from lawg.asyncio.client import AsyncClient
+    from lawg.asyncio.event import AsyncEvent  # noqa: F401
+    from lawg.mirror import EventMirror
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSubscription(BaseSubscription["AsyncClient", "AsyncEvent"]):
+    """
+    A feed subscription iterated in an event loop.
+
+    Example:
+        >>> async with client.subscribe(feed="signups") as subscription:
+        ...     async for change in subscription:
+        ...         print(change.type, change.event.title)
+    """
+
+    __slots__ = ("_connection", "_wake")
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        feed: str,
+        *,
+        mirror: EventMirror | None = None,
+        since: str | None = None,
+        url: str | None = None,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+    ) -> None:
+        super().__init__(
+            client,
+            feed,
+            mirror=mirror,
+            since=since,
+            url=url,
+            reconnect_delay=reconnect_delay,
+            max_reconnect_delay=max_reconnect_delay,
+        )
+        self._connection: t.Any = None
+        # created by the iterating loop
+        self._wake: asyncio.Event | None = None
+
+    async def __aenter__(self) -> AsyncSubscription:
+        return self
+
+    async def __aexit__(self, _exc_type, _exc_value, _traceback) -> None:
+        await self.close()
+
+    def __aiter__(self) -> t.AsyncIterator[FeedChange]:
+        return self._changes()
+
+    async def _sleep(self, delay: float) -> None:
+        if self._wake is None:
+            self._wake = asyncio.Event()
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._wake.wait(), delay)
+
+    async def _changes(self) -> t.AsyncIterator[FeedChange]:
+        attempt = 0
+        while not self._closed:
+            try:
+                connection = await websockets.asyncio.client.connect(self.url, **self._connect_options())  # type: ignore
+            except (OSError, asyncio.TimeoutError, websockets.exceptions.WebSocketException) as exc:  # type: ignore
+                self._check_rejection(exc)
+                logger.warning("failed to connect the %r subscription: %s", self.feed, exc)
+                await self._sleep(self._reconnect_delay(attempt))
+                attempt += 1
+                continue
+
+            if self._closed:
+                await connection.close()
+                return
+            self._connection = connection
+            try:
+                attempt = 0
+                # frames pushed meanwhile are buffered by the connection
+                if self.last_id is not None:
+                    events = [event async for event in self.client.iter_events(feed=self.feed, since=self.last_id)]
+                    for missed in self._caught_up(events):
+                        yield missed
+                async for message in connection:
+                    change = self._change(message)
+                    if change is not None:
+                        yield change
+            except (OSError, websockets.exceptions.ConnectionClosed) as exc:  # type: ignore
+                logger.warning("the %r subscription was disconnected: %s", self.feed, exc)
+            finally:
+                self._connection = None
+                await connection.close()
+
+            if not self._closed:
+                await self._sleep(self._reconnect_delay(attempt))
+                attempt += 1
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._wake is not None:
+            self._wake.set()
+        connection = self._connection
+        if connection is not None:
+            await connection.close()
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextlib
+import typing as t
+
+import httpx
+
+from lawg.base.tail import BaseFeedPoller, BaseTail
+from lawg.exceptions import LawgError
+
+if t.TYPE_CHECKING:
+    from lawg.asyncio.client import AsyncClient
+    from lawg.asyncio.event import AsyncEvent
+
+
+class AsyncTail(BaseTail["AsyncEvent"]):
+    """
+    A tail of a feed, iterated in an event loop.
+
+    Example:
+        >>> async with await client.tail(feed="signups") as tail:
+        ...     async for event in tail:
+        ...         print(event.title)
+    """
+
+    __slots__ = ("_poller", "_queue", "_pending")
+
+    def __init__(self, poller: AsyncFeedPoller) -> None:
+        super().__init__(poller.feed)
+        self._poller = poller
+        self._queue: asyncio.Queue[list[AsyncEvent] | None] = asyncio.Queue()
+        self._pending: collections.deque[AsyncEvent] = collections.deque()
+
+    async def __aenter__(self) -> AsyncTail:
+        return self
+
+    async def __aexit__(self, _exc_type, _exc_value, _traceback) -> None:
+        await self.close()
+
+    def __aiter__(self) -> AsyncTail:
+        return self
+
+    async def __anext__(self) -> AsyncEvent:
+        while not self._pending:
+            events = await self._queue.get()
+            if events is None:
+                self._queue.put_nowait(None)
+                raise StopAsyncIteration
+            self._pending.extend(events)
+        return self._pending.popleft()
+
+    def put(self, events: list[AsyncEvent]) -> None:
+        self._queue.put_nowait(events)
+
+    async def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._poller.detach(self)
+        self._queue.put_nowait(None)
+
+
+class AsyncFeedPoller(BaseFeedPoller["AsyncClient", "AsyncEvent"]):
+    """
+    A feed poller running as a background task while any tail is attached.
+    """
+
+    __slots__ = ("_tails", "_wake", "_task", "_starting")
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        feed: str,
+        *,
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        page_size: int = 100,
+    ) -> None:
+        super().__init__(client, feed, min_interval=min_interval, max_interval=max_interval, page_size=page_size)
+        self._tails: list[AsyncTail] = []
+        # created by the polling loop
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._starting: asyncio.Future[None] | None = None
+
+    @property
+    def tails(self) -> int:
+        return len(self._tails)
+
+    async def start(self) -> None:
+        """Find the newest event, which tails start after, once for tails attaching concurrently."""
+        if self._starting is None:
+            self._starting = asyncio.ensure_future(self._find_newest())
+        starting = self._starting
+        try:
+            await asyncio.shield(starting)
+        except Exception:
+            # let the next tail try again
+            if starting.done() and self._starting is starting:
+                self._starting = None
+            raise
+
+    async def _find_newest(self) -> None:
+        events = self.client.iter_events(feed=self.feed, page_size=1)
+        try:
+            newest = None
+            async for event in events:
+                newest = event
+                break
+        finally:
+            await events.aclose()
+        self._start(newest)
+
+    def attach(self) -> AsyncTail:
+        """Attach a tail, starting the polling task if it isn't running."""
+        tail = AsyncTail(self)
+        self._tails.append(tail)
+        if self._task is None:
+            self._wake = asyncio.Event()
+            self._task = asyncio.ensure_future(self._run(self._wake))
+        return tail
+
+    def detach(self, tail: AsyncTail) -> None:
+        if tail in self._tails:
+            self._tails.remove(tail)
+        if not self._tails and self._wake is not None:
+            self._wake.set()
+
+    async def poll(self) -> list[AsyncEvent]:
+        """Fetch the events created since the last poll, oldest first, and adapt the interval."""
+        events = self.client.iter_events(feed=self.feed, since=self.last_id, page_size=self.page_size)
+        return self._seen([event async for event in events])
+
+    async def close(self) -> None:
+        """Close every tail, which stops the poller."""
+        for tail in list(self._tails):
+            await tail.close()
+
+    async def _run(self, wake: asyncio.Event) -> None:
+        while True:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(wake.wait(), self.interval)
+            wake.clear()
+            if not self._tails:
+                # a tail attaching later starts a new poller
+                if self.client._pollers.get(self.feed) is self:
+                    del self.client._pollers[self.feed]
+                return
+            try:
+                events = await self.poll()
+            except (LawgError, httpx.HTTPError) as exc:
+                self._failed(exc)
+                continue
+            if events:
+                for tail in list(self._tails):
+                    tail.put(events)
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import typing as t
+
+from abc import ABC, abstractmethod
+
+from lawg.typings import C
+
+
+class BaseIncrementBuffer(ABC, t.Generic[C]):
+    """
+    A write-behind buffer that coalesces insight increments.
+
+    Increments are summed per insight locally and sent as a single `{"increment": total}` patch
+    per insight, every `interval` seconds or once `threshold` increments are pending.
+    """
+
+    __slots__ = ("client", "interval", "threshold")
+
+    def __init__(self, client: C, *, interval: float = 1.0, threshold: int = 1000) -> None:
+        super().__init__()
+        self.client: C = client
+        self.interval = interval
+        self.threshold = threshold
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} interval={self.interval!r} threshold={self.threshold!r} project={self.client.project!r}>"
+
+    @staticmethod
+    def _merge(totals: dict[str, float], pending: dict[str, float]) -> None:
+        for insight_id, value in pending.items():
+            totals[insight_id] = totals.get(insight_id, 0.0) + value
+
+    @abstractmethod
+    def add(self, id: str, value: float) -> None:
+        """
+        Buffer an increment.
+
+        Args:
+            id (str): The id of the insight.
+            value (float): The value to increment the insight by.
+
+        Raises:
+            LawgBufferClosedError: If the buffer was closed, as nothing would send the increment.
+        """
+
+    @abstractmethod
+    def flush(self) -> t.Awaitable[None] | None:
+        """
+        Send every pending increment.
+        """
+
+    @abstractmethod
+    def close(self) -> t.Awaitable[None] | None:
+        """
+        Stop flushing in the background and send every pending increment.
+        """
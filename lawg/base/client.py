@@ -1,27 +1,67 @@
 from __future__ import annotations
 
+import contextlib
+import threading
 import typing as t
+import weakref
 
 from abc import ABC, abstractmethod
 
-from lawg.typings import F, E, I, R, STR_DICT, UNDEFINED, Undefined
+from lawg.cache import InsightTitleCache
+from lawg.exceptions import LawgNotFoundError
+from lawg.typings import B, F, E, I, R, STR_DICT, UNDEFINED, Undefined
 
 if t.TYPE_CHECKING:
     import datetime
+    from lawg import pika
+    from lawg.batch import EventBatch
+    from lawg.mirror import EventMirror
+    from lawg.base.counter import BaseShardedCounter
+    from lawg.base.shared import BaseSharedIncrements
+    from lawg.base.subscription import BaseSubscription
+    from lawg.base.tail import BaseTail
+    from lawg.snapshot import ProjectSnapshot
+    from lawg.typings import PATH
 
+    T = t.TypeVar("T")
 
-class BaseClient(ABC, t.Generic[F, E, I, R]):
+
+class BaseClient(ABC, t.Generic[F, E, I, R, B]):
     """
     The base client for lawg.
     """
 
-    __slots__ = ("token", "project", "rest")
+    __slots__ = ("token", "project", "rest", "identity_map", "increment_buffer", "shared_increments", "insight_titles", "snapshot", "auto_create_feeds", "known_feeds", "mirror", "_metrics", "_identity_lock")
 
-    def __init__(self, token: str, project: str) -> None:
+    def __init__(
+        self,
+        token: str,
+        project: str,
+        identity_map: bool = False,
+        insight_cache_path: PATH | None = None,
+        auto_create_feeds: bool = False,
+        mirror: EventMirror | None = None,
+    ) -> None:
         super().__init__()
         self.token: str = token
         self.project: str = project
         self.rest: R
+        # events and insights by id, so each id maps to at most one live object
+        self.identity_map: weakref.WeakValueDictionary[str, t.Any] | None = (
+            weakref.WeakValueDictionary() if identity_map else None
+        )
+        self._identity_lock = threading.Lock()
+        self.increment_buffer: B | None = None
+        # increments of the listed insights, summed with the other processes of the deployment
+        self.shared_increments: BaseSharedIncrements[t.Any] | None = None
+        self._metrics: t.Any = None
+        self.insight_titles = InsightTitleCache(insight_cache_path)
+        self.snapshot: ProjectSnapshot | None = None
+        # feeds events can be sent to without creating them first, seeded on first use
+        self.auto_create_feeds = auto_create_feeds
+        self.known_feeds: set[str] | None = None
+        # a local copy of events, kept up to date with the client's edits and deletes
+        self.mirror = mirror
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} token={self.token!r} project={self.project!r}>"
@@ -39,6 +79,45 @@ class BaseClient(ABC, t.Generic[F, E, I, R]):
             The feed.
         """
 
+    # --- SNAPSHOT --- #
+
+    @abstractmethod
+    def warm(self, *, path: PATH | None = None, max_age: float | None = None) -> ProjectSnapshot:
+        """
+        Load a snapshot of the project, its feeds, members and insights.
+
+        The project and its insights are fetched in parallel. With a `path`, a snapshot younger
+        than `max_age` is read from disk instead and the fetched snapshot is written back.
+
+        Args:
+            path (str | os.PathLike, optional): The file to persist the snapshot to.
+            max_age (float, optional): The maximum age in seconds of a snapshot read from disk.
+        Returns:
+            The snapshot, also stored on `snapshot`.
+        """
+
+    def _use_snapshot(self, snapshot: ProjectSnapshot, path: PATH | None) -> ProjectSnapshot:
+        self.snapshot = snapshot
+        self.known_feeds = set(snapshot.feeds)
+        self.insight_titles.update(snapshot.insight_ids)
+        if path is not None:
+            snapshot.save(path)
+        return snapshot
+
+    # --- FEEDS --- #
+
+    @abstractmethod
+    def ensure_feed(self, name: str) -> None:
+        """
+        Create a feed unless it's known to exist.
+
+        Known feeds are seeded from the snapshot, or `fetch_project` if the client wasn't warmed.
+        Concurrent calls for the same feed create it once and all wait for it.
+
+        Args:
+            name (str): The name of the feed.
+        """
+
     # --- EVENTS --- #
 
     @abstractmethod
@@ -52,10 +131,14 @@ class BaseClient(ABC, t.Generic[F, E, I, R]):
         timestamp: datetime.datetime | None = None,
         notify: bool | None = None,
         metadata: dict[str, str | int | float | bool] | None = None,
+        idempotency_key: str | None = None,
     ) -> E:
         """
         Create an event.
 
+        With `auto_create_feeds`, the feed is created first if it doesn't exist.
+        Retries of the request, and of an event replayed after its feed was created, reuse one idempotency key.
+
         Args:
             feed (str): The name of the feed.
             title (str): The title of the event.
@@ -63,6 +146,8 @@ class BaseClient(ABC, t.Generic[F, E, I, R]):
             tags (dict[str, str | int | float | bool], optional): The tags of the event.
             timestamp (datetime.datetime, optional): The timestamp of the event.
             notify (bool, optional): Whether to notify the event.
+            metadata (dict[str, str | int | float | bool], optional): The metadata of the event.
+            idempotency_key (str, optional): A key identifying the event, to replay it without creating it twice.
         """
 
     @abstractmethod
@@ -109,6 +194,171 @@ class BaseClient(ABC, t.Generic[F, E, I, R]):
             feed (str): The name of the feed.
         """
 
+    @abstractmethod
+    def stream_events(self, *, feed: str, limit: int | None = None, offset: int | None = None) -> t.Iterator[E]:
+        """
+        Fetch events, constructing each one as it arrives instead of after the whole response.
+
+        Args:
+            feed (str): The name of the feed.
+            limit (int, optional): The maximum number of events.
+            offset (int, optional): The number of events to skip.
+        """
+
+    @abstractmethod
+    def fetch_event_batch(self, *, feed: str, limit: int | None = None, offset: int | None = None) -> EventBatch[E]:
+        """
+        Fetch events into a columnar batch, creating event objects only when they're accessed.
+
+        Args:
+            feed (str): The name of the feed.
+            limit (int, optional): The maximum number of events.
+            offset (int, optional): The number of events to skip.
+        """
+
+    @abstractmethod
+    def export_events(
+        self,
+        *,
+        feed: str,
+        path: PATH,
+        format: str = "ndjson",
+        compression: str | None = None,
+        page_size: int = 100,
+        resume: bool = True,
+    ) -> int:
+        """
+        Export a feed's events to a file a page at a time, resuming an interrupted export by default.
+
+        Args:
+            feed (str): The name of the feed.
+            path (str | os.PathLike): The output file.
+            format (str, optional): "ndjson", "csv" or "parquet".
+            compression (str, optional): "gzip", "bz2" or "xz" for text formats, or a parquet codec such as "zstd".
+            page_size (int, optional): The number of events fetched and written at a time.
+            resume (bool, optional): Whether to resume from the checkpoint of an interrupted export.
+        Returns:
+            The number of events exported.
+        """
+
+    @abstractmethod
+    def export_project(
+        self,
+        directory: PATH,
+        *,
+        format: str = "ndjson",
+        compression: str | None = None,
+        page_size: int = 100,
+        resume: bool = True,
+        connections: int = 4,
+        processes: int | None = None,
+    ) -> dict[str, int]:
+        """
+        Export every feed of the project to its own file in a directory, resuming an interrupted export by default.
+
+        Pages are fetched over several connections while a pool of worker processes encodes and
+        compresses them. Each feed fetches its next page while the last one is encoded, and holds at
+        most one page waiting to be, so memory stays bounded however large the feeds are.
+
+        Args:
+            directory (str | os.PathLike): The output directory, feeds are written to "<feed>.<format>[.<compression>]".
+            format (str, optional): "ndjson", "csv" or "parquet".
+            compression (str, optional): "gzip", "bz2" or "xz" for text formats, or a parquet codec such as "zstd".
+            page_size (int, optional): The number of events fetched and encoded at a time.
+            resume (bool, optional): Whether to resume feeds from the checkpoints of an interrupted export.
+            connections (int, optional): The number of feeds exported at once.
+            processes (int, optional): The number of encoding processes. Defaults to the number of cores.
+        Returns:
+            The number of events exported per feed.
+        """
+
+    @abstractmethod
+    def iter_events(
+        self,
+        *,
+        feed: str,
+        since: pika.Bound | None = None,
+        until: pika.Bound | None = None,
+        page_size: int = 100,
+    ) -> t.Iterator[E]:
+        """
+        Page through a feed's events, newest first, within a time window.
+
+        Events are listed newest first, so the window is checked against the time encoded in
+        each event's id, and paging stops at the first event older than `since` instead of
+        walking every remaining page.
+
+        Args:
+            feed (str): The name of the feed.
+            since (str | datetime.datetime, optional): Only events after this event id, or at or after this time.
+            until (str | datetime.datetime, optional): Only events before this event id or time.
+            page_size (int, optional): The number of events fetched per request.
+        """
+
+    @abstractmethod
+    def sync_mirror(self, mirror: EventMirror, *, feed: str, page_size: int = 100) -> int:
+        """
+        Copy the events created since the last sync of a feed into a local mirror.
+
+        Args:
+            mirror (EventMirror): The mirror.
+            feed (str): The name of the feed.
+            page_size (int, optional): The number of events fetched per request.
+        Returns:
+            The number of events copied.
+        """
+
+    @abstractmethod
+    def subscribe(
+        self,
+        *,
+        feed: str,
+        mirror: EventMirror | None = None,
+        since: str | None = None,
+        url: str | None = None,
+    ) -> BaseSubscription[t.Any, E]:
+        """
+        Subscribe to the events created, updated and deleted in a feed, pushed over a websocket.
+
+        Requires the websockets package. The connection is opened when the subscription is
+        iterated, and reopened whenever it drops.
+
+        Args:
+            feed (str): The name of the feed.
+            mirror (EventMirror, optional): A mirror to write every change to. The subscription then
+                resumes after the newest event the mirror holds.
+            since (str, optional): The id of the newest event already seen; events created after it
+                are fetched before the pushed ones.
+            url (str, optional): The websocket url. Defaults to the feed's url on the API.
+        Returns:
+            The subscription, which yields a `FeedChange` per change.
+        """
+
+    @abstractmethod
+    def tail(
+        self,
+        *,
+        feed: str,
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        page_size: int = 100,
+    ) -> BaseTail[E]:
+        """
+        Follow the events created in a feed by polling, for when subscribing over a websocket isn't possible.
+
+        Every tail of a feed shares one poller, which asks only for the events newer than the last
+        one seen. It polls more often while events keep coming and less often while the feed is idle.
+
+        Args:
+            feed (str): The name of the feed.
+            min_interval (float, optional): The shortest time between polls, in seconds.
+            max_interval (float, optional): The longest time between polls, in seconds.
+            page_size (int, optional): The number of events fetched per request.
+        Returns:
+            The tail, which yields the events created after it was opened, oldest first. If the feed
+            already has a poller, the tail joins it and the poller keeps its own settings.
+        """
+
     @abstractmethod
     def delete_event(self, *, feed: str, id: str) -> None:
         """
@@ -121,6 +371,74 @@ class BaseClient(ABC, t.Generic[F, E, I, R]):
 
     # --- INSIGHTS --- #
 
+    @abstractmethod
+    def buffer_increments(self, *, interval: float = 1.0, threshold: int = 1000) -> B:
+        """
+        Start coalescing insight increments in a write-behind buffer.
+
+        Args:
+            interval (float, optional): Seconds between flushes.
+            threshold (int, optional): Number of pending increments that triggers an early flush.
+        Returns:
+            The increment buffer.
+        """
+
+    @abstractmethod
+    def share_increments(
+        self,
+        *,
+        ids: t.Iterable[str],
+        name: str | None = None,
+        interval: float = 1.0,
+        processes: int = 64,
+    ) -> BaseSharedIncrements[t.Any]:
+        """
+        Start summing increments of the insights in shared memory with the other processes of a deployment.
+
+        `increment_insight()` calls for the insights add into this process's slots, and a single
+        process elected among those sharing the memory sends the totals, so N worker processes make
+        as many insight writes as one. Call it in each worker, after forking, with the same ids.
+
+        Args:
+            ids (Iterable[str]): The ids of the insights.
+            name (str, optional): The name of the shared memory segment. Defaults to one derived from
+                the project and the ids.
+            interval (float, optional): Seconds between flushes.
+            processes (int, optional): The most processes sharing the memory at once.
+        Returns:
+            The shared increments.
+        Raises:
+            LawgSharedMemoryError: If the segment holds other insights, or every process slot is taken.
+        """
+
+    @abstractmethod
+    def counter(self, *, id: str, interval: float | None = None) -> BaseShardedCounter[t.Any]:
+        """
+        Get a counter for an insight that many threads can add to without contending.
+
+        Each thread adds into a cell of its own, and the cells are only summed when the counter is
+        flushed, as a single `increment_insight()` call. Counters are flushed when the client closes.
+        Each insight has one counter, so `interval` only applies to the first call for an insight.
+
+        Args:
+            id (str): The id of the insight.
+            interval (float, optional): Seconds between background flushes. Defaults to only flushing
+                explicitly.
+        Returns:
+            The counter.
+        """
+
+    @abstractmethod
+    def metrics(self, *, interval: float = 10.0) -> t.Any:
+        """
+        Get the metrics registry of the client, publishing it every `interval` seconds.
+
+        Args:
+            interval (float, optional): Seconds between publishes. Only used when the registry is created.
+        Returns:
+            The metrics registry.
+        """
+
     @abstractmethod
     def insight(self, *, title: str, description: str, value: int, emoji: str | None = None) -> I:
         """
@@ -153,10 +471,13 @@ class BaseClient(ABC, t.Generic[F, E, I, R]):
         """
 
     @abstractmethod
-    def increment_insight(self, *, id: str, value: float) -> I:
+    def increment_insight(self, *, id: str, value: float) -> I | None:
         """
         Increment the value of an insight.
 
+        When increments are buffered, the increment is sent on the next flush and the known insight
+        with the id is returned if there is one.
+
         Args:
             id (str): The id of the insight.
             value (int): The value to increment the insight by.
@@ -177,6 +498,34 @@ class BaseClient(ABC, t.Generic[F, E, I, R]):
             value (int): The value to set the insight to.
         """
 
+    @abstractmethod
+    def insight_by_title(
+        self,
+        title: str,
+        *,
+        create: bool = True,
+        description: str | None = None,
+        emoji: str | None = None,
+        value: float = 0,
+    ) -> I | None:
+        """
+        Get an insight by its title, creating it if it doesn't exist.
+
+        Titles are resolved through `insight_titles`, so only the first lookup of a title
+        (or the first after the insight was deleted) lists the project's insights. The insight
+        of a resolved title is taken from the identity map or the snapshot when either holds it,
+        and forgotten once a request about it finds it deleted.
+
+        Args:
+            title (str): The title of the insight.
+            create (bool, optional): Whether to create the insight if it doesn't exist.
+            description (str, optional): The description of the insight, if it's created.
+            emoji (str, optional): The emoji of the insight, if it's created.
+            value (float, optional): The initial value of the insight, if it's created.
+        Returns:
+            The insight, or None if it doesn't exist and `create` is False.
+        """
+
     @abstractmethod
     def fetch_insight(self, *, id: str) -> I:
         """
@@ -192,6 +541,10 @@ class BaseClient(ABC, t.Generic[F, E, I, R]):
         Fetch all insights.
         """
 
+    @abstractmethod
+    def stream_insights(self) -> t.Iterator[I]:
+        """Fetch insights, constructing each one as it arrives instead of after the whole response."""
+
     @abstractmethod
     def delete_insight(self, *, id: str) -> None:
         """
@@ -201,6 +554,95 @@ class BaseClient(ABC, t.Generic[F, E, I, R]):
             id (str): The id of the insight.
         """
 
+    # --- IDENTITY MAP --- #
+
+    def _identity(self, cls: type[T], id: str, **attributes: t.Any) -> T:
+        """
+        Get the object with an id from the identity map, updated in place, or construct it.
+        """
+        identity_map = self.identity_map
+        if identity_map is None:
+            return cls(self, id=id, **attributes)  # type: ignore
+
+        with self._identity_lock:
+            obj = identity_map.get(id)
+            if obj is None:
+                obj = identity_map[id] = cls(self, id=id, **attributes)  # type: ignore
+                return obj
+
+            for name, value in attributes.items():
+                setattr(obj, name, value)
+            return obj
+
+    def _recall(self, id: str) -> t.Any:
+        """
+        Get the object with an id from the identity map, if it's known.
+        """
+        if self.identity_map is None:
+            return None
+        return self.identity_map.get(id)
+
+    def _forget(self, id: str) -> None:
+        """
+        Mark the object with an id as deleted and drop it from the identity map.
+        """
+        if self.identity_map is None:
+            return
+
+        with self._identity_lock:
+            obj = self.identity_map.pop(id, None)
+        if obj is not None:
+            obj.is_deleted = True
+
+    # --- INSIGHT CACHE --- #
+
+    def _cached_insight(self, id: str) -> I | None:
+        """
+        Get an insight from the identity map or the snapshot, without contacting the API.
+        """
+        insight = self._recall(id)
+        if insight is not None:
+            return insight
+        if self.snapshot is not None:
+            insight_data = self.snapshot.insights.get(id)
+            if insight_data is not None:
+                return self._construct_insight(insight_data)
+        return None
+
+    @contextlib.contextmanager
+    def _invalidating(self, id: str) -> t.Iterator[None]:
+        """
+        Forget a cached insight once the API reports it missing.
+        """
+        try:
+            yield
+        except LawgNotFoundError:
+            self._forget_insight(id)
+            raise
+
+    def _forget_insight(self, id: str) -> None:
+        """
+        Drop a deleted insight from the identity map, the snapshot and the title cache.
+        """
+        self._forget(id)
+        if self.snapshot is not None:
+            self.snapshot.forget_insight(id)
+        self.insight_titles.discard_id(id)
+
+    def _mirror_store(self, event: E) -> None:
+        """
+        Write an edited event through to the mirror, if the client has one.
+        """
+        if self.mirror is not None:
+            self.mirror.store(event.feed, [event])
+
+    def _mirror_delete(self, id: str) -> None:
+        """
+        Delete an event from the mirror, if the client has one.
+        """
+        if self.mirror is not None:
+            self.mirror.delete([id])
+
     # --- MANAGER CONSTRUCTORS --- #
 
     @abstractmethod
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import threading
+import typing as t
+import weakref
+
+from abc import ABC, abstractmethod
+
+from lawg.typings import C
+
+
+class _Cell:
+    """A thread's running total, only ever written by that thread."""
+
+    __slots__ = ("value", "thread")
+
+    def __init__(self) -> None:
+        self.value = 0.0
+        self.thread = weakref.ref(threading.current_thread())
+
+    @property
+    def retired(self) -> bool:
+        thread = self.thread()
+        return thread is None or not thread.is_alive()
+
+
+class BaseShardedCounter(ABC, t.Generic[C]):
+    """
+    A counter for an insight incremented from many threads, without a lock on the hot path.
+
+    Each thread adds into a cell of its own, so increments never contend. Cells only grow: a flush
+    sums them and sends the difference from the total already sent, so it never writes to a cell
+    a thread may be adding to. Cells of threads that have finished are folded into one total.
+    """
+
+    __slots__ = ("client", "id", "interval", "_local", "_cells", "_cells_lock", "_retired", "_flushed")
+
+    def __init__(self, client: C, id: str, *, interval: float | None = None) -> None:
+        super().__init__()
+        self.client: C = client
+        self.id = id
+        # seconds between background flushes, None to only flush explicitly
+        self.interval = interval
+        self._local = threading.local()
+        self._cells: list[_Cell] = []
+        # taken when a thread adds its first increment and on flush, never on later increments
+        self._cells_lock = threading.Lock()
+        self._retired = 0.0
+        self._flushed = 0.0
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} id={self.id!r} pending={self.pending!r} project={self.client.project!r}>"
+
+    def add(self, value: float = 1.0) -> None:
+        """
+        Add to the counter.
+
+        Args:
+            value (float, optional): The value to add. Defaults to 1.
+        """
+        try:
+            cell = self._local.cell
+        except AttributeError:
+            cell = self._new_cell()
+        cell.value += value
+
+    def _new_cell(self) -> _Cell:
+        cell = self._local.cell = _Cell()
+        with self._cells_lock:
+            self._cells.append(cell)
+        return cell
+
+    @property
+    def total(self) -> float:
+        """Everything added to the counter, sent or not."""
+        with self._cells_lock:
+            return self._retired + sum(cell.value for cell in self._cells)
+
+    @property
+    def pending(self) -> float:
+        """Everything added to the counter and not sent yet."""
+        return self.total - self._flushed
+
+    def _collect(self) -> float:
+        """Sum the cells, folding those of finished threads, and get the total."""
+        with self._cells_lock:
+            live = []
+            for cell in self._cells:
+                if cell.retired:
+                    self._retired += cell.value
+                else:
+                    live.append(cell)
+            self._cells = live
+            return self._retired + sum(cell.value for cell in live)
+
+    @abstractmethod
+    def flush(self) -> t.Awaitable[None] | None:
+        """
+        Send everything added since the last flush as a single increment of the insight.
+        """
+
+    @abstractmethod
+    def close(self) -> t.Awaitable[None] | None:
+        """
+        Stop flushing in the background and send everything pending.
+        """
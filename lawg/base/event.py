@@ -4,9 +4,12 @@ import typing as t
 
 from abc import ABC, abstractmethod
 
+from lawg import pika
 from lawg.typings import UNDEFINED, C
 
 if t.TYPE_CHECKING:
+    import datetime
+
     from lawg.typings import Undefined
 
 
@@ -24,7 +27,9 @@ class BaseEvent(ABC, t.Generic[C]):
         "title",
         "description",
         "emoji",
+        "tags",
         "is_deleted",
+        "__weakref__",
     )
 
     def __init__(
@@ -37,6 +42,7 @@ class BaseEvent(ABC, t.Generic[C]):
         title: str,
         description: str | None,
         emoji: str | None,
+        tags: dict[str, str | int | float | bool] | None = None,
     ) -> None:
         super().__init__()
         self.client = client
@@ -48,12 +54,18 @@ class BaseEvent(ABC, t.Generic[C]):
         self.title = title
         self.description = description
         self.emoji = emoji
+        self.tags = tags
         # --- extras --- #
         self.is_deleted = False
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} id={self.id!r} title={self.title!r} emoji={self.emoji!r} feed={self.feed!r} project={self.client.project!r}>"
 
+    @property
+    def created_at(self) -> datetime.datetime:
+        """The time the event was created at, in utc, as encoded in its id."""
+        return pika.timestamp(self.id)
+
     # --- EVENT --- #
 
     @abstractmethod
@@ -62,6 +74,7 @@ class BaseEvent(ABC, t.Generic[C]):
         title: str | None | Undefined = UNDEFINED,
         description: str | None | Undefined = UNDEFINED,
         emoji: str | None | Undefined = UNDEFINED,
+        tags: dict[str, str | int | float | bool] | None | Undefined = UNDEFINED,
     ) -> None:
         """
         Edit the event.
@@ -4,10 +4,16 @@ import typing as t
 
 from abc import ABC, abstractmethod
 
+from lawg.exceptions import LawgNoMirrorError
 from lawg.typings import UNDEFINED, C, E
 
 if t.TYPE_CHECKING:
-    from lawg.typings import Undefined
+    from lawg import pika
+    from lawg.base.subscription import BaseSubscription
+    from lawg.base.tail import BaseTail
+    from lawg.batch import EventBatch
+    from lawg.mirror import EventMirror
+    from lawg.typings import PATH, Undefined
 
 
 class BaseFeed(ABC, t.Generic[C, E]):
@@ -33,13 +39,14 @@ class BaseFeed(ABC, t.Generic[C, E]):
     # --- FEED METHODS --- #
 
     @abstractmethod
-    def event(self, *, title: str, description: str) -> E:
+    def event(self, *, title: str, description: str, idempotency_key: str | None = None) -> E:
         """
         Create an event.
 
         Args:
             title (str): The title of the event.
             description (str): The description of the event.
+            idempotency_key (str, optional): A key identifying the event, to replay it without creating it twice.
         Returns:
             The event.
         """
@@ -52,6 +59,7 @@ class BaseFeed(ABC, t.Generic[C, E]):
         title: str | None | Undefined = UNDEFINED,
         description: str | None | Undefined = UNDEFINED,
         emoji: str | None | Undefined = UNDEFINED,
+        tags: dict[str, str | int | float | bool] | None | Undefined = UNDEFINED,
     ) -> E:
         """
         Edit an event.
@@ -61,6 +69,7 @@ class BaseFeed(ABC, t.Generic[C, E]):
             title (str, optional): The new title of the event.
             description (str, optional): The new description of the event.
             emoji (str, optional): The new emoji of the event.
+            tags (dict[str, str | int | float | bool], optional): The new tags of the event.
         Returns:
             The event.
         """
@@ -85,6 +94,154 @@ class BaseFeed(ABC, t.Generic[C, E]):
             A list of events.
         """
 
+    @abstractmethod
+    def stream_events(self, *, limit: int | None = None, offset: int | None = None) -> t.Iterator[E]:
+        """
+        Fetch events, constructing each one as it arrives.
+
+        Args:
+            limit (int, optional): The maximum number of events.
+            offset (int, optional): The number of events to skip.
+        Returns:
+            An iterator over the events.
+        """
+
+    @abstractmethod
+    def fetch_event_batch(self, *, limit: int | None = None, offset: int | None = None) -> EventBatch[E]:
+        """
+        Fetch events into a columnar batch, creating event objects only when they're accessed.
+
+        Args:
+            limit (int, optional): The maximum number of events.
+            offset (int, optional): The number of events to skip.
+        Returns:
+            The batch of events.
+        """
+
+    @abstractmethod
+    def export(
+        self,
+        path: PATH,
+        *,
+        format: str = "ndjson",
+        compression: str | None = None,
+        page_size: int = 100,
+        resume: bool = True,
+    ) -> int:
+        """
+        Export the events to a file a page at a time, resuming an interrupted export by default.
+
+        Args:
+            path (str | os.PathLike): The output file.
+            format (str, optional): "ndjson", "csv" or "parquet".
+            compression (str, optional): "gzip", "bz2" or "xz" for text formats, or a parquet codec such as "zstd".
+            page_size (int, optional): The number of events fetched and written at a time.
+            resume (bool, optional): Whether to resume from the checkpoint of an interrupted export.
+        Returns:
+            The number of events exported.
+        """
+
+    @abstractmethod
+    def iter_events(
+        self,
+        *,
+        since: pika.Bound | None = None,
+        until: pika.Bound | None = None,
+        page_size: int = 100,
+    ) -> t.Iterator[E]:
+        """
+        Page through the events, newest first, within a time window.
+
+        Args:
+            since (str | datetime.datetime, optional): Only events after this event id, or at or after this time.
+            until (str | datetime.datetime, optional): Only events before this event id or time.
+            page_size (int, optional): The number of events fetched per request.
+        Returns:
+            An iterator over the events.
+        """
+
+    def search(
+        self,
+        query: str | None = None,
+        *,
+        title: str | None = None,
+        tags: t.Mapping[str, str | int | float | bool] | None = None,
+        since: pika.Bound | None = None,
+        until: pika.Bound | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[E]:
+        """
+        Search the events held by the client's mirror, newest first, without contacting the API.
+
+        Args:
+            query (str, optional): Only events whose title, description or tags contain all of these words.
+            title (str, optional): Only events with this title.
+            tags (Mapping[str, str | int | float | bool], optional): Only events with all of these tags.
+            since (str | datetime.datetime, optional): Only events after this event id, or at or after this time.
+            until (str | datetime.datetime, optional): Only events before this event id or time.
+            limit (int, optional): The maximum number of events.
+            offset (int, optional): The number of events to skip.
+        Returns:
+            The events.
+        Raises:
+            LawgNoMirrorError: If the client has no mirror.
+        """
+        mirror = self.client.mirror
+        if mirror is None:
+            raise LawgNoMirrorError()
+        events_data = mirror.events(
+            self.name,
+            query=query,
+            title=title,
+            tags=tags,
+            since=since,
+            until=until,
+            limit=limit,
+            offset=offset,
+        )
+        return self.client._construct_events(self.name, events_data)  # type: ignore
+
+    @abstractmethod
+    def sync_mirror(self, mirror: EventMirror, *, page_size: int = 100) -> int:
+        """
+        Copy the events created since the last sync into a local mirror.
+
+        Args:
+            mirror (EventMirror): The mirror.
+            page_size (int, optional): The number of events fetched per request.
+        Returns:
+            The number of events copied.
+        """
+
+    @abstractmethod
+    def subscribe(
+        self, *, mirror: EventMirror | None = None, since: str | None = None, url: str | None = None
+    ) -> BaseSubscription[t.Any, E]:
+        """
+        Subscribe to the events created, updated and deleted in the feed, pushed over a websocket.
+
+        Args:
+            mirror (EventMirror, optional): A mirror to write every change to.
+            since (str, optional): The id of the newest event already seen.
+            url (str, optional): The websocket url. Defaults to the feed's url on the API.
+        Returns:
+            The subscription, which yields a `FeedChange` per change.
+        """
+
+    @abstractmethod
+    def tail(self, *, min_interval: float = 1.0, max_interval: float = 60.0, page_size: int = 100) -> BaseTail[E]:
+        """
+        Follow the events created in the feed by polling, sharing one poller per feed.
+
+        Args:
+            min_interval (float, optional): The shortest time between polls, in seconds.
+            max_interval (float, optional): The longest time between polls, in seconds.
+            page_size (int, optional): The number of events fetched per request.
+        Returns:
+            The tail, which yields the events created after it was opened, oldest first.
+        """
+
     @abstractmethod
     def delete_event(self, *, id: str) -> None:
         """
@@ -20,6 +20,7 @@ class BaseInsight(ABC, t.Generic[C]):
         "updated_at",
         "created_at",
         "is_deleted",
+        "__weakref__",
     )
 
     def __init__(
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import typing as t
+
+from abc import ABC, abstractmethod
+
+from lawg.metrics import Gauge, Histogram, Metric, Summary
+from lawg.typings import C
+
+if t.TYPE_CHECKING:
+    from lawg.metrics import Sample
+
+    M = t.TypeVar("M", bound=Metric)
+
+
+class BaseMetrics(ABC, t.Generic[C]):
+    """
+    A registry of metrics, published as insights every `interval` seconds.
+
+    Each statistic of a metric is published to the insight titled "<metric name> <statistic>",
+    resolved through `insight_by_title`, so it's created on the first flush if the project
+    doesn't have it yet.
+    """
+
+    __slots__ = ("client", "interval", "_metrics")
+
+    def __init__(self, client: C, *, interval: float = 10.0) -> None:
+        super().__init__()
+        self.client: C = client
+        self.interval = interval
+        self._metrics: dict[str, Metric] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} metrics={len(self._metrics)!r} interval={self.interval!r} project={self.client.project!r}>"
+
+    # --- METRICS --- #
+
+    def gauge(self, name: str) -> Gauge:
+        """
+        Get or create a gauge.
+
+        Args:
+            name (str): The name of the gauge.
+        """
+        return self._register(Gauge, name)
+
+    def histogram(self, name: str, **kwargs: t.Any) -> Histogram:
+        """
+        Get or create a histogram.
+
+        Args:
+            name (str): The name of the histogram.
+            **kwargs: Options passed to `Histogram` when it's created.
+        """
+        return self._register(Histogram, name, **kwargs)
+
+    def summary(self, name: str) -> Summary:
+        """
+        Get or create a summary.
+
+        Args:
+            name (str): The name of the summary.
+        """
+        return self._register(Summary, name)
+
+    def collect(self) -> list[Sample]:
+        """
+        Collect the samples of every metric and start a new interval.
+        """
+        return [sample for metric in list(self._metrics.values()) for sample in metric.collect()]
+
+    def _register(self, cls: type[M], name: str, **kwargs: t.Any) -> M:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics.setdefault(name, cls(name, **kwargs))
+        if not isinstance(metric, cls):
+            msg = f"metric {name!r} is already registered as a {metric.__class__.__name__}"
+            raise TypeError(msg)
+        return metric
+
+    # --- PUBLISHING --- #
+
+    @abstractmethod
+    def flush(self) -> t.Awaitable[None] | None:
+        """
+        Publish the samples of every metric.
+        """
+
+    @abstractmethod
+    def close(self) -> t.Awaitable[None] | None:
+        """
+        Stop publishing in the background and publish the last samples.
+        """
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import datetime
+import email.utils
+import json
 import os
+import random
 import typing as t
+import uuid
 from abc import ABC, abstractmethod
 
 import marshmallow
-import httpx
 
 from lawg.exceptions import (
     LawgEmptyBodyError,
@@ -16,13 +20,19 @@ from lawg.exceptions import (
     LawgNotFoundError,
     LawgInternalServerError,
     LawgForbiddenError,
+    LawgRateLimitedError,
 )
-from lawg.schemas import APIErrorSchema, APISuccessSchema
+from lawg import compiler
+from lawg.cache import IdempotencyRecord
+from lawg.stream import JSONArrayDecoder
+from lawg.schemas import APISuccessSchema, prebuilt
 from lawg.typings import C, H, UNDEFINED, DataWithSchema, Undefined
 
 if t.TYPE_CHECKING:
-    import datetime
+    import httpx
     from marshmallow import Schema
+    from lawg.cache import CacheEntry, ResponseCache
+    from lawg.decoders import RecordDecoder
     from lawg.typings import STR_DICT
 
 
@@ -68,11 +78,59 @@ class BaseRest(ABC, t.Generic[C, H]):
     API_EDIT_INSIGHT = f"{API_V1_PROJECTS}/{{namespace}}/insights/{{insight_id}}"
     API_DELETE_INSIGHT = f"{API_V1_PROJECTS}/{{namespace}}/insights/{{insight_id}}"
 
-    __slots__ = ("client", "http_client")
-
-    def __init__(self, client: C) -> None:
+    # --- WEBSOCKETS --- #
+    # http(s):// becomes ws(s)://
+    API_FEED_WEBSOCKET = f"ws{API_V1_PROJECTS[4:]}/{{namespace}}/feeds/{{feed}}/ws"
+
+    # identical concurrent requests with these methods share one in-flight request
+    COALESCE_METHODS: t.ClassVar[frozenset[str]] = frozenset({"GET"})
+
+    # requests with these methods, or with an idempotency key, are safe to send more than once
+    RETRY_METHODS: t.ClassVar[frozenset[str]] = frozenset({"GET"})
+    # responses with these statuses may not have been processed and are worth retrying
+    RETRY_STATUSES: t.ClassVar[frozenset[int]] = frozenset({408, 429, 500, 502, 503, 504})
+
+    IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+    # errors raised for the api's error codes, and for statuses of responses that aren't api errors
+    ERROR_CODES: t.ClassVar[dict[str, type[LawgHTTPError]]] = {
+        "bad_request": LawgBadRequestError,
+        "unauthorized": LawgUnauthorizedError,
+        "forbidden": LawgForbiddenError,
+        "not_found": LawgNotFoundError,
+        "conflict": LawgConflictError,
+        "too_many_requests": LawgRateLimitedError,
+        "internal_server_error": LawgInternalServerError,
+    }
+    ERROR_STATUSES: t.ClassVar[dict[int, type[LawgHTTPError]]] = {
+        400: LawgBadRequestError,
+        401: LawgUnauthorizedError,
+        403: LawgForbiddenError,
+        404: LawgNotFoundError,
+        409: LawgConflictError,
+        429: LawgRateLimitedError,
+        500: LawgInternalServerError,
+    }
+
+    __slots__ = ("client", "http_client", "cache", "max_retries", "retry_backoff", "acknowledged", "record_decoder")
+
+    def __init__(
+        self,
+        client: C,
+        cache: ResponseCache | None = None,
+        max_retries: int = 0,
+        retry_backoff: float = 0.5,
+        record_decoder: RecordDecoder | None = None,
+    ) -> None:
         self.client: C = client
         self.http_client: H
+        self.cache = cache
+        # decodes responses into typed records instead of loading them through marshmallow
+        self.record_decoder = record_decoder
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        # idempotency keys the api acknowledged, so replayed creations aren't sent again
+        self.acknowledged = IdempotencyRecord()
 
     @property
     def headers(self) -> dict[str, str]:
@@ -87,6 +145,7 @@ class BaseRest(ABC, t.Generic[C, H]):
         body_with_schema: DataWithSchema | None = None,
         slugs_with_schema: DataWithSchema | None = None,
         response_schema: Schema | None = None,
+        headers: dict[str, str] | None = None,
     ) -> STR_DICT:
         """
         Make a request to the API.
@@ -95,6 +154,7 @@ class BaseRest(ABC, t.Generic[C, H]):
             path (str): path of request.
             method (str): HTTP method.
             body: (dict[str, Any] | None, optional): body of request. Defaults to None.
+            headers (dict[str, str] | None, optional): extra headers of request. Defaults to None.
 
         Returns:
             dict: response body of request.
@@ -118,7 +178,7 @@ class BaseRest(ABC, t.Generic[C, H]):
                 continue
             new_body[key] = value
 
-        loaded_body: STR_DICT = body.schema.load(new_body)  # type: ignore
+        loaded_body = compiler.load(body.schema, new_body)
 
         if not loaded_body:
             raise LawgEmptyBodyError()
@@ -138,7 +198,7 @@ class BaseRest(ABC, t.Generic[C, H]):
             schema = slugs_with_schema.schema
             data = slugs_with_schema.data
 
-            slugs: STR_DICT = schema.load(data)  # type: ignore
+            slugs = compiler.load(schema, data)
             url = url.format(**slugs)
 
         return url
@@ -167,40 +227,67 @@ class BaseRest(ABC, t.Generic[C, H]):
         Args:
             response (httpx.Response): response from API.
         """
-        try:
-            response.raise_for_status()
-        except httpx.HTTPStatusError as exc:
-            data = response.json()
-            schema = APIErrorSchema()
+        if response.is_success:
+            return
+        raise self.classify_error(response)
 
-            try:
-                schema.load(data)
-            except marshmallow.ValidationError as exc:
-                # error follows fastify error format, meaning it never got a proper json reply from api
-                # in this case, 404 can be handled pretty easily but im not sure about much else.
-
-                if response.status_code == 404:
-                    raise LawgNotFoundError(message=data["message"], status_code=response.status_code) from exc
-
-                raise LawgHTTPError(status_code=response.status_code) from exc
-
-            error_code: str = data["error"]["code"]
-            error_message: str = data["error"]["message"]
-
-            if error_code == "conflict":
-                raise LawgConflictError(message=error_message, status_code=response.status_code) from exc
-            elif error_code == "bad_request":
-                raise LawgBadRequestError(message=error_message, status_code=response.status_code) from exc
-            elif error_code == "unauthorized":
-                raise LawgUnauthorizedError(message=error_message, status_code=response.status_code) from exc
-            elif error_code == "not_found":
-                raise LawgNotFoundError(message=error_message, status_code=response.status_code) from exc
-            elif error_code == "internal_server_error":
-                raise LawgInternalServerError(message=error_message, status_code=response.status_code) from exc
-            elif error_code == "forbidden":
-                raise LawgForbiddenError(message=error_message, status_code=response.status_code) from exc
+    def classify_error(self, response: httpx.Response) -> LawgHTTPError:
+        """
+        Get the error of an unsuccessful response.
+
+        The error is picked by the api's error code, falling back to the status code when the body
+        isn't an api error, e.g. fastify's own error format or a proxy's html page.
+
+        Args:
+            response (httpx.Response): unsuccessful response from API.
+        """
+        status_code = response.status_code
+        code = message = None
+        try:
+            data = json.loads(response.content)
+        except ValueError:
+            data = None
+
+        if isinstance(data, dict):
+            error = data.get("error")
+            if isinstance(error, dict):
+                code, message = error.get("code"), error.get("message")
             else:
-                raise LawgHTTPError(message=error_message, status_code=response.status_code) from exc
+                # fastify error format, the api never got to reply itself
+                message = data.get("message")
+
+        error_cls = self.ERROR_STATUSES.get(status_code, LawgHTTPError)
+        # the body may hold any json value as the code, only a known string names the error
+        if isinstance(code, str):
+            error_cls = self.ERROR_CODES.get(code, error_cls)
+        return error_cls(
+            status_code=status_code,
+            message=message if isinstance(message, str) else None,
+            retry_after=self.retry_after(response),
+            retryable=status_code in self.RETRY_STATUSES,
+        )
+
+    def retry_after(self, response: httpx.Response) -> float | None:
+        """
+        Get the seconds a response asked to wait before retrying, from its `Retry-After` header.
+
+        Args:
+            response (httpx.Response): response from API.
+        """
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+        return max(0.0, (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
 
     def prepare_response(
         self,
@@ -215,11 +302,228 @@ class BaseRest(ABC, t.Generic[C, H]):
         if response.status_code == 204 or not response_schema:
             return {}
 
-        resp_data = response.json()
-        api_data: STR_DICT = APISuccessSchema().load(resp_data)  # type: ignore
-        schema_data = response_schema.load(api_data["data"])
+        if self.record_decoder is not None and self.record_decoder.supports(response_schema):
+            return self.record_decoder.decode(response.content, response_schema)
+
+        data = self.load_envelope(response.json())
+        return compiler.load(response_schema, data)
+
+    def load_envelope(self, resp_data: t.Any) -> t.Any:
+        """
+        Check that a response body is a successful envelope and get its data, without copying it.
+
+        Args:
+            resp_data (Any): the decoded response body.
+
+        Raises:
+            marshmallow.ValidationError: if the body isn't a successful envelope.
+        """
+        if isinstance(resp_data, dict) and resp_data.get("success") is True and "data" in resp_data:
+            return resp_data["data"]
+        # only malformed bodies go through the schema, for its error messages
+        prebuilt(APISuccessSchema).load(resp_data)
+        msg = "Not a successful response envelope."
+        raise marshmallow.ValidationError(msg)
+
+    @abstractmethod
+    def stream(
+        self,
+        *,
+        url: str,
+        method: str,
+        item_schema: Schema,
+        body_with_schema: DataWithSchema | None = None,
+        slugs_with_schema: DataWithSchema | None = None,
+    ) -> t.Iterator[STR_DICT]:
+        """
+        Make a request to the API, loading the items of its list response as they arrive.
+
+        The response cache, request coalescing and retries are bypassed.
+
+        Args:
+            url (str): url of request.
+            method (str): HTTP method.
+            item_schema (Schema): schema of each item of the response data.
+
+        Returns:
+            Iterator[dict[str, Any]]: the loaded items.
+        """
+
+    def prepare_stream(self, response: httpx.Response) -> JSONArrayDecoder:
+        """
+        Validate the status of a streamed response and get a decoder for its data.
+
+        Error bodies must have been read before calling this.
+
+        Args:
+            response (httpx.Response): streamed response from API.
+        """
+        self.validate_response(response)
+        return JSONArrayDecoder("data")
+
+    def load_stream_chunk(self, decoder: JSONArrayDecoder, chunk: str, item_schema: Schema) -> list[STR_DICT]:
+        """
+        Load the items completed by a chunk of a streamed response.
+
+        Args:
+            decoder (JSONArrayDecoder): decoder of the response.
+            chunk (str): the chunk of text.
+            item_schema (Schema): schema of each item.
+        """
+        if self.record_decoder is not None and self.record_decoder.supports(item_schema):
+            return [self.record_decoder.convert(item, item_schema) for item in decoder.feed(chunk)]
+        return [compiler.load(item_schema, item) for item in decoder.feed(chunk)]
+
+    def request_key(self, url: str, body: STR_DICT | None) -> str:
+        """
+        Get a key identifying a request by its url and body.
+
+        Args:
+            url (str): url of request.
+            body (dict[str, Any] | None): body of request.
+        """
+        if body is None:
+            return url
+        return f"{url}?{json.dumps(body, sort_keys=True, default=str)}"
+
+    def flight_key(self, method: str, url: str, body: STR_DICT | None, headers: dict[str, str] | None) -> str | None:
+        """
+        Get the key identical concurrent requests share one in-flight request under.
+
+        Args:
+            method (str): HTTP method.
+            url (str): url of request.
+            body (dict[str, Any] | None): body of request.
+            headers (dict[str, str] | None): extra headers of request.
+
+        Returns:
+            str | None: the key, None if the request must always be sent.
+        """
+        idempotency_key = headers and headers.get(self.IDEMPOTENCY_HEADER)
+        if idempotency_key:
+            return f"{self.IDEMPOTENCY_HEADER}:{idempotency_key}"
+        if method in self.COALESCE_METHODS:
+            return self.request_key(url, body)
+        return None
+
+    # --- RETRIES --- #
 
-        return schema_data  # type: ignore
+    def new_idempotency_key(self) -> str:
+        """Generate a key identifying one logical write across retries."""
+        return uuid.uuid4().hex
+
+    def can_retry(self, method: str, headers: dict[str, str] | None) -> bool:
+        """
+        Check whether a request is safe to send more than once.
+
+        Args:
+            method (str): HTTP method.
+            headers (dict[str, str] | None): extra headers of request.
+        """
+        if self.max_retries <= 0:
+            return False
+        return method in self.RETRY_METHODS or bool(headers and self.IDEMPOTENCY_HEADER in headers)
+
+    def retry_delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """
+        Get the seconds to wait before retrying, with exponential backoff and jitter.
+
+        Args:
+            attempt (int): the number of attempts made so far, starting at 1.
+            response (httpx.Response | None, optional): the response to retry, whose `Retry-After` is honoured.
+        """
+        # jitter, so clients retrying together spread out; nothing secret depends on it
+        delay = self.retry_backoff * 2 ** (attempt - 1) * random.uniform(0.5, 1.0)  # noqa: S311
+        retry_after = None if response is None else self.retry_after(response)
+        return delay if retry_after is None else max(delay, retry_after)
+
+    # --- CACHING --- #
+
+    def cache_scope(self, url: str) -> str:
+        """
+        Get the url under which a write can change cached responses.
+
+        Args:
+            url (str): url of the write request.
+        """
+        if not url.startswith(f"{self.API_V1_PROJECTS}/"):
+            return ""
+        namespace = url[len(self.API_V1_PROJECTS) + 1 :].split("/", 1)[0]
+        return f"{self.API_V1_PROJECTS}/{namespace}"
+
+    def cache_lookup(
+        self, method: str, url: str, body: STR_DICT | None
+    ) -> tuple[str | None, CacheEntry | None, STR_DICT | None]:
+        """
+        Look up a request in the response cache.
+
+        Args:
+            method (str): HTTP method.
+            url (str): url of request.
+            body (dict[str, Any] | None): body of request.
+
+        Returns:
+            tuple[str | None, CacheEntry | None, dict[str, Any] | None]: the cache key (None if the request
+            isn't cacheable), the cached entry to revalidate, and a copy of the cached data if it's still fresh.
+        """
+        if self.cache is None or method != "GET":
+            return None, None, None
+
+        key = self.request_key(url, body)
+        entry, fresh = self.cache.lookup(key)
+        if entry is not None and fresh:
+            return key, entry, self.cache.copy(entry.data)
+        return key, entry, None
+
+    def cache_headers(self, entry: CacheEntry | None, headers: dict[str, str] | None = None) -> dict[str, str] | None:
+        """
+        Get the headers to revalidate a cached entry with.
+
+        Args:
+            entry (CacheEntry | None): the stale entry, if any.
+            headers (dict[str, str] | None, optional): extra headers of request. Defaults to None.
+        """
+        if entry is None or entry.etag is None:
+            return headers
+        return {**(headers or {}), "If-None-Match": entry.etag}
+
+    def prepare_cached_response(
+        self,
+        response: httpx.Response,
+        response_schema: Schema | None,
+        *,
+        endpoint: str,
+        key: str | None,
+        entry: CacheEntry | None,
+    ) -> STR_DICT:
+        """
+        Prepare a response from the API, storing it in or invalidating the response cache.
+
+        Args:
+            response (httpx.Response): response from API.
+            response_schema (Schema | None): schema of response data.
+            endpoint (str): url template of request.
+            key (str | None): cache key of request, None if it isn't cacheable.
+            entry (CacheEntry | None): the stale entry the request revalidated, if any.
+        """
+        cache = self.cache
+        if cache is None:
+            return self.prepare_response(response, response_schema)
+
+        if key is None:
+            # writes through this client invalidate everything cached for the project, even if they failed
+            try:
+                return self.prepare_response(response, response_schema)
+            finally:
+                cache.invalidate(self.cache_scope(str(response.request.url)))
+
+        if response.status_code == 304 and entry is not None:
+            cache.revalidate(key, endpoint, entry)
+            return cache.copy(entry.data)
+
+        data = self.prepare_response(response, response_schema)
+        cache.store(key, endpoint, data, response.headers.get("ETag"), len(response.content))
+        return cache.copy(data)
 
     # --- API INTERACTIONS METHODS --- #
 
@@ -346,10 +650,14 @@ class BaseRest(ABC, t.Generic[C, H]):
         timestamp: datetime.datetime | None = None,
         notify: bool | None = None,
         metadata: dict[str, str | int | float | bool] | None = None,
+        idempotency_key: str | None = None,
     ) -> STR_DICT:
         """
         Create an event.
 
+        The event is sent with an idempotency key, reused if the request is retried. Creating an
+        event again with a key the api already acknowledged returns the recorded event instead.
+
         Args:
             project (str): namespace of project.
             feed (str): name of feed.
@@ -360,6 +668,7 @@ class BaseRest(ABC, t.Generic[C, H]):
             timestamp (datetime.datetime | None, optional): timestamp of event. Defaults to None.
             notify (bool | None, optional): notify of event. Defaults to None.
             metadata (dict[str, str | int | float | bool] | None, optional): metadata of event. Defaults to None.
+            idempotency_key (str | None, optional): key identifying the event across retries. Defaults to a new key.
         Returns:
             the created event data.
         """
@@ -448,6 +757,26 @@ class BaseRest(ABC, t.Generic[C, H]):
             None
         """
 
+    @abstractmethod
+    def stream_events(
+        self,
+        project: str,
+        feed: str,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> t.Iterator[STR_DICT]:
+        """
+        Stream multiple events, loading each one as it arrives.
+
+        Args:
+            project (str): namespace of project.
+            feed (str): name of feed.
+            limit (int | None, optional): limit of events. Defaults to None.
+            offset (int | None, optional): offset of events. Defaults to None.
+        Returns:
+            an iterator over the fetched events' data.
+        """
+
     # --- INSIGHT --- #
 
     @abstractmethod
@@ -502,6 +831,20 @@ class BaseRest(ABC, t.Generic[C, H]):
             the fetched insights data.
         """
 
+    @abstractmethod
+    def stream_insights(
+        self,
+        project: str,
+    ) -> t.Iterator[STR_DICT]:
+        """
+        Stream multiple insights, loading each one as it arrives.
+
+        Args:
+            project (str): namespace of project.
+        Returns:
+            an iterator over the fetched insights' data.
+        """
+
     @abstractmethod
     def edit_insight(
         self,
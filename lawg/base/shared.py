@@ -0,0 +1,336 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import struct
+import sys
+import tempfile
+import threading
+import typing as t
+import weakref
+
+from abc import ABC, abstractmethod
+
+from lawg.exceptions import LawgSharedMemoryError
+from lawg.typings import C
+
+try:
+    import fcntl
+except ImportError:
+    # not on windows
+    fcntl = None  # type: ignore
+
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:
+    # before python 3.8
+    resource_tracker = shared_memory = None  # type: ignore
+
+
+# --- LAYOUT --- #
+
+# magic, number of process slots, number of insights, length of the insight ids, followed by the
+# ids, the totals sent per insight, the pid attached to each row, and the rows of values
+_HEADER = struct.Struct("8sIII4x")
+_MAGIC = b"lawgshm1"
+
+
+def _align(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # running as another user
+        return True
+    return True
+
+
+def _after_fork(ref: weakref.ref[BaseSharedIncrements[t.Any]]) -> None:
+    shared = ref()
+    if shared is not None and not shared._closed:
+        shared._after_fork()
+
+
+class BaseSharedIncrements(ABC, t.Generic[C]):
+    """
+    Insight increments summed in shared memory by every process of a deployment, and sent by one.
+
+    The segment holds a row per process with a slot per insight. A process only ever adds into
+    its own row, so rows need no lock between processes. One process at a time is elected to
+    flush, by holding a lock file: it sums the slots of every row and sends the difference from
+    the totals already sent, which are kept in the segment too. When the flusher exits, the next
+    process to try the lock takes over from those totals.
+
+    Rows are never reset, so the increments of a process that exited, even without flushing, are
+    still sent by the flusher, and a process starting later keeps adding into the same values.
+    """
+
+    __slots__ = (
+        "client",
+        "ids",
+        "name",
+        "interval",
+        "processes",
+        "_columns",
+        "_shm",
+        "_sent",
+        "_pids",
+        "_values",
+        "_slot",
+        "_offset",
+        "_setup_fd",
+        "_flush_fd",
+        "_flusher",
+        "_add_lock",
+        "_closed",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        client: C,
+        ids: t.Iterable[str],
+        *,
+        name: str | None = None,
+        interval: float = 1.0,
+        processes: int = 64,
+    ) -> None:
+        super().__init__()
+        if fcntl is None or shared_memory is None:
+            msg = "Shared increments need POSIX shared memory and file locks, which this platform doesn't have."
+            raise LawgSharedMemoryError(msg)
+
+        self.client: C = client
+        # sorted so every process lays the slots out the same way
+        self.ids = sorted(set(ids))
+        self.name = name or self._default_name(client.project, self.ids)
+        self.interval = interval
+        # the most processes attached at once, decided by the first one
+        self.processes = processes
+        self._columns = {insight_id: column for column, insight_id in enumerate(self.ids)}
+        # threads of a process share its row
+        self._add_lock = threading.Lock()
+        self._flusher = False
+        self._closed = False
+        self._open_locks()
+        try:
+            self._attach()
+        except BaseException:
+            self._close_locks()
+            raise
+        # a forked worker gets a row of its own
+        os.register_at_fork(after_in_child=functools.partial(_after_fork, weakref.ref(self)))
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} name={self.name!r} flusher={self._flusher!r} project={self.client.project!r}>"
+
+    def __contains__(self, id: object) -> bool:
+        return id in self._columns
+
+    @staticmethod
+    def _default_name(project: str, ids: list[str]) -> str:
+        # short enough for macos, and a new segment whenever the insights change
+        digest = hashlib.blake2b("\n".join([project, *ids]).encode(), digest_size=10).hexdigest()
+        return f"lawg-{digest}"
+
+    # --- SEGMENT --- #
+
+    def _open_locks(self) -> None:
+        directory = tempfile.gettempdir()
+        self._setup_fd = os.open(os.path.join(directory, f"{self.name}.lock"), os.O_RDWR | os.O_CREAT, 0o600)
+        self._flush_fd = os.open(os.path.join(directory, f"{self.name}.flush"), os.O_RDWR | os.O_CREAT, 0o600)
+
+    def _open(self, create: bool, size: int = 0) -> shared_memory.SharedMemory:
+        if sys.version_info >= (3, 13):
+            return shared_memory.SharedMemory(self.name, create=create, size=size, track=False)
+        shm = shared_memory.SharedMemory(self.name, create=create, size=size)
+        # otherwise the segment is unlinked as soon as any process that opened it exits
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore
+        return shm
+
+    def _attach(self) -> None:
+        """Open the segment, creating it if this is the first process, and claim a row."""
+        ids = "\n".join(self.ids).encode()
+        count = len(self.ids)
+        fcntl.flock(self._setup_fd, fcntl.LOCK_EX)
+        try:
+            try:
+                size = _HEADER.size + _align(len(ids)) + 8 * count + 8 * self.processes * (count + 1)
+                self._shm = self._open(True, size)
+                buf = self._buf()
+                _HEADER.pack_into(buf, 0, _MAGIC, self.processes, count, len(ids))
+                buf[_HEADER.size : _HEADER.size + len(ids)] = ids
+            except FileExistsError:
+                self._shm = self._open(False)
+                buf = self._buf()
+                self._check(buf, ids)
+
+            offset = _HEADER.size + _align(len(ids))
+            self._sent = buf[offset : offset + 8 * count].cast("d")
+            offset += 8 * count
+            self._pids = buf[offset : offset + 8 * self.processes].cast("q")
+            offset += 8 * self.processes
+            self._values = buf[offset : offset + 8 * self.processes * count].cast("d")
+            self._claim()
+        except BaseException:
+            self._unmap()
+            raise
+        finally:
+            fcntl.flock(self._setup_fd, fcntl.LOCK_UN)
+
+    def _buf(self) -> memoryview:
+        buf = self._shm.buf
+        if buf is None:
+            # only once the segment is closed
+            msg = f"The shared memory segment {self.name!r} is closed."
+            raise LawgSharedMemoryError(msg)
+        return buf
+
+    def _check(self, buf: memoryview, ids: bytes) -> None:
+        magic, processes, count, length = _HEADER.unpack_from(buf)
+        if magic != _MAGIC or count != len(self.ids) or bytes(buf[_HEADER.size : _HEADER.size + length]) != ids:
+            msg = f"The shared memory segment {self.name!r} holds other insights, pass another name."
+            raise LawgSharedMemoryError(msg)
+        self.processes = processes
+
+    def _claim(self) -> None:
+        """Take the row of no process, or of one that exited, holding the setup lock."""
+        for slot, pid in enumerate(self._pids):
+            if pid == 0 or not _alive(pid):
+                self._pids[slot] = os.getpid()
+                # the values left by a process that had the row are kept, and still sent
+                self._slot = slot
+                self._offset = slot * len(self.ids)
+                return
+        msg = f"All {self.processes} process slots of {self.name!r} are taken, pass a larger `processes`."
+        raise LawgSharedMemoryError(msg)
+
+    def _attached(self) -> bool:
+        """Whether any other process is attached, holding the setup lock."""
+        return any(pid and slot != self._slot and _alive(pid) for slot, pid in enumerate(self._pids))
+
+    def _leave(self, flush: bool = True) -> bool:
+        """
+        Give the row back and detach, unlinking the segment once nothing is attached or pending.
+
+        Returns whether it left: the last process attached stays, as the flusher, if increments
+        are pending and `flush` is set, so they're sent before it leaves.
+        """
+        fcntl.flock(self._setup_fd, fcntl.LOCK_EX)
+        try:
+            alone = not self._attached()
+            pending = bool(self._deltas())
+            if alone and pending and flush and self._elect():
+                return False
+            self._pids[self._slot] = 0
+            # anything unsent is kept for the next process to open the segment
+            if alone and not pending:
+                if sys.version_info < (3, 13):
+                    # unlinking unregisters it from the resource tracker again
+                    resource_tracker.register(self._shm._name, "shared_memory")  # type: ignore
+                self._shm.unlink()
+            self._resign()
+        finally:
+            fcntl.flock(self._setup_fd, fcntl.LOCK_UN)
+        self._unmap()
+        self._close_locks()
+        return True
+
+    def _unmap(self) -> None:
+        for view in ("_values", "_pids", "_sent"):
+            if hasattr(self, view):
+                getattr(self, view).release()
+        if hasattr(self, "_shm"):
+            self._shm.close()
+
+    def _close_locks(self) -> None:
+        os.close(self._flush_fd)
+        os.close(self._setup_fd)
+
+    def _after_fork(self) -> None:
+        # the mapping is inherited, the lock files and the row belong to the parent
+        self._flusher = False
+        self._add_lock = threading.Lock()
+        # closing the inherited copies leaves the parent's locks held, unlocking them wouldn't
+        self._close_locks()
+        self._open_locks()
+        fcntl.flock(self._setup_fd, fcntl.LOCK_EX)
+        try:
+            self._claim()
+        finally:
+            fcntl.flock(self._setup_fd, fcntl.LOCK_UN)
+        self._forked()
+
+    def _forked(self) -> None:
+        """Forget the flushing loop of the parent, which didn't survive the fork."""
+
+    # --- FLUSHING --- #
+
+    def _elect(self) -> bool:
+        """Try to become the flusher, which the process stays until it closes."""
+        if not self._flusher:
+            try:
+                fcntl.flock(self._flush_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return False
+            self._flusher = True
+        return True
+
+    def _resign(self) -> None:
+        if self._flusher:
+            self._flusher = False
+            fcntl.flock(self._flush_fd, fcntl.LOCK_UN)
+
+    def _deltas(self) -> list[tuple[int, str, float, float]]:
+        """The column, id, total and unsent increment of each insight with increments to send."""
+        count = len(self.ids)
+        totals = [0.0] * count
+        for index, value in enumerate(self._values):
+            totals[index % count] += value
+        return [
+            (column, self.ids[column], total, total - self._sent[column])
+            for column, total in enumerate(totals)
+            if total != self._sent[column]
+        ]
+
+    @property
+    def flusher(self) -> bool:
+        """Whether this process is the one sending the increments."""
+        return self._flusher
+
+    @property
+    def pending(self) -> dict[str, float]:
+        """The increments added by every process and not sent yet, by insight."""
+        return {insight_id: delta for _, insight_id, _, delta in self._deltas()}
+
+    def add(self, id: str, value: float) -> None:
+        """
+        Add an increment into this process's slot for the insight.
+
+        Args:
+            id (str): The id of the insight, one of `ids`.
+            value (float): The value to increment the insight by.
+        Raises:
+            KeyError: If the insight isn't one of `ids`.
+        """
+        index = self._offset + self._columns[id]
+        with self._add_lock:
+            self._values[index] += value
+
+    @abstractmethod
+    def flush(self) -> t.Awaitable[None] | None:
+        """
+        Send the increments of every process since the last flush, if this process is the flusher.
+        """
+
+    @abstractmethod
+    def close(self) -> t.Awaitable[None] | None:
+        """
+        Stop flushing, send what's pending unless another process is the flusher, and detach.
+        """
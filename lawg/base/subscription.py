@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import json
+import logging
+import random
+import typing as t
+
+from abc import ABC, abstractmethod
+
+from marshmallow import ValidationError
+
+from lawg import pika
+from lawg.exceptions import LawgHTTPError
+from lawg.schemas import WebsocketFeedEvent, prebuilt
+from lawg.typings import C, E
+
+try:
+    import websockets.asyncio.client
+    import websockets.exceptions
+    import websockets.sync.client
+except ImportError:  # pragma: no cover - optional dependency
+    websockets = None  # type: ignore[assignment]
+
+if t.TYPE_CHECKING:
+    from lawg.mirror import EventMirror
+
+
+logger = logging.getLogger(__name__)
+
+
+class FeedChange(t.NamedTuple):
+    """An event created, updated or deleted in a subscribed feed."""
+
+    # "EVENT_CREATE", "EVENT_UPDATE" or "EVENT_DELETE"
+    type: str
+    event: t.Any
+
+
+class BaseSubscription(ABC, t.Generic[C, E]):
+    """
+    A live subscription to a feed's events over a websocket.
+
+    The API pushes a frame whenever an event of the feed is created, updated or deleted. Dropped
+    connections are reopened with exponential backoff, and the events created while disconnected
+    are fetched from the API, oldest first, before the pushed ones; changes to older events
+    made while disconnected are not replayed. If a mirror is given, every change is written to it.
+    """
+
+    __slots__ = (
+        "client",
+        "feed",
+        "mirror",
+        "url",
+        "reconnect_delay",
+        "max_reconnect_delay",
+        "last_id",
+        "_last_snowflake",
+        "_closed",
+    )
+
+    def __init__(
+        self,
+        client: C,
+        feed: str,
+        *,
+        mirror: EventMirror | None = None,
+        since: str | None = None,
+        url: str | None = None,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+    ) -> None:
+        if websockets is None:
+            msg = "subscriptions require websockets 13 or newer to be installed"
+            raise ModuleNotFoundError(msg)
+        super().__init__()
+        self.client = client
+        self.feed = feed
+        self.mirror = mirror
+        self.url = url or client.rest.API_FEED_WEBSOCKET.format(namespace=client.project, feed=feed)
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        if since is None and mirror is not None:
+            since = mirror.last_id(feed)
+        # the newest event seen, which events created while disconnected are fetched after
+        self.last_id: str | None = since
+        self._last_snowflake = -1 if since is None else pika.snowflake(since)
+        self._closed = False
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} feed={self.feed!r} last_id={self.last_id!r} project={self.client.project!r}>"
+
+    @property
+    def closed(self) -> bool:
+        """Whether the subscription was closed."""
+        return self._closed
+
+    def _connect_options(self) -> dict[str, t.Any]:
+        return {
+            "additional_headers": {"Authorization": self.client.token},
+            "user_agent_header": self.client.rest.USER_AGENT,
+        }
+
+    def _reconnect_delay(self, attempt: int) -> float:
+        # jitter, so clients dropped together don't reconnect together; nothing secret depends on it
+        return min(self.max_reconnect_delay, self.reconnect_delay * 2**attempt) * random.uniform(0.5, 1.0)  # noqa: S311
+
+    def _check_rejection(self, exc: Exception) -> None:
+        """Raise the error of a refused handshake, unless it's worth retrying."""
+        if not isinstance(exc, websockets.exceptions.InvalidStatus):  # type: ignore
+            return
+        status_code = exc.response.status_code
+        if status_code in self.client.rest.RETRY_STATUSES:
+            return
+        error_cls = self.client.rest.ERROR_STATUSES.get(status_code, LawgHTTPError)
+        msg = f"the subscription was refused with status {status_code}"
+        raise error_cls(status_code=status_code, message=msg) from exc
+
+    def _change(self, message: str | bytes) -> FeedChange | None:
+        """Get the change a frame pushed, or None if it's malformed, of another feed or already seen."""
+        try:
+            frame = prebuilt(WebsocketFeedEvent).load(json.loads(message))
+        except (ValueError, ValidationError):
+            logger.warning("ignoring a malformed frame of the %r subscription", self.feed)
+            return None
+        data = frame["d"]
+        if data["project"] != self.client.project or data["feed"] != self.feed:
+            return None
+        event_data = data["event"]
+        if frame["e"] == "EVENT_CREATE" and pika.snowflake(event_data["id"]) <= self._last_snowflake:
+            # already fetched after reconnecting
+            return None
+        return self._apply(frame["e"], self.client._construct_event(self.feed, event_data))
+
+    def _caught_up(self, events: list[E]) -> list[FeedChange]:
+        """Get the changes of the events created while disconnected, fetched newest first."""
+        return [self._apply("EVENT_CREATE", event) for event in reversed(events)]
+
+    def _apply(self, type: str, event: E) -> FeedChange:
+        if type == "EVENT_CREATE":
+            snowflake = pika.snowflake(event.id)
+            if snowflake > self._last_snowflake:
+                self.last_id, self._last_snowflake = event.id, snowflake
+        if self.mirror is not None:
+            if type == "EVENT_DELETE":
+                self.mirror.delete([event.id])
+            else:
+                self.mirror.store(self.feed, [event])
+                if type == "EVENT_CREATE":
+                    self.mirror.advance(self.feed, event.id)
+        return FeedChange(type, event)
+
+    @abstractmethod
+    def close(self) -> t.Awaitable[None] | None:
+        """
+        Close the connection and end iteration.
+        """
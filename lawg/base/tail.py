@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import logging
+import typing as t
+
+from abc import ABC, abstractmethod
+
+from lawg.typings import C, E
+
+logger = logging.getLogger(__name__)
+
+
+class BaseFeedPoller(ABC, t.Generic[C, E]):
+    """
+    Polls a feed for the events created since the last poll, on behalf of every tail of the feed.
+
+    Each poll asks for the newest page only, and for older pages just while they're all new. The
+    interval between polls doubles after each poll that finds nothing, up to `max_interval`, and
+    halves after each poll that finds events, down to `min_interval`. A poll that fills a whole
+    page means the feed is bursting, so the next one is as soon as `min_interval` allows.
+    """
+
+    __slots__ = ("client", "feed", "page_size", "min_interval", "max_interval", "interval", "last_id", "_started")
+
+    def __init__(
+        self,
+        client: C,
+        feed: str,
+        *,
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        page_size: int = 100,
+    ) -> None:
+        super().__init__()
+        self.client = client
+        self.feed = feed
+        self.page_size = page_size
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        # the seconds until the next poll
+        self.interval = min_interval
+        # the newest event seen, None until the first poll or while the feed is empty
+        self.last_id: str | None = None
+        self._started = False
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} feed={self.feed!r} interval={self.interval!r} project={self.client.project!r}>"
+
+    def _seen(self, events: list[E]) -> list[E]:
+        """Record the events found by a poll, fetched newest first, and return them oldest first."""
+        if events:
+            self.last_id = events[0].id
+        count = len(events)
+        if count >= self.page_size:
+            self.interval = self.min_interval
+        elif count:
+            self.interval = max(self.min_interval, self.interval / 2)
+        else:
+            self.interval = min(self.max_interval, self.interval * 2)
+        events.reverse()
+        return events
+
+    def _failed(self, exc: Exception) -> None:
+        logger.warning("failed to poll the %r feed: %s", self.feed, exc)
+        self.interval = min(self.max_interval, self.interval * 2)
+
+    def _start(self, newest: E | None) -> None:
+        """Take the newest event when the first tail attached as the point tails start after."""
+        self._started = True
+        if newest is not None:
+            self.last_id = newest.id
+
+    @property
+    @abstractmethod
+    def tails(self) -> int:
+        """
+        The number of tails attached.
+        """
+
+
+class BaseTail(ABC, t.Generic[E]):
+    """
+    A subscriber to a feed's poller, receiving the events created after it attached, oldest first.
+    """
+
+    __slots__ = ("feed", "_closed")
+
+    def __init__(self, feed: str) -> None:
+        super().__init__()
+        self.feed = feed
+        self._closed = False
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} feed={self.feed!r} closed={self._closed!r}>"
+
+    @property
+    def closed(self) -> bool:
+        """Whether the tail was closed."""
+        return self._closed
+
+    @abstractmethod
+    def put(self, events: list[E]) -> None:
+        """
+        Deliver the events found by a poll.
+
+        Args:
+            events (list[Event]): The new events, oldest first.
+        """
+
+    @abstractmethod
+    def close(self) -> t.Awaitable[None] | None:
+        """
+        Detach from the poller and end iteration, stopping the poller if it was the last tail.
+        """
@@ -0,0 +1,376 @@
+"""lawg.py columnar event storage, for scanning many events without an object per event."""
+
+from __future__ import annotations
+
+import array
+import collections
+import json
+import typing as t
+
+from lawg import pika
+from lawg.typings import E
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None  # type: ignore[assignment]
+
+try:
+    import pyarrow
+    import pyarrow.compute
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None  # type: ignore[assignment]
+
+if t.TYPE_CHECKING:
+    from lawg.typings import STR_DICT
+
+_encode_tags = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+# --- COLUMNS --- #
+
+# the snowflake of an id that isn't a pika id, which sorts before every real snowflake
+IRREGULAR = -1
+
+
+class _IdColumn:
+    """Event ids stored as their snowflakes, rebuilt into ids when read."""
+
+    __slots__ = ("prefix", "snowflakes", "irregular")
+
+    def __init__(self, prefix: str) -> None:
+        self.prefix = prefix
+        self.snowflakes = array.array("q")
+        # ids that don't round-trip through their snowflake, by row
+        self.irregular: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.snowflakes)
+
+    def append(self, id: str) -> None:
+        try:
+            snowflake = pika.snowflake(id)
+        except ValueError:
+            snowflake = IRREGULAR
+        if not 0 <= snowflake < 1 << 63:
+            snowflake = IRREGULAR
+        if snowflake == IRREGULAR or pika.encode(self.prefix, snowflake) != id:
+            self.irregular[len(self.snowflakes)] = id
+        self.snowflakes.append(snowflake)
+
+    def __getitem__(self, index: int) -> str:
+        irregular = self.irregular.get(index)
+        return pika.encode(self.prefix, self.snowflakes[index]) if irregular is None else irregular
+
+    def to_list(self) -> list[str]:
+        return [self[index] for index in range(len(self))]
+
+
+class _InternedColumn:
+    """Each distinct value stored once in a table, rows hold an index into the table."""
+
+    __slots__ = ("values", "codes", "_codes_by_value")
+
+    def __init__(self) -> None:
+        self.values: list[t.Any] = []
+        self.codes = array.array("I")
+        self._codes_by_value: dict[t.Any, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def append(self, value: t.Any) -> None:
+        code = self._codes_by_value.get(value)
+        if code is None:
+            code = self._codes_by_value[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def __getitem__(self, index: int) -> t.Any:
+        return self.values[self.codes[index]]
+
+    def to_list(self) -> list[t.Any]:
+        values = self.values
+        return [values[code] for code in self.codes]
+
+    def counts(self) -> dict[t.Any, int]:
+        values = self.values
+        return {values[code]: count for code, count in collections.Counter(self.codes).most_common()}
+
+
+class _TextColumn:
+    """Strings stored back to back in one utf-8 buffer, delimited by an array of offsets."""
+
+    __slots__ = ("data", "offsets", "valid")
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+        self.offsets = array.array("q", [0])
+        # 1 for each row holding a string, 0 for None
+        self.valid = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    def append(self, value: str | None) -> None:
+        if value is None:
+            self.valid.append(0)
+        else:
+            self.data += value.encode("utf-8")
+            self.valid.append(1)
+        self.offsets.append(len(self.data))
+
+    def __getitem__(self, index: int) -> str | None:
+        if not self.valid[index]:
+            return None
+        return self.data[self.offsets[index] : self.offsets[index + 1]].decode("utf-8")
+
+    def to_list(self) -> list[str | None]:
+        return [self[index] for index in range(len(self))]
+
+
+# --- BATCH --- #
+
+
+class EventBatch(t.Generic[E]):
+    """Events stored column by column, with event objects created only when they're accessed.
+
+    Ids are kept as 64-bit snowflakes, titles, emojis and parent ids as indexes into tables of
+    their distinct values, and descriptions and tags (as JSON) in a single buffer each. A million
+    events therefore take a handful of arrays rather than a million objects, and columns can be
+    aggregated, or exported to NumPy or pyarrow, without building any events.
+
+    Example:
+        >>> batch = client.fetch_event_batch(feed="signups", limit=100_000)
+        >>> batch.value_counts("title")
+        {'pro signup': 61230, 'free signup': 38770}
+        >>> batch[0]
+        <Event id='event_...' ...>
+    """
+
+    COLUMNS = ("id", "project_id", "feed_id", "title", "description", "emoji", "tags")
+    # columns stored as indexes into a table of their distinct values
+    INTERNED = ("project_id", "feed_id", "title", "emoji")
+
+    __slots__ = ("client", "feed", "_columns")
+
+    def __init__(self, client: t.Any, feed: str, events_data: t.Iterable[STR_DICT] = ()) -> None:
+        """Initialize the batch.
+
+        Args:
+            client (Client | AsyncClient): The client events are created for.
+            feed (str): The name of the feed.
+            events_data (Iterable[dict[str, Any]], optional): The events' data, as loaded by `EventSchema`.
+        """
+        self.client = client
+        self.feed = feed
+        self._columns: dict[str, t.Any] = {
+            "id": _IdColumn("event"),
+            "project_id": _InternedColumn(),
+            "feed_id": _InternedColumn(),
+            "title": _InternedColumn(),
+            "description": _TextColumn(),
+            "emoji": _InternedColumn(),
+            "tags": _TextColumn(),
+        }
+        self.extend(events_data)
+
+    def __repr__(self) -> str:
+        """Represent the batch by its feed and size."""
+        return f"<{self.__class__.__name__} feed={self.feed!r} events={len(self)}>"
+
+    def __len__(self) -> int:
+        """Get the number of events."""
+        return len(self._columns["id"])
+
+    def __getstate__(self) -> tuple[str, dict[str, t.Any]]:
+        """Get the state to pickle, without the client."""
+        # pickled without the client, e.g. to encode in another process; unpickled batches have none
+        return self.feed, self._columns
+
+    def __setstate__(self, state: tuple[str, dict[str, t.Any]]) -> None:
+        """Restore a pickled batch, which has no client."""
+        self.client = None
+        self.feed, self._columns = state
+
+    @t.overload
+    def __getitem__(self, index: int) -> E:
+        """Get an event by index."""
+
+    @t.overload
+    def __getitem__(self, index: slice) -> list[E]:
+        """Get the events of a slice."""
+
+    def __getitem__(self, index: int | slice) -> E | list[E]:
+        """Get an event by index, or the events of a slice."""
+        if isinstance(index, slice):
+            return [self._event(position) for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "event index out of range"
+            raise IndexError(msg)
+        return self._event(index)
+
+    def __iter__(self) -> t.Iterator[E]:
+        """Iterate over the events."""
+        for index in range(len(self)):
+            yield self._event(index)
+
+    def _event(self, index: int) -> E:
+        return self.client._construct_event(self.feed, self.row(index))
+
+    # --- WRITES --- #
+
+    def append(self, event_data: STR_DICT) -> None:
+        """Add an event.
+
+        Args:
+            event_data (dict[str, Any]): The event's data, as loaded by `EventSchema`.
+        """
+        columns = self._columns
+        columns["id"].append(event_data["id"])
+        columns["project_id"].append(event_data["project_id"])
+        columns["feed_id"].append(event_data["feed_id"])
+        columns["title"].append(event_data["title"])
+        columns["description"].append(event_data["description"])
+        columns["emoji"].append(event_data["emoji"])
+        tags = event_data["tags"]
+        columns["tags"].append(None if tags is None else _encode_tags(tags))
+
+    def extend(self, events_data: t.Iterable[STR_DICT]) -> None:
+        """Add events, consuming them one at a time.
+
+        Args:
+            events_data (Iterable[dict[str, Any]]): The events' data, as loaded by `EventSchema`.
+        """
+        for event_data in events_data:
+            self.append(event_data)
+
+    # --- READS --- #
+
+    def row(self, index: int) -> STR_DICT:
+        """Get an event's data without creating the event.
+
+        Args:
+            index (int): The position of the event.
+        """
+        event_data = {name: column[index] for name, column in self._columns.items()}
+        if event_data["tags"] is not None:
+            event_data["tags"] = json.loads(event_data["tags"])
+        return event_data
+
+    def column(self, name: str) -> list[t.Any]:
+        """Get every value of a column.
+
+        Args:
+            name (str): The name of the column, one of `COLUMNS`.
+        """
+        values = self._column(name).to_list()
+        if name == "tags":
+            values = [None if tags is None else json.loads(tags) for tags in values]
+        return values
+
+    def _column(self, name: str) -> t.Any:
+        try:
+            return self._columns[name]
+        except KeyError:
+            msg = f"unknown column {name!r}, expected one of {', '.join(self.COLUMNS)}"
+            raise KeyError(msg) from None
+
+    @property
+    def snowflakes(self) -> array.array[int]:
+        """The snowflakes of the events' ids, which order them by creation time, `IRREGULAR` for non-pika ids."""
+        return self._columns["id"].snowflakes
+
+    def timestamps(self) -> array.array[int]:
+        """The unix milliseconds each event was created at, as encoded in its id."""
+        shift, epoch = pika.TIMESTAMP_SHIFT, pika.EPOCH
+        return array.array("q", [(snowflake >> shift) + epoch for snowflake in self.snowflakes])
+
+    def value_counts(self, name: str) -> dict[t.Any, int]:
+        """Count the events per value of a column, most common first, without reading any event.
+
+        Args:
+            name (str): The name of the column, one of `INTERNED`.
+        """
+        if name not in self.INTERNED:
+            msg = f"value counts need one of the interned columns {', '.join(self.INTERNED)}"
+            raise ValueError(msg)
+        return self._columns[name].counts()
+
+    # --- EXPORT --- #
+
+    def to_numpy(self) -> dict[str, t.Any]:
+        """Export the columns as NumPy arrays.
+
+        Ids are exported as int64 snowflakes along with a datetime64 "created_at" column, strings
+        and tags as object arrays.
+
+        Raises:
+            ModuleNotFoundError: If numpy isn't installed.
+        """
+        if numpy is None:
+            msg = "to_numpy requires numpy to be installed"
+            raise ModuleNotFoundError(msg)
+
+        snowflakes = numpy.array(self.snowflakes, dtype=numpy.int64)
+        arrays: dict[str, t.Any] = {
+            "snowflake": snowflakes,
+            "created_at": ((snowflakes >> pika.TIMESTAMP_SHIFT) + pika.EPOCH).astype("datetime64[ms]"),
+        }
+        for name in self.COLUMNS:
+            column = self._columns[name]
+            if isinstance(column, _InternedColumn):
+                values = numpy.empty(len(column.values), dtype=object)
+                values[:] = column.values
+                arrays[name] = values[numpy.array(column.codes, dtype=numpy.intp)]
+            else:
+                values = numpy.empty(len(column), dtype=object)
+                values[:] = self.column(name)
+                arrays[name] = values
+        return arrays
+
+    def to_arrow(self) -> t.Any:
+        """Export the columns as a `pyarrow.Table`.
+
+        Interned columns become dictionary arrays and text columns are built from the batch's
+        buffers. Ids are exported along with their int64 snowflakes, and tags as JSON text.
+
+        Raises:
+            ModuleNotFoundError: If pyarrow isn't installed.
+        """
+        if pyarrow is None:
+            msg = "to_arrow requires pyarrow to be installed"
+            raise ModuleNotFoundError(msg)
+
+        length = len(self)
+        columns: dict[str, t.Any] = {
+            "id": pyarrow.array(self._columns["id"].to_list(), pyarrow.string()),
+            "snowflake": pyarrow.Array.from_buffers(
+                pyarrow.int64(), length, [None, pyarrow.py_buffer(self.snowflakes.tobytes())]
+            ),
+        }
+        for name in self.COLUMNS[1:]:
+            column = self._columns[name]
+            if isinstance(column, _InternedColumn):
+                codes = pyarrow.Array.from_buffers(
+                    pyarrow.uint32(), length, [None, pyarrow.py_buffer(column.codes.tobytes())]
+                )
+                values = column.values
+                if None in values:
+                    # nulls are marked on the rows, dictionaries can't hold them
+                    null_code = values.index(None)
+                    codes = pyarrow.compute.if_else(pyarrow.compute.equal(codes, null_code), None, codes)
+                    values = [value if index != null_code else "" for index, value in enumerate(values)]
+                columns[name] = pyarrow.DictionaryArray.from_arrays(codes, pyarrow.array(values, pyarrow.string()))
+            else:
+                validity = None
+                if 0 in column.valid:
+                    validity = pyarrow.array([bool(valid) for valid in column.valid], pyarrow.bool_()).buffers()[1]
+                columns[name] = pyarrow.Array.from_buffers(
+                    pyarrow.large_string(),
+                    length,
+                    [validity, pyarrow.py_buffer(column.offsets.tobytes()), pyarrow.py_buffer(bytes(column.data))],
+                )
+        return pyarrow.table(columns)
@@ -0,0 +1,396 @@
+"""lawg.py response caching."""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import tempfile
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+
+if t.TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from lawg.typings import PATH
+
+
+class CacheStats(t.NamedTuple):
+    """Snapshot of response cache statistics."""
+
+    hits: int
+    misses: int
+    revalidations: int
+    evictions: int
+    entries: int
+    size: int
+
+
+class CacheEntry:
+    """A cached API response."""
+
+    __slots__ = ("data", "etag", "size", "expires_at")
+
+    def __init__(self, data: t.Any, etag: str | None, size: int, expires_at: float) -> None:
+        """Initialize the cache entry.
+
+        Args:
+            data (Any): The loaded response data.
+            etag (str, optional): The ETag the API sent with the response.
+            size (int): The size of the response body in bytes.
+            expires_at (float): The monotonic time after which the entry must be revalidated.
+        """
+        self.data = data
+        self.etag = etag
+        self.size = size
+        self.expires_at = expires_at
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the entry can be served without contacting the API."""
+        return time.monotonic() < self.expires_at
+
+
+class ResponseCache:
+    """An LRU cache of loaded API responses, bounded by response size in bytes.
+
+    Entries are keyed by the final request url and expire after a per-endpoint TTL. Expired entries
+    that carried an ETag are revalidated with `If-None-Match`, so an unchanged resource costs a
+    `304` instead of a full response and schema load.
+    """
+
+    __slots__ = (
+        "max_size",
+        "default_ttl",
+        "ttls",
+        "hits",
+        "misses",
+        "revalidations",
+        "evictions",
+        "_entries",
+        "_size",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 8 * 1024 * 1024,
+        default_ttl: float = 30.0,
+        ttls: Mapping[str, float] | None = None,
+    ) -> None:
+        """Initialize the response cache.
+
+        Args:
+            max_size (int, optional): The maximum total size of cached response bodies in bytes.
+            default_ttl (float, optional): Seconds a response stays fresh when its endpoint has no TTL.
+            ttls (Mapping[str, float], optional): Seconds a response stays fresh, keyed by endpoint
+                url template (e.g. `Rest.API_GET_PROJECT`). A TTL of 0 always revalidates.
+        """
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self.ttls: dict[str, float] = dict(ttls or {})
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Represent the cache by its size."""
+        return f"<{self.__class__.__name__} entries={len(self._entries)} size={self._size} max_size={self.max_size}>"
+
+    def __len__(self) -> int:
+        """Get the number of cached responses."""
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        """The current cache statistics."""
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            revalidations=self.revalidations,
+            evictions=self.evictions,
+            entries=len(self._entries),
+            size=self._size,
+        )
+
+    def ttl(self, endpoint: str) -> float:
+        """Get the TTL of an endpoint.
+
+        Args:
+            endpoint (str): The url template of the endpoint.
+        """
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def lookup(self, key: str) -> tuple[CacheEntry | None, bool]:
+        """Look up a response, counting a hit if it is still fresh.
+
+        Args:
+            key (str): The cache key of the request.
+
+        Returns:
+            The entry, fresh or not, or None if nothing is cached, and whether it is fresh.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, False
+            self._entries.move_to_end(key)
+            fresh = entry.is_fresh
+            if fresh:
+                self.hits += 1
+            return entry, fresh
+
+    def store(self, key: str, endpoint: str, data: t.Any, etag: str | None, size: int) -> None:
+        """Store a freshly loaded response, counting a miss.
+
+        Args:
+            key (str): The cache key of the request.
+            endpoint (str): The url template of the endpoint.
+            data (Any): The loaded response data.
+            etag (str, optional): The ETag the API sent with the response.
+            size (int): The size of the response body in bytes.
+        """
+        with self._lock:
+            self.misses += 1
+            if size > self.max_size:
+                return
+            self._discard(key)
+            self._entries[key] = CacheEntry(data, etag, size, time.monotonic() + self.ttl(endpoint))
+            self._size += size
+            self._evict()
+
+    def revalidate(self, key: str, endpoint: str, entry: CacheEntry) -> None:
+        """Mark a response as unchanged after a `304`.
+
+        Args:
+            key (str): The cache key of the request.
+            endpoint (str): The url template of the endpoint.
+            entry (CacheEntry): The entry that was revalidated.
+        """
+        with self._lock:
+            entry.expires_at = time.monotonic() + self.ttl(endpoint)
+            self.hits += 1
+            self.revalidations += 1
+            # an entry evicted or invalidated while the request was in flight stays out of the cache
+            if self._entries.get(key) is entry:
+                self._entries.move_to_end(key)
+
+    def invalidate(self, prefix: str = "") -> None:
+        """Drop every cached response under a url.
+
+        Args:
+            prefix (str, optional): The url to drop, along with everything below it. Defaults to dropping everything.
+        """
+        with self._lock:
+            if not prefix:
+                keys = list(self._entries)
+            else:
+                children = (f"{prefix}/", f"{prefix}?")
+                keys = [key for key in self._entries if key == prefix or key.startswith(children)]
+            for key in keys:
+                self._discard(key)
+
+    def clear(self) -> None:
+        """Drop every cached response and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = self.misses = self.revalidations = self.evictions = 0
+
+    @staticmethod
+    def copy(data: t.Any) -> t.Any:
+        """Copy cached data before handing it out, so callers can't mutate the cache."""
+        return copy.deepcopy(data)
+
+    def _evict(self) -> None:
+        while self._size > self.max_size:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= evicted.size
+            self.evictions += 1
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
+
+
+class IdempotencyRecord:
+    """A bounded LRU record of idempotency keys the API acknowledged, with the data it responded with.
+
+    Sending a request again with an acknowledged key returns the recorded data instead, so replaying
+    a batch after a partial failure doesn't create its delivered events twice.
+    """
+
+    __slots__ = ("max_size", "_responses", "_lock")
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        """Initialize the record.
+
+        Args:
+            max_size (int, optional): The maximum number of keys to remember.
+        """
+        self.max_size = max_size
+        self._responses: OrderedDict[str, t.Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Represent the store by its size."""
+        return f"<{self.__class__.__name__} keys={len(self._responses)} max_size={self.max_size}>"
+
+    def __len__(self) -> int:
+        """Get the number of acknowledged keys."""
+        return len(self._responses)
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a key was acknowledged."""
+        return key in self._responses
+
+    def get(self, key: str) -> t.Any | None:
+        """Get a copy of the data acknowledged for a key.
+
+        Args:
+            key (str): The idempotency key.
+
+        Returns:
+            The data, or None if the key wasn't acknowledged or has been forgotten.
+        """
+        with self._lock:
+            data = self._responses.get(key)
+            if data is None:
+                return None
+            self._responses.move_to_end(key)
+        return copy.deepcopy(data)
+
+    def add(self, key: str, data: t.Any) -> None:
+        """Record an acknowledged key.
+
+        Args:
+            key (str): The idempotency key.
+            data (Any): The data the API responded with.
+        """
+        with self._lock:
+            self._responses[key] = copy.deepcopy(data)
+            self._responses.move_to_end(key)
+            while len(self._responses) > self.max_size:
+                self._responses.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget every key."""
+        with self._lock:
+            self._responses.clear()
+
+
+class InsightTitleCache:
+    """A map of insight titles to ids, optionally persisted to a local JSON file.
+
+    Persisting the map lets a process resolve insights by title on a warm start without
+    listing every insight of the project first.
+    """
+
+    __slots__ = ("path", "_ids", "_lock")
+
+    def __init__(self, path: PATH | None = None) -> None:
+        """Initialize the title cache, loading it from disk if the file exists.
+
+        Args:
+            path (str | os.PathLike, optional): The file to persist the map to.
+        """
+        self.path = path
+        self._ids: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+        if path is not None and os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as file:
+                    self._ids = dict(json.load(file))
+            except (OSError, ValueError, TypeError):
+                # a corrupt cache only costs a listing, it shouldn't stop the client from starting
+                self._ids = {}
+
+    def __repr__(self) -> str:
+        """Represent the cache by its size and file."""
+        return f"<{self.__class__.__name__} titles={len(self._ids)} path={self.path!r}>"
+
+    def __len__(self) -> int:
+        """Get the number of cached titles."""
+        return len(self._ids)
+
+    def __contains__(self, title: object) -> bool:
+        """Check whether a title's id is cached."""
+        return title in self._ids
+
+    def get(self, title: str) -> str | None:
+        """Get the id of an insight.
+
+        Args:
+            title (str): The title of the insight.
+        """
+        return self._ids.get(title)
+
+    def update(self, ids: Mapping[str, str]) -> None:
+        """Remember the ids of insights, persisting the map if anything changed.
+
+        Args:
+            ids (Mapping[str, str]): Insight ids keyed by title.
+        """
+        with self._lock:
+            changed = any(self._ids.get(title) != insight_id for title, insight_id in ids.items())
+            self._ids.update(ids)
+        if changed:
+            self.save()
+
+    def discard(self, title: str) -> None:
+        """Forget the id of an insight, e.g. after it was deleted.
+
+        Args:
+            title (str): The title of the insight.
+        """
+        with self._lock:
+            removed = self._ids.pop(title, None) is not None
+        if removed:
+            self.save()
+
+    def discard_id(self, insight_id: str) -> None:
+        """Forget every title of an insight, e.g. after it was deleted.
+
+        Args:
+            insight_id (str): The id of the insight.
+        """
+        with self._lock:
+            titles = [title for title, cached_id in self._ids.items() if cached_id == insight_id]
+            for title in titles:
+                del self._ids[title]
+        if titles:
+            self.save()
+
+    def clear(self) -> None:
+        """Forget every insight id."""
+        with self._lock:
+            self._ids.clear()
+        self.save()
+
+    def save(self) -> None:
+        """Persist the map to disk, if a path was given."""
+        if self.path is None:
+            return
+
+        with self._lock:
+            ids = dict(self._ids)
+        # write then rename, so a crash mid-write never leaves a truncated cache behind, through a
+        # file of its own as other processes may be saving the same cache
+        path = os.fspath(self.path)
+        fd, tmp_path = tempfile.mkstemp(prefix=f"{os.path.basename(path)}.", suffix=".tmp", dir=os.path.dirname(path) or None)
+        try:
+            with open(fd, "w", encoding="utf-8") as file:
+                json.dump(ids, file)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
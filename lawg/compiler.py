@@ -0,0 +1,354 @@
+"""lawg.py schema compiler, turning marshmallow schemas into specialized validation functions.
+
+Request schemas, and most response schemas, are plain sets of type, length, regex, range and union
+checks, which marshmallow evaluates through several layers of generic machinery per field.
+`compile_schema` generates the source of one function per schema, checking exactly those
+constraints inline.
+
+Compiled functions only decide that data is certainly valid. Whenever they can't, because a check
+fails or a field uses a feature the compiler doesn't support, loading falls back to the schema
+itself, so errors (and results) are always marshmallow's own.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import threading
+import typing as t
+
+from marshmallow import EXCLUDE, INCLUDE, fields, missing, validate
+from marshmallow_union import Union
+
+from lawg.schemas import PikaId
+
+if t.TYPE_CHECKING:
+    from marshmallow import Schema
+
+    from lawg.typings import STR_DICT
+
+
+class _Fallback:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "FALLBACK"
+
+
+# returned by compiled functions when the data must be loaded by the schema instead
+FALLBACK: t.Any = _Fallback()
+
+CompiledSchema = t.Callable[[t.Any], t.Any]
+
+# how a union candidate handles a value of an exact type: it rejects it and the next candidate is
+# tried, it loads it exactly like the compiled checks do, or its result can't be predicted
+_REJECT, _ACCEPT, _UNKNOWN = 0, 1, 2
+_UNION_OUTCOMES: dict[type, dict[type, int]] = {
+    fields.String: {str: _ACCEPT, int: _REJECT, float: _REJECT, bool: _REJECT},
+    fields.Integer: {str: _UNKNOWN, int: _ACCEPT, float: _UNKNOWN, bool: _REJECT},
+    fields.Float: {str: _UNKNOWN, int: _ACCEPT, float: _ACCEPT, bool: _REJECT},
+    fields.Boolean: {str: _UNKNOWN, int: _UNKNOWN, float: _UNKNOWN, bool: _ACCEPT},
+}
+
+
+class _UnsupportedError(Exception):
+    """Raised while compiling a field the compiler can't check."""
+
+
+class _Compiler:
+    """Generates the source of one schema's function, and of the nested schemas it uses."""
+
+    def __init__(self, namespace: dict[str, t.Any]) -> None:
+        self.namespace = namespace
+        self.lines: list[str] = []
+        self._names = itertools.count()
+
+    def name(self, prefix: str) -> str:
+        return f"{prefix}{next(self._names)}"
+
+    def constant(self, value: t.Any) -> str:
+        name = self.name("_c")
+        self.namespace[name] = value
+        return name
+
+    def schema(self, schema: Schema) -> str:
+        """Emit the function of a schema, returning its name."""
+        function = self.name("_schema")
+        lines = [
+            f"def {function}(data):",
+            "    if type(data) is not dict:",
+            "        return FALLBACK",
+            "    out = {}",
+            "    seen = 0",
+        ]
+        for name, field in schema.load_fields.items():
+            key = repr(name)
+            if field.required:
+                absent = "        return FALLBACK"
+            elif field.load_default is not missing:
+                # marshmallow hands the default out as is, calling it first if it's callable
+                default = self.constant(field.load_default)
+                absent = f"        out[{key}] = {default}()" if callable(field.load_default) else f"        out[{key}] = {default}"
+            else:
+                absent = "        pass"
+            lines += [
+                f"    v = data.get({key}, MISSING)",
+                "    if v is MISSING:",
+                absent,
+                "    else:",
+                "        seen += 1",
+                "        if v is None:",
+                f"            out[{key}] = None" if field.allow_none else "            return FALLBACK",
+                "        else:",
+            ]
+            try:
+                body = self.field(field, "v", 3)
+            except _UnsupportedError:
+                if field.required and not field.allow_none:
+                    # every load would fall back to the schema
+                    raise
+                # present values of unsupported fields are always loaded by the schema
+                body = ["            return FALLBACK"]
+            lines += body
+            lines.append(f"            out[{key}] = v")
+        if schema.unknown != EXCLUDE:
+            lines += ["    if seen != len(data):", "        return FALLBACK"]
+        lines.append("    return out")
+        self.lines += lines
+        return function
+
+    def many(self, function: str) -> str:
+        """Emit the function loading a list of items through an item's function, returning its name."""
+        many = self.name("_many")
+        self.lines += [
+            f"def {many}(data):",
+            "    if type(data) is not list:",
+            "        return FALLBACK",
+            "    out = []",
+            "    for item in data:",
+            f"        item = {function}(item)",
+            "        if item is FALLBACK:",
+            "            return FALLBACK",
+            "        out.append(item)",
+            "    return out",
+        ]
+        return many
+
+    def field(self, field: fields.Field, var: str, depth: int) -> list[str]:
+        """Emit checks that convert `var` in place, returning FALLBACK from the function if it isn't certainly valid."""
+        pad = "    " * depth
+        kind = type(field)
+
+        if kind is fields.String:
+            lines = [f"{pad}if not isinstance({var}, str):", f"{pad}    return FALLBACK"]
+        elif kind is fields.Integer:
+            lines = [f"{pad}if type({var}) is not int:", f"{pad}    return FALLBACK"]
+        elif kind is fields.Float:
+            if field.allow_nan or field.as_string:  # type: ignore
+                raise _UnsupportedError
+            lines = [
+                f"{pad}if type({var}) is float:",
+                f"{pad}    if not isfinite({var}):",
+                f"{pad}        return FALLBACK",
+                f"{pad}elif type({var}) is int:",
+                f"{pad}    {var} = float({var})",
+                f"{pad}else:",
+                f"{pad}    return FALLBACK",
+            ]
+        elif kind is fields.Boolean:
+            if "truthy" in vars(field) or "falsy" in vars(field):
+                raise _UnsupportedError
+            lines = [f"{pad}if {var} is not True and {var} is not False:", f"{pad}    return FALLBACK"]
+        elif kind is PikaId:
+            prefix = self.constant(f"{field.prefix}_")  # type: ignore
+            lines = [f"{pad}if not isinstance({var}, str) or not {var}.startswith({prefix}):", f"{pad}    return FALLBACK"]
+        elif kind is fields.Dict:
+            lines = self.mapping(field, var, depth)  # type: ignore
+        elif kind is fields.List:
+            lines = self.sequence(field, var, depth)  # type: ignore
+        elif kind is Union:
+            lines = self.union(field, var, depth)  # type: ignore
+        elif kind is fields.Nested:
+            lines = self.nested(field, var, depth)  # type: ignore
+        else:
+            raise _UnsupportedError
+
+        return lines + self.validators(field, var, depth)
+
+    def mapping(self, field: fields.Dict, var: str, depth: int) -> list[str]:
+        if field.mapping_type is not dict:
+            raise _UnsupportedError
+        pad = "    " * depth
+        out, key, value = self.name("_o"), self.name("_k"), self.name("_x")
+        lines = [
+            f"{pad}if type({var}) is not dict:",
+            f"{pad}    return FALLBACK",
+            f"{pad}{out} = {{}}",
+            f"{pad}for {key}, {value} in {var}.items():",
+        ]
+        if field.key_field is not None:
+            lines += self.field(field.key_field, key, depth + 1)
+        if field.value_field is not None:
+            lines += self.field(field.value_field, value, depth + 1)
+        lines += [f"{pad}    {out}[{key}] = {value}", f"{pad}{var} = {out}"]
+        return lines
+
+    def sequence(self, field: fields.List, var: str, depth: int) -> list[str]:
+        pad = "    " * depth
+        out, item = self.name("_o"), self.name("_x")
+        lines = [
+            f"{pad}if type({var}) is not list:",
+            f"{pad}    return FALLBACK",
+            f"{pad}{out} = []",
+            f"{pad}for {item} in {var}:",
+        ]
+        lines += self.field(field.inner, item, depth + 1)
+        lines += [f"{pad}    {out}.append({item})", f"{pad}{var} = {out}"]
+        return lines
+
+    def union(self, field: Union, var: str, depth: int) -> list[str]:
+        pad = "    " * depth
+        kind = self.name("_t")
+        lines = [f"{pad}{kind} = type({var})"]
+        branch = "if"
+        for value_type in (str, int, float, bool):
+            for candidate in field._candidate_fields:
+                outcome = _UNION_OUTCOMES.get(type(candidate), {}).get(value_type, _UNKNOWN)
+                if outcome == _REJECT:
+                    continue
+                if outcome == _ACCEPT:
+                    lines.append(f"{pad}{branch} {kind} is {value_type.__name__}:")
+                    lines += self.field(candidate, var, depth + 1)
+                    branch = "elif"
+                break
+        if branch == "if":
+            raise _UnsupportedError
+        lines += [f"{pad}else:", f"{pad}    return FALLBACK"]
+        return lines
+
+    def nested(self, field: fields.Nested, var: str, depth: int) -> list[str]:
+        if field.many or field.only is not None or field.exclude or field.unknown is not None:
+            raise _UnsupportedError
+        schema = field.schema
+        if not _is_plain(schema):
+            raise _UnsupportedError
+        function = self.schema(schema)
+        pad = "    " * depth
+        return [f"{pad}{var} = {function}({var})", f"{pad}if {var} is FALLBACK:", f"{pad}    return FALLBACK"]
+
+    def validators(self, field: fields.Field, var: str, depth: int) -> list[str]:
+        pad = "    " * depth
+        conditions = []
+        for validator in field.validators:
+            if type(validator) is validate.Length:
+                if validator.equal is not None:
+                    conditions.append(f"len({var}) != {validator.equal!r}")
+                else:
+                    if validator.min is not None:
+                        conditions.append(f"len({var}) < {validator.min!r}")
+                    if validator.max is not None:
+                        conditions.append(f"len({var}) > {validator.max!r}")
+            elif type(validator) is validate.Range:
+                if validator.min is not None:
+                    operator = "<" if validator.min_inclusive else "<="
+                    conditions.append(f"{var} {operator} {self.constant(validator.min)}")
+                if validator.max is not None:
+                    operator = ">" if validator.max_inclusive else ">="
+                    conditions.append(f"{var} {operator} {self.constant(validator.max)}")
+            elif type(validator) is validate.Regexp:
+                conditions.append(f"{self.constant(validator.regex.match)}({var}) is None")
+            elif type(validator) is validate.OneOf:
+                conditions.append(f"{var} not in {self.constant(validator.choices)}")
+            elif type(validator) is validate.Equal:
+                conditions.append(f"{var} != {self.constant(validator.comparable)}")
+            else:
+                raise _UnsupportedError
+        return [line for condition in conditions for line in (f"{pad}if {condition}:", f"{pad}    return FALLBACK")]
+
+
+def _is_plain_instance(schema: Schema) -> bool:
+    return not (schema.only is not None or schema.exclude or schema.partial)
+
+
+def _is_plain(schema: Schema) -> bool:
+    # anything that changes how load maps input to output keeps the schema on marshmallow
+    if not _is_plain_instance(schema) or schema.ordered:
+        return False
+    if schema.unknown == INCLUDE or any(schema._hooks.values()):
+        return False
+    return all(field.data_key is None and field.attribute is None for field in schema.load_fields.values())
+
+
+_compiled: dict[tuple[type[Schema], str, bool], CompiledSchema | None] = {}
+_lock = threading.Lock()
+
+
+def compile_schema(schema: Schema) -> CompiledSchema | None:
+    """Get the compiled function of a schema, compiling it on first use.
+
+    Args:
+        schema (Schema): The schema instance.
+
+    Returns:
+        A function returning the loaded data, or `FALLBACK` if the schema must load it, or None
+        if the schema can't be compiled at all.
+    """
+    if not _is_plain_instance(schema):
+        return None
+    key = (type(schema), schema.unknown, schema.many)
+    try:
+        return _compiled[key]
+    except KeyError:
+        pass
+
+    with _lock:
+        if key not in _compiled:
+            compiled = None
+            if _is_plain(schema):
+                namespace: dict[str, t.Any] = {"FALLBACK": FALLBACK, "MISSING": missing, "isfinite": math.isfinite}
+                compiler = _Compiler(namespace)
+                try:
+                    function = compiler.schema(schema)
+                except _UnsupportedError:
+                    # a required field it can't check, every load would fall back anyway
+                    function = None
+                if function is not None:
+                    if schema.many:
+                        function = compiler.many(function)
+                    source = "\n".join(compiler.lines)
+                    exec(compile(source, f"<lawg compiled {type(schema).__name__}>", "exec"), namespace)  # noqa: S102
+                    compiled = _guard(namespace[function])
+            _compiled[key] = compiled
+        return _compiled[key]
+
+
+def _guard(function: CompiledSchema) -> CompiledSchema:
+    def compiled(data: t.Any) -> t.Any:
+        try:
+            return function(data)
+        except (TypeError, ValueError, OverflowError):
+            # e.g. an unhashable OneOf value or an int too large for a float, the schema reports it
+            return FALLBACK
+
+    return compiled
+
+
+def load(schema: Schema, data: t.Any) -> STR_DICT:
+    """Load data through a schema's compiled function, falling back to the schema itself.
+
+    Args:
+        schema (Schema): The schema instance.
+        data (Any): The data to load.
+
+    Returns:
+        The loaded data, identical to `schema.load(data)`.
+
+    Raises:
+        marshmallow.ValidationError: If the data is invalid, as raised by the schema.
+    """
+    compiled = compile_schema(schema)
+    if compiled is not None:
+        result = compiled(data)
+        if result is not FALLBACK:
+            return result
+    return schema.load(data)  # type: ignore
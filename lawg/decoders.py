@@ -0,0 +1,453 @@
+"""lawg.py typed response decoding, an alternative to loading responses through marshmallow.
+
+Responses of the api's response schemas are decoded straight into compact records, enforcing the
+same constraints as the schemas (pika id prefixes, length limits, nullability). With `msgspec`
+installed, records are `msgspec.Struct` types decoded from the raw response bytes without
+intermediate dicts; otherwise they are slotted classes built from the parsed JSON.
+
+Records support item access (`record["id"]`), so they can be used wherever loaded schema data is.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import re
+import typing as t
+
+import marshmallow
+
+from lawg.schemas import EventSchema, FeedSchema, InsightSchema, MemberSchema, ProjectSchema
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None  # type: ignore[assignment]
+
+if t.TYPE_CHECKING:
+    from marshmallow import Schema
+
+
+class Field(t.NamedTuple):
+    """A field of a record, with the constraints of its schema field."""
+
+    name: str
+    type: type | str
+    nullable: bool = False
+    min_length: int | None = None
+    max_length: int | None = None
+    pattern: str | None = None
+    # whether the field may be missing, loading as None
+    optional: bool = False
+
+
+def _pika(name: str, prefix: str) -> Field:
+    return Field(name, str, min_length=1, pattern=f"^{prefix}_")
+
+
+def _text(name: str, max_length: int, *, nullable: bool = False) -> Field:
+    return Field(name, str, nullable=nullable, min_length=1, max_length=max_length)
+
+
+# tags map keys of 1 to 175 characters to scalars
+TAG_KEY_MAX_LENGTH = 175
+
+
+# record specs, mirroring the response schemas in lawg.schemas; a str type is a list of that record,
+# a dict type a tags mapping
+SPECS: dict[str, tuple[Field, ...]] = {
+    "FeedRecord": (
+        _pika("id", "feed"),
+        _pika("project_id", "project"),
+        _text("name", 24),
+        _text("description", 128, nullable=True),
+        _text("emoji", 32, nullable=True),
+    ),
+    "MemberRecord": (
+        _pika("id", "user"),
+        Field("username", str),
+        Field("icon", str, nullable=True),
+    ),
+    "ProjectRecord": (
+        _pika("id", "project"),
+        Field("namespace", str, min_length=1, max_length=32, pattern=r"^[a-z0-9_-]+$"),
+        _text("name", 32),
+        Field("flags", int),
+        Field("icon", str, nullable=True),
+        Field("feeds", "FeedRecord"),
+        Field("members", "MemberRecord"),
+    ),
+    "EventRecord": (
+        _pika("id", "event"),
+        _pika("project_id", "project"),
+        _pika("feed_id", "feed"),
+        _text("title", 32),
+        _text("description", 4096, nullable=True),
+        _text("emoji", 32, nullable=True),
+        Field("tags", dict, nullable=True, optional=True),
+    ),
+    "InsightRecord": (
+        _pika("id", "insight"),
+        _text("title", 32),
+        _text("description", 128, nullable=True),
+        Field("value", float),
+        _text("emoji", 32, nullable=True),
+        Field("updated_at", datetime.datetime, nullable=True),
+        Field("created_at", datetime.datetime),
+    ),
+}
+
+SCHEMA_RECORDS: dict[type[Schema], str] = {
+    FeedSchema: "FeedRecord",
+    MemberSchema: "MemberRecord",
+    ProjectSchema: "ProjectRecord",
+    EventSchema: "EventRecord",
+    InsightSchema: "InsightRecord",
+}
+
+
+# --- PYTHON BACKEND --- #
+
+
+class Record:
+    """A decoded response object, read by attribute or by item like loaded schema data."""
+
+    __slots__ = ()
+
+    FIELDS: t.ClassVar[tuple[Field, ...]] = ()
+
+    def __init__(self, **values: t.Any) -> None:
+        """Initialize the record.
+
+        Args:
+            **values (Any): The value of every field, by name.
+        """
+        for field in self.FIELDS:
+            setattr(self, field.name, values[field.name])
+
+    def __repr__(self) -> str:
+        """Represent the record by its values."""
+        values = " ".join(f"{field.name}={getattr(self, field.name)!r}" for field in self.FIELDS)
+        return f"<{self.__class__.__name__} {values}>"
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the values of records of the same type."""
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, field.name) == getattr(other, field.name) for field in self.FIELDS)
+
+    def __getitem__(self, key: str) -> t.Any:
+        """Get a value by field name, like loaded schema data."""
+        return _getitem(self, key)
+
+    def get(self, key: str, default: t.Any = None) -> t.Any:
+        """Get a field's value, or the default if the record has no such field."""
+        return getattr(self, key, default)
+
+
+def _getitem(record: t.Any, key: str) -> t.Any:
+    try:
+        return getattr(record, key)
+    except AttributeError:
+        raise KeyError(key) from None
+
+
+def _parse_datetime(value: str) -> datetime.datetime:
+    # fromisoformat only accepts a "Z" suffix from python 3.11 on
+    if value.endswith(("Z", "z")):
+        value = f"{value[:-1]}+00:00"
+    return datetime.datetime.fromisoformat(value)
+
+
+class _PythonBackend:
+    """Builds records from parsed JSON with explicit checks."""
+
+    name = "python"
+
+    def __init__(self) -> None:
+        self.records: dict[str, type[Record]] = {
+            name: type(name, (Record,), {"__slots__": tuple(field.name for field in fields), "FIELDS": fields})
+            for name, fields in SPECS.items()
+        }
+        self.patterns = {
+            field.pattern: re.compile(field.pattern) for fields in SPECS.values() for field in fields if field.pattern
+        }
+
+    def decode(self, content: bytes, record: str, many: bool) -> t.Any:
+        try:
+            envelope = json.loads(content)
+        except ValueError as exc:
+            raise marshmallow.ValidationError(str(exc)) from exc
+        if not isinstance(envelope, dict) or envelope.get("success") is not True or "data" not in envelope:
+            msg = "Not a successful response envelope."
+            raise marshmallow.ValidationError(msg)
+        return self.convert(envelope["data"], record, many)
+
+    def convert(self, data: t.Any, record: str, many: bool) -> t.Any:
+        if not many:
+            return self._build(data, record)
+        if not isinstance(data, list):
+            msg = "Not a valid list."
+            raise marshmallow.ValidationError(msg)
+        errors: dict[int, t.Any] = {}
+        records = []
+        for index, item in enumerate(data):
+            try:
+                records.append(self._build(item, record))
+            except marshmallow.ValidationError as exc:
+                errors[index] = exc.messages
+        if errors:
+            raise marshmallow.ValidationError(errors)
+        return records
+
+    def _build(self, data: t.Any, record: str) -> Record:
+        if not isinstance(data, dict):
+            msg = "Invalid input type."
+            raise marshmallow.ValidationError({"_schema": [msg]})
+
+        values: dict[str, t.Any] = {}
+        errors: dict[str, t.Any] = {}
+        for field in SPECS[record]:
+            if field.name not in data:
+                if field.optional:
+                    values[field.name] = None
+                else:
+                    errors[field.name] = ["Missing data for required field."]
+                continue
+            try:
+                values[field.name] = self._value(field, data[field.name])
+            except marshmallow.ValidationError as exc:
+                errors[field.name] = exc.messages
+        if errors:
+            raise marshmallow.ValidationError(errors)
+        return self.records[record](**values)
+
+    def _value(self, field: Field, value: t.Any) -> t.Any:
+        if value is None:
+            if field.nullable:
+                return None
+            msg = "Field may not be null."
+            raise marshmallow.ValidationError(msg)
+
+        kind = field.type
+        if isinstance(kind, str):
+            return self.convert(value, kind, many=True)
+        if kind is str:
+            if not isinstance(value, str):
+                msg = "Not a valid string."
+                raise marshmallow.ValidationError(msg)
+            if field.min_length is not None and len(value) < field.min_length:
+                msg = f"Shorter than minimum length {field.min_length}."
+                raise marshmallow.ValidationError(msg)
+            if field.max_length is not None and len(value) > field.max_length:
+                msg = f"Longer than maximum length {field.max_length}."
+                raise marshmallow.ValidationError(msg)
+            if field.pattern is not None and not self.patterns[field.pattern].search(value):
+                msg = "String does not match expected pattern."
+                raise marshmallow.ValidationError(msg)
+            return value
+        if kind is int:
+            if isinstance(value, bool) or not isinstance(value, int):
+                msg = "Not a valid integer."
+                raise marshmallow.ValidationError(msg)
+            return value
+        if kind is float:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                msg = "Not a valid number."
+                raise marshmallow.ValidationError(msg)
+            return float(value)
+        if kind is dict:
+            return self._tags(value)
+        # datetime
+        if not isinstance(value, str):
+            msg = "Not a valid datetime."
+            raise marshmallow.ValidationError(msg)
+        try:
+            return _parse_datetime(value)
+        except ValueError as exc:
+            msg = "Not a valid datetime."
+            raise marshmallow.ValidationError(msg) from exc
+
+    def _tags(self, value: t.Any) -> dict[str, t.Any]:
+        if not isinstance(value, dict):
+            msg = "Not a valid mapping type."
+            raise marshmallow.ValidationError(msg)
+        errors: dict[str, t.Any] = {}
+        for key, item in value.items():
+            if not isinstance(key, str) or not 1 <= len(key) <= TAG_KEY_MAX_LENGTH:
+                errors[key] = {"key": ["Not a valid tag key."]}
+            elif not isinstance(item, (str, int, float, bool)):
+                errors[key] = {"value": ["Not a valid tag value."]}
+        if errors:
+            raise marshmallow.ValidationError(errors)
+        return value
+
+
+# --- MSGSPEC BACKEND --- #
+
+
+class _MsgspecBackend:
+    """Decodes raw response bytes straight into `msgspec.Struct` records."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        class StructRecord(msgspec.Struct):  # type: ignore
+            def __getitem__(self, key: str) -> t.Any:
+                return _getitem(self, key)
+
+            def get(self, key: str, default: t.Any = None) -> t.Any:
+                return getattr(self, key, default)
+
+        class Envelope(msgspec.Struct):  # type: ignore
+            success: bool
+            data: msgspec.Raw  # type: ignore
+
+        self.records: dict[str, type] = {}
+        for name, fields in SPECS.items():
+            self.records[name] = msgspec.defstruct(  # type: ignore
+                name,
+                [
+                    (field.name, self._annotation(field), None) if field.optional else (field.name, self._annotation(field))
+                    for field in fields
+                ],
+                bases=(StructRecord,),
+                module=__name__,
+            )
+        self.envelope = msgspec.json.Decoder(Envelope)  # type: ignore
+        self.decoders: dict[tuple[str, bool], t.Any] = {}
+
+    def _annotation(self, field: Field) -> t.Any:
+        if isinstance(field.type, str):
+            annotation: t.Any = t.List[self.records[field.type]]  # type: ignore
+        elif field.type is dict:
+            key = t.Annotated[str, msgspec.Meta(min_length=1, max_length=TAG_KEY_MAX_LENGTH)]  # type: ignore
+            annotation = t.Dict[key, t.Union[str, int, float, bool]]  # type: ignore
+        else:
+            annotation = field.type
+            constraints = {
+                key: value
+                for key, value in (
+                    ("min_length", field.min_length),
+                    ("max_length", field.max_length),
+                    ("pattern", field.pattern),
+                )
+                if value is not None
+            }
+            if constraints:
+                annotation = t.Annotated[annotation, msgspec.Meta(**constraints)]  # type: ignore
+        return t.Optional[annotation] if field.nullable else annotation
+
+    def _decoder(self, record: str, many: bool) -> t.Any:
+        decoder = self.decoders.get((record, many))
+        if decoder is None:
+            annotation = self.records[record]
+            decoder = self.decoders[(record, many)] = msgspec.json.Decoder(  # type: ignore
+                t.List[annotation] if many else annotation  # type: ignore
+            )
+        return decoder
+
+    def decode(self, content: bytes, record: str, many: bool) -> t.Any:
+        envelope = self._decode(self.envelope, content)
+        if envelope.success is not True:
+            msg = "Not a successful response envelope."
+            raise marshmallow.ValidationError(msg)
+        return self._decode(self._decoder(record, many), envelope.data)
+
+    @staticmethod
+    def _decode(decoder: t.Any, content: bytes) -> t.Any:
+        try:
+            return decoder.decode(content)
+        except msgspec.ValidationError as exc:  # type: ignore
+            raise marshmallow.ValidationError(str(exc)) from exc
+        except msgspec.DecodeError as exc:  # type: ignore
+            raise marshmallow.ValidationError(str(exc)) from exc
+
+    def convert(self, data: t.Any, record: str, many: bool) -> t.Any:
+        annotation = self.records[record]
+        try:
+            return msgspec.convert(data, t.List[annotation] if many else annotation)  # type: ignore
+        except msgspec.ValidationError as exc:  # type: ignore
+            raise marshmallow.ValidationError(str(exc)) from exc
+
+
+# --- DECODER --- #
+
+
+class RecordDecoder:
+    """Decodes responses of the api's response schemas into records instead of loading them through marshmallow.
+
+    Validation errors are raised as `marshmallow.ValidationError`, like loading through the schema would.
+    Responses of other schemas are left to marshmallow.
+    """
+
+    __slots__ = ("backend",)
+
+    BACKENDS = ("msgspec", "python")
+
+    def __init__(self, backend: str | None = None) -> None:
+        """Initialize the decoder.
+
+        Args:
+            backend (str, optional): "msgspec" or "python". Defaults to msgspec if it's installed.
+        """
+        if backend is None:
+            backend = "python" if msgspec is None else "msgspec"
+        if backend not in self.BACKENDS:
+            msg = f"backend must be one of {', '.join(self.BACKENDS)}"
+            raise ValueError(msg)
+        if backend == "msgspec" and msgspec is None:
+            msg = "the msgspec backend requires msgspec to be installed"
+            raise ModuleNotFoundError(msg)
+
+        if backend not in _BACKENDS:
+            _BACKENDS[backend] = _MsgspecBackend() if backend == "msgspec" else _PythonBackend()
+        self.backend: _MsgspecBackend | _PythonBackend = _BACKENDS[backend]
+
+    def __repr__(self) -> str:
+        """Represent the decoder by its backend."""
+        return f"<{self.__class__.__name__} backend={self.backend.name!r}>"
+
+    def record_type(self, schema: type[Schema]) -> type:
+        """Get the record type a schema's data is decoded into.
+
+        Args:
+            schema (type[Schema]): The response schema class.
+        """
+        return self.backend.records[SCHEMA_RECORDS[schema]]
+
+    def supports(self, schema: Schema | None) -> bool:
+        """Check whether a response schema can be decoded into records.
+
+        Args:
+            schema (Schema, optional): The response schema.
+        """
+        return schema is not None and type(schema) in SCHEMA_RECORDS
+
+    def decode(self, content: bytes, schema: Schema) -> t.Any:
+        """Decode a response envelope's data.
+
+        Args:
+            content (bytes): The raw response body.
+            schema (Schema): The response schema, whose `many` is honoured.
+
+        Returns:
+            The record, or the list of records.
+        """
+        return self.backend.decode(content, SCHEMA_RECORDS[type(schema)], bool(schema.many))
+
+    def convert(self, data: t.Any, schema: Schema) -> t.Any:
+        """Convert already parsed data, e.g. an item of a streamed response.
+
+        Args:
+            data (Any): The parsed JSON data.
+            schema (Schema): The response schema, whose `many` is honoured.
+
+        Returns:
+            The record, or the list of records.
+        """
+        return self.backend.convert(data, SCHEMA_RECORDS[type(schema)], bool(schema.many))
+
+
+# backends are built once per process, their record types are shared by every decoder
+_BACKENDS: dict[str, t.Any] = {}
@@ -20,20 +20,30 @@ class LawgHTTPError(LawgError):
 
     message = "An HTTP error occurred."
 
+    # whether sending the same request again may succeed, unless the response said otherwise
+    retryable = False
+
     def __init__(
         self,
         *,
         status_code: int,
         message: str | None = None,
+        retry_after: float | None = None,
+        retryable: bool | None = None,
     ) -> None:
         """Initialize HTTP error.
 
         Args:
             status_code (int): The status code of the http request.
             message (str, optional): The message of the error.
+            retry_after (float, optional): Seconds the API asked to wait before retrying.
+            retryable (bool, optional): Whether sending the same request again may succeed.
         """
         super().__init__(message or self.message)
         self.status_code: int = status_code
+        self.retry_after: float | None = retry_after
+        if retryable is not None:
+            self.retryable = retryable
 
 
 class LawgConflictError(LawgHTTPError):
@@ -55,6 +65,14 @@ class LawgNotFoundError(LawgHTTPError):
 class LawgInternalServerError(LawgHTTPError):
     """Exception raised when an internal server error occurs."""
 
+    retryable = True
+
+
+class LawgRateLimitedError(LawgHTTPError):
+    """Exception raised when too many requests are made."""
+
+    retryable = True
+
 
 class LawgForbiddenError(LawgHTTPError):
     """Exception raised when a forbidden request is made."""
@@ -80,6 +98,38 @@ class LawgEmptyBodyError(LawgError):
     message = "The request body is empty."
 
 
+class LawgStreamDecodeError(LawgError):
+    """Exception raised when a streamed response isn't a JSON object holding the expected array."""
+
+    message = "The streamed response could not be decoded."
+
+
+class LawgInvalidPikaError(LawgError, ValueError):
+    """Exception raised when a string isn't a valid pika id."""
+
+    message = "{id!r} is not a valid pika id."
+
+    def __init__(self, id: str) -> None:
+        """Initialize the invalid pika error.
+
+        Args:
+            id (str): The invalid id.
+        """
+        super().__init__(self.message.format(id=id))
+
+
+class LawgNoMirrorError(LawgError):
+    """Exception raised when a query needs an event mirror and the client has none."""
+
+    message = "The client has no event mirror, create it with `mirror=EventMirror(...)`."
+
+
+class LawgExportError(LawgError):
+    """Exception raised when an export can't be resumed."""
+
+    message = "The export could not be resumed."
+
+
 class LawgEventUndefinedError(LawgError):
     """Exception raised when an event isn't defined."""
 
@@ -92,3 +142,15 @@ class LawgEventUndefinedError(LawgError):
             event (str): The event that isn't defined.
         """
         super().__init__(self.message.format(event=event))
+
+
+class LawgBufferClosedError(LawgError):
+    """Exception raised when an increment is added to a closed increment buffer."""
+
+    message = "The increment buffer is closed, its increments would never be sent."
+
+
+class LawgSharedMemoryError(LawgError):
+    """Exception raised when shared increments can't be set up in shared memory."""
+
+    message = "The shared increments could not be set up."
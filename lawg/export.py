@@ -0,0 +1,466 @@
+"""lawg.py streaming export of feeds to NDJSON, CSV and Parquet files.
+
+Events are fetched and written a page at a time, so memory stays constant however large the feed
+is. After each page, the output is synced to disk and a checkpoint is saved next to it. An
+interrupted export then resumes from the last page written instead of starting over.
+
+Project exports write every feed to its own file in a directory. Pages are fetched over several
+connections at once while worker processes encode and compress them, so a large export is
+bound by neither the network nor a single core.
+
+    python -m lawg.export --project my-project --feed signups signups.ndjson.gz --compression gzip
+    python -m lawg.export --project my-project exports/ --format csv --compression xz
+"""
+
+from __future__ import annotations
+
+import bz2
+import contextlib
+import csv
+import gzip
+import io
+import json
+import lzma
+import os
+import shutil
+import tempfile
+import typing as t
+
+from lawg.batch import IRREGULAR, EventBatch
+from lawg.exceptions import LawgExportError
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None  # type: ignore[assignment]
+
+if t.TYPE_CHECKING:
+    from lawg.typings import PATH
+
+FORMATS = ("ndjson", "csv", "parquet")
+# compressions of text formats; each page is compressed as its own member, which gzip, bz2 and xz
+# readers decompress as one stream, so the file can be cut back to any page when resuming
+COMPRESSORS: dict[str, t.Callable[[bytes], bytes]] = {
+    "gzip": gzip.compress,
+    "bz2": bz2.compress,
+    "xz": lzma.compress,
+}
+EXTENSIONS = {"gzip": ".gz", "bz2": ".bz2", "xz": ".xz"}
+# parquet compresses pages itself, with any codec pyarrow supports
+PARQUET_COMPRESSIONS = ("snappy", "gzip", "brotli", "zstd", "lz4")
+
+CSV_COLUMNS = ("id", "project_id", "feed_id", "title", "description", "emoji", "tags")
+
+
+# --- ENCODING --- #
+
+
+def _encode_ndjson(batch: EventBatch[t.Any], start: int, header: bool) -> str:
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    return "".join(f"{dumps(batch.row(index))}\n" for index in range(start, len(batch)))
+
+
+def _encode_csv(batch: EventBatch[t.Any], start: int, header: bool) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(CSV_COLUMNS)
+    for index in range(start, len(batch)):
+        event_data = batch.row(index)
+        tags = event_data["tags"]
+        event_data["tags"] = None if tags is None else json.dumps(tags, ensure_ascii=False)
+        writer.writerow(event_data[column] for column in CSV_COLUMNS)
+    return buffer.getvalue()
+
+
+def encode_page(
+    batch: EventBatch[t.Any], start: int, *, format: str, compression: str | None, header: bool = False
+) -> bytes:
+    """Encode the events of a page, from `start` on, as they're written to an export file.
+
+    Takes and returns only picklable values, so project exports can run it in worker processes.
+
+    Args:
+        batch (EventBatch): The page of events.
+        start (int): The index of the first event to encode.
+        format (str): "ndjson", "csv" or "parquet".
+        compression (str | None): The compression of the format, see `FeedExport`.
+        header (bool, optional): Whether to start a csv page with the header row.
+
+    Returns:
+        The compressed text of the events, or for parquet a file holding them as one row group.
+    """
+    if format == "parquet":
+        sink = pyarrow.BufferOutputStream()  # type: ignore
+        pyarrow.parquet.write_table(batch.to_arrow().slice(start), sink, compression=compression or "none")  # type: ignore
+        return sink.getvalue().to_pybytes()
+    encode = _encode_csv if format == "csv" else _encode_ndjson
+    data = encode(batch, start, header).encode("utf-8")
+    if compression is not None:
+        data = COMPRESSORS[compression](data)
+    return data
+
+
+def export_path(directory: PATH, feed: str, format: str, compression: str | None = None) -> str:
+    """Get the file a project export writes a feed to.
+
+    Args:
+        directory (str | os.PathLike): The directory of the export.
+        feed (str): The name of the feed.
+        format (str): "ndjson", "csv" or "parquet".
+        compression (str, optional): The compression of the format.
+    """
+    name = f"{feed}.{format}"
+    if compression is not None and format != "parquet":
+        name += EXTENSIONS[compression]
+    return os.path.join(directory, name)
+
+
+# --- WRITERS --- #
+
+
+def _write(path: str, data: bytes, mode: str) -> None:
+    with open(path, mode) as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+
+
+class _TextWriter:
+    """Appends encoded pages to a text file, cutting it back to the checkpoint when resuming."""
+
+    __slots__ = ("path", "size")
+
+    def __init__(self, path: PATH, size: int) -> None:
+        self.path = path
+        self.size = size
+        with open(path, "ab") as file:
+            file.truncate(size)
+
+    def write(self, data: bytes) -> None:
+        _write(os.fspath(self.path), data, "ab")
+        self.size += len(data)
+
+    def state(self) -> dict[str, t.Any]:
+        return {"size": self.size}
+
+    def finish(self) -> None:
+        pass
+
+
+class _ParquetWriter:
+    """Writes each page as a part file holding one row group, merged into the output when finished.
+
+    A parquet file can't be appended to once it's closed, nor read before it is, so the parts are
+    what makes the export resumable. Merging copies one row group at a time.
+    """
+
+    __slots__ = ("path", "compression", "parts")
+
+    def __init__(self, path: PATH, compression: str | None, parts: int) -> None:
+        self.path = path
+        self.compression = compression
+        self.parts = parts
+        os.makedirs(self._parts_path, exist_ok=True)
+
+    @property
+    def _parts_path(self) -> str:
+        return f"{os.fspath(self.path)}.parts"
+
+    def _part(self, index: int) -> str:
+        return os.path.join(self._parts_path, f"{index:06d}.parquet")
+
+    def write(self, data: bytes) -> None:
+        _write(self._part(self.parts), data, "wb")
+        self.parts += 1
+
+    def state(self) -> dict[str, t.Any]:
+        return {"parts": self.parts}
+
+    def finish(self) -> None:
+        schema = EventBatch(None, "").to_arrow().schema
+        with pyarrow.parquet.ParquetWriter(self.path, schema, compression=self.compression or "none") as writer:  # type: ignore
+            for index in range(self.parts):
+                part = pyarrow.parquet.ParquetFile(self._part(index))  # type: ignore
+                for row_group in range(part.num_row_groups):
+                    writer.write_table(part.read_row_group(row_group))
+        shutil.rmtree(self._parts_path)
+
+
+# --- EXPORT --- #
+
+
+class FeedExport:
+    """An export of a feed to a file, resumable from the checkpoint saved after each page.
+
+    The API lists events newest first, by offset. Events created during an export shift the pages
+    and would be seen twice, so only events older than the last one written are kept, and events
+    whose ids aren't pika ids only if their id wasn't written yet; events deleted during an export
+    may shift older events past a page and be missed.
+
+    Used by `Client.export_events()`, which fetches the pages, and by `Client.export_project()`,
+    which encodes them with `encode_page()` in worker processes before writing them:
+
+        >>> export = FeedExport("signups.csv", feed="signups", format="csv")
+        >>> while not export.done:
+        ...     export.add(client.fetch_event_batch(feed="signups", limit=export.page_size, offset=export.offset))
+        >>> export.finish()
+    """
+
+    VERSION = 1
+
+    __slots__ = (
+        "path",
+        "feed",
+        "format",
+        "compression",
+        "page_size",
+        "offset",
+        "cursor",
+        "irregular",
+        "exported",
+        "done",
+        "_writer",
+    )
+
+    def __init__(
+        self,
+        path: PATH,
+        *,
+        feed: str,
+        format: str = "ndjson",
+        compression: str | None = None,
+        page_size: int = 100,
+        resume: bool = True,
+    ) -> None:
+        """Initialize the export, resuming it from its checkpoint if there is one.
+
+        Args:
+            path (str | os.PathLike): The output file.
+            feed (str): The name of the feed.
+            format (str, optional): "ndjson", "csv" or "parquet".
+            compression (str, optional): "gzip", "bz2" or "xz" for text formats, or a codec such as
+                "snappy" or "zstd" for parquet. Defaults to none.
+            page_size (int, optional): The number of events fetched and written at a time. For parquet,
+                the size of each row group.
+            resume (bool, optional): Whether to resume from an existing checkpoint instead of starting over.
+
+        Raises:
+            ValueError: If the format or compression isn't supported.
+            ModuleNotFoundError: If the format is parquet and pyarrow isn't installed.
+            LawgExportError: If the checkpoint belongs to a different export.
+        """
+        if format not in FORMATS:
+            msg = f"format must be one of {', '.join(FORMATS)}"
+            raise ValueError(msg)
+        compressions = PARQUET_COMPRESSIONS if format == "parquet" else tuple(COMPRESSORS)
+        if compression is not None and compression not in compressions:
+            msg = f"{format} compression must be one of {', '.join(compressions)}"
+            raise ValueError(msg)
+        if format == "parquet" and pyarrow is None:
+            msg = "parquet exports require pyarrow to be installed"
+            raise ModuleNotFoundError(msg)
+
+        self.path = path
+        self.feed = feed
+        self.format = format
+        self.compression = compression
+        self.page_size = page_size
+
+        checkpoint = self._load_checkpoint() if resume else None
+        if checkpoint is not None:
+            expected = {"feed": feed, "format": format, "compression": compression, "page_size": page_size}
+            if any(checkpoint.get(key) != value for key, value in expected.items()):
+                msg = f"the checkpoint of {os.fspath(path)!r} belongs to a different export"
+                raise LawgExportError(msg)
+        else:
+            checkpoint = {}
+            if format == "parquet":
+                shutil.rmtree(f"{os.fspath(path)}.parts", ignore_errors=True)
+
+        # the offset of the next page, and the snowflake of the last event written
+        self.offset: int = checkpoint.get("offset", 0)
+        self.cursor: int | None = checkpoint.get("cursor")
+        # the written ids that aren't regular pika ids, which have no snowflake to compare
+        self.irregular: set[str] = set(checkpoint.get("irregular", ()))
+        self.exported: int = checkpoint.get("exported", 0)
+        self.done: bool = checkpoint.get("done", False)
+        if format == "parquet":
+            self._writer: t.Any = _ParquetWriter(path, compression, checkpoint.get("parts", 0))
+        else:
+            self._writer = _TextWriter(path, checkpoint.get("size", 0))
+
+    def __repr__(self) -> str:
+        """Represent the export by its feed and output file."""
+        return f"<{self.__class__.__name__} feed={self.feed!r} path={self.path!r} exported={self.exported}>"
+
+    @property
+    def checkpoint_path(self) -> str:
+        """The file the checkpoint is saved to."""
+        return f"{os.fspath(self.path)}.checkpoint"
+
+    @property
+    def header(self) -> bool:
+        """Whether the next page written starts a csv file, and so needs the header row."""
+        return self.format == "csv" and self._writer.size == 0
+
+    def add(self, batch: EventBatch[t.Any]) -> None:
+        """Encode and write a fetched page, then save the checkpoint.
+
+        Args:
+            batch (EventBatch): The page of events at `offset`, of at most `page_size` events.
+        """
+        if self.done:
+            return
+        start = self.start(batch)
+        data = None
+        if start < len(batch):
+            data = encode_page(batch, start, format=self.format, compression=self.compression, header=self.header)
+        self.write(batch, start, data)
+
+    def start(self, batch: EventBatch[t.Any]) -> int:
+        """Get the index of the first event of a page that hasn't been written yet.
+
+        Args:
+            batch (EventBatch): The page of events at `offset`.
+        """
+        # events written before the page shifted are at its start, newest first
+        snowflakes = batch.snowflakes
+        start = 0
+        while start < len(batch):
+            snowflake = snowflakes[start]
+            if snowflake == IRREGULAR:
+                if batch.row(start)["id"] not in self.irregular:
+                    break
+            elif self.cursor is None or snowflake < self.cursor:
+                break
+            start += 1
+        return start
+
+    def write(self, batch: EventBatch[t.Any], start: int, data: bytes | None) -> None:
+        """Write a page encoded by `encode_page()` and save the checkpoint.
+
+        Args:
+            batch (EventBatch): The page of events at `offset`.
+            start (int): The index returned by `start()`.
+            data (bytes | None): The encoded events, None if every event was already written.
+        """
+        if data is not None and start < len(batch):
+            self._writer.write(data)
+            snowflakes = batch.snowflakes
+            for index in range(start, len(batch)):
+                if snowflakes[index] == IRREGULAR:
+                    self.irregular.add(batch.row(index)["id"])
+                else:
+                    # the oldest regular event, an irregular one would leave nothing to compare to
+                    self.cursor = snowflakes[index]
+            self.exported += len(batch) - start
+        self.offset += len(batch)
+        self.done = len(batch) < self.page_size
+        self._save_checkpoint()
+
+    def finish(self) -> int:
+        """Complete the output file and remove the checkpoint.
+
+        Returns:
+            The number of events exported.
+        """
+        self._writer.finish()
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.checkpoint_path)
+        return self.exported
+
+    def _load_checkpoint(self) -> dict[str, t.Any] | None:
+        try:
+            with open(self.checkpoint_path, encoding="utf-8") as file:
+                checkpoint = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(checkpoint, dict) or checkpoint.get("version") != self.VERSION:
+            return None
+        return checkpoint
+
+    def _save_checkpoint(self) -> None:
+        checkpoint = {
+            "version": self.VERSION,
+            "feed": self.feed,
+            "format": self.format,
+            "compression": self.compression,
+            "page_size": self.page_size,
+            "offset": self.offset,
+            "cursor": self.cursor,
+            "irregular": sorted(self.irregular),
+            "exported": self.exported,
+            "done": self.done,
+            **self._writer.state(),
+        }
+        # write then rename, so an interruption never leaves a truncated checkpoint
+        path = self.checkpoint_path
+        fd, tmp_path = tempfile.mkstemp(prefix=f"{os.path.basename(path)}.", suffix=".tmp", dir=os.path.dirname(path) or None)
+        try:
+            with open(fd, "w", encoding="utf-8") as file:
+                json.dump(checkpoint, file)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+# --- CLI --- #
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Export a feed, or every feed of a project, from the command line."""
+    import argparse
+    import asyncio
+
+    from lawg.asyncio.client import AsyncClient
+    from lawg.syncio.client import Client
+
+    parser = argparse.ArgumentParser(prog="python -m lawg.export", description="Export lawg feeds to files.")
+    parser.add_argument("path", help="the output file, or the output directory when exporting every feed")
+    parser.add_argument("--project", required=True, help="the project namespace")
+    parser.add_argument("--feed", help="the name of the feed, defaults to every feed of the project")
+    parser.add_argument("--token", default=os.getenv("LAWG_TOKEN"), help="the API token, defaults to $LAWG_TOKEN")
+    parser.add_argument("--format", choices=FORMATS, default="ndjson")
+    parser.add_argument("--compression", default=None)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--connections", type=int, default=4, help="the feeds fetched at once")
+    parser.add_argument("--processes", type=int, default=None, help="the encoding processes, defaults to one per core")
+    parser.add_argument("--restart", action="store_true", help="ignore the checkpoints of an interrupted export")
+    args = parser.parse_args(argv)
+    if not args.token:
+        parser.error("an API token is required, pass --token or set $LAWG_TOKEN")
+
+    if args.feed is not None:
+        with Client(token=args.token, project=args.project) as client:
+            exported = client.export_events(
+                feed=args.feed,
+                path=args.path,
+                format=args.format,
+                compression=args.compression,
+                page_size=args.page_size,
+                resume=not args.restart,
+            )
+        print(f"exported {exported} events to {args.path}")
+        return
+
+    async def export_project() -> dict[str, int]:
+        async with AsyncClient(token=args.token, project=args.project) as client:
+            return await client.export_project(
+                args.path,
+                format=args.format,
+                compression=args.compression,
+                page_size=args.page_size,
+                resume=not args.restart,
+                connections=args.connections,
+                processes=args.processes,
+            )
+
+    for feed, exported in asyncio.run(export_project()).items():
+        print(f"exported {exported} events to {export_path(args.path, feed, args.format, args.compression)}")
+
+
+if __name__ == "__main__":
+    main()
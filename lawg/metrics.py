@@ -0,0 +1,456 @@
+"""lawg.py client-side metric aggregation."""
+
+from __future__ import annotations
+
+import math
+import threading
+import typing as t
+
+from abc import ABC, abstractmethod
+
+MAX_TITLE_LENGTH = 32
+
+
+class Sample(t.NamedTuple):
+    """A statistic of a metric, ready to be published as an insight."""
+
+    title: str
+    value: float
+    # counts accumulate across flushes, everything else replaces the insight's value
+    increment: bool = False
+
+
+class _Store:
+    __slots__ = ("buckets", "floor")
+
+    def __init__(self) -> None:
+        self.buckets: dict[int, int] = {}
+        # after folding, lower indexes are counted in the floor bucket
+        self.floor: int | None = None
+
+    def insert(self, index: int, weight: int, max_buckets: int) -> None:
+        if self.floor is not None and index < self.floor:
+            index = self.floor
+        buckets = self.buckets
+        buckets[index] = buckets.get(index, 0) + weight
+
+        if len(buckets) > max_buckets:
+            indexes = sorted(buckets)
+            folded = len(indexes) - max_buckets
+            self.floor = floor = indexes[folded]
+            for index in indexes[:folded]:
+                buckets[floor] += buckets.pop(index)
+
+    def clear(self) -> None:
+        self.buckets.clear()
+        self.floor = None
+
+
+class Sketch:
+    """A mergeable quantile sketch with bounded memory and relative error guarantees.
+
+    Values are counted in logarithmically sized buckets (DDSketch style), so any quantile is
+    estimated within `relative_accuracy` of the true value. Once a sign holds more than
+    `max_buckets` buckets, the buckets closest to zero are folded together, keeping the
+    upper quantiles accurate.
+    """
+
+    __slots__ = (
+        "relative_accuracy",
+        "max_buckets",
+        "count",
+        "sum",
+        "min",
+        "max",
+        "_gamma",
+        "_log_gamma",
+        "_positive",
+        "_negative",
+        "_zero",
+    )
+
+    # values closer to zero than this are counted as zero
+    MIN_VALUE = 1e-9
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048) -> None:
+        """Initialize the sketch.
+
+        Args:
+            relative_accuracy (float, optional): The maximum relative error of estimated quantiles.
+            max_buckets (int, optional): The maximum number of buckets kept per sign.
+        """
+        if not 0 < relative_accuracy < 1:
+            msg = "relative_accuracy must be between 0 and 1"
+            raise ValueError(msg)
+
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive = _Store()
+        self._negative = _Store()
+        self._zero = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def __repr__(self) -> str:
+        """Represent the sketch by its count and accuracy."""
+        return f"<{self.__class__.__name__} count={self.count!r} relative_accuracy={self.relative_accuracy!r}>"
+
+    def __len__(self) -> int:
+        """Get the number of values added."""
+        return self.count
+
+    def add(self, value: float, weight: int = 1) -> None:
+        """Add a value to the sketch.
+
+        Args:
+            value (float): The value to add.
+            weight (int, optional): How many times to add the value.
+        """
+        if value > self.MIN_VALUE:
+            self._positive.insert(self._index(value), weight, self.max_buckets)
+        elif value < -self.MIN_VALUE:
+            self._negative.insert(self._index(-value), weight, self.max_buckets)
+        else:
+            self._zero += weight
+
+        self.count += weight
+        self.sum += value * weight
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: Sketch) -> None:
+        """Merge another sketch into this one.
+
+        Args:
+            other (Sketch): A sketch with the same relative accuracy.
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            msg = "can only merge sketches with the same relative accuracy"
+            raise ValueError(msg)
+
+        for index, weight in other._positive.buckets.items():
+            self._positive.insert(index, weight, self.max_buckets)
+        for index, weight in other._negative.buckets.items():
+            self._negative.insert(index, weight, self.max_buckets)
+        self._zero += other._zero
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate a quantile.
+
+        Args:
+            q (float): The quantile, between 0 and 1.
+
+        Returns:
+            The estimated value, or None if the sketch is empty.
+        """
+        if not self.count:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+
+        rank = q * (self.count - 1)
+        seen = 0
+
+        negative = self._negative.buckets
+        for index in sorted(negative, reverse=True):
+            seen += negative[index]
+            if seen > rank:
+                return max(-self._value(index), self.min)
+
+        seen += self._zero
+        if seen > rank:
+            return 0.0
+
+        positive = self._positive.buckets
+        for index in sorted(positive):
+            seen += positive[index]
+            if seen > rank:
+                return min(self._value(index), self.max)
+
+        return self.max
+
+    def clear(self) -> None:
+        """Remove every value from the sketch."""
+        self._positive.clear()
+        self._negative.clear()
+        self._zero = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _index(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        return 2 * self._gamma**index / (self._gamma + 1)
+
+
+class Metric(ABC):
+    """Base class of locally aggregated metrics.
+
+    Samples are published in the order `collect()` returns them, with the counts that accumulate
+    across flushes last, so a failed publish can hand the unsent samples to `restore()` without
+    counting anything twice.
+    """
+
+    __slots__ = ("name", "_lock")
+
+    # the suffixes this metric publishes, used to validate the name against the insight title limit
+    STATISTICS: t.ClassVar[tuple[str, ...]] = ()
+
+    def __init__(self, name: str, statistics: t.Sequence[str] | None = None) -> None:
+        """Initialize the metric.
+
+        Args:
+            name (str): The name of the metric, used as the prefix of its insight titles.
+            statistics (Sequence[str], optional): The suffixes this metric publishes. Defaults to `STATISTICS`.
+        """
+        if statistics is None:
+            statistics = self.STATISTICS
+        longest = max((len(statistic) + 1 for statistic in statistics), default=0)
+        if not name or len(name) + longest > MAX_TITLE_LENGTH:
+            msg = f"metric name must be between 1 and {MAX_TITLE_LENGTH - longest} characters"
+            raise ValueError(msg)
+
+        self.name = name
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Represent the metric by its name."""
+        return f"<{self.__class__.__name__} name={self.name!r}>"
+
+    def title(self, statistic: str) -> str:
+        """Get the insight title of a statistic.
+
+        Args:
+            statistic (str): The statistic, e.g. "p99".
+        """
+        return f"{self.name} {statistic}" if statistic else self.name
+
+    @abstractmethod
+    def collect(self) -> list[Sample]:
+        """Collect the samples to publish and start a new interval.
+
+        Returns:
+            The samples, empty if nothing was recorded.
+        """
+
+    @abstractmethod
+    def restore(self, samples: list[Sample]) -> None:
+        """Merge the samples of the last collect that couldn't be published back into the metric.
+
+        Args:
+            samples (list[Sample]): The unsent samples, a suffix of what `collect()` returned.
+        """
+
+
+class Gauge(Metric):
+    """A value that can go up and down, published as is."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, name: str) -> None:
+        """Initialize the gauge.
+
+        Args:
+            name (str): The name of the gauge, used as its insight title.
+        """
+        super().__init__(name)
+        self.value: float | None = None
+
+    def set(self, value: float) -> None:
+        """Set the gauge.
+
+        Args:
+            value (float): The new value.
+        """
+        self.value = value
+
+    def increment(self, value: float = 1) -> None:
+        """Increment the gauge.
+
+        Args:
+            value (float, optional): The value to increment by.
+        """
+        with self._lock:
+            self.value = (self.value or 0) + value
+
+    def decrement(self, value: float = 1) -> None:
+        """Decrement the gauge.
+
+        Args:
+            value (float, optional): The value to decrement by.
+        """
+        self.increment(-value)
+
+    def collect(self) -> list[Sample]:
+        """Collect the value of the gauge, which it keeps.
+
+        Returns:
+            The value, or nothing if the gauge was never set.
+        """
+        if self.value is None:
+            return []
+        return [Sample(self.title(""), self.value)]
+
+    def restore(self, samples: list[Sample]) -> None:
+        """Keep the gauge's value, which the next flush publishes again.
+
+        Args:
+            samples (list[Sample]): The unsent samples.
+        """
+
+
+class Histogram(Metric):
+    """A stream of observations, published as a count and quantiles of each interval."""
+
+    __slots__ = ("quantiles", "sketch", "_collected")
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        quantiles: t.Sequence[float] = (0.5, 0.95, 0.99),
+        relative_accuracy: float = 0.01,
+        max_buckets: int = 2048,
+    ) -> None:
+        """Initialize the histogram.
+
+        Args:
+            name (str): The name of the histogram, used as the prefix of its insight titles.
+            quantiles (Sequence[float], optional): The quantiles to publish.
+            relative_accuracy (float, optional): The maximum relative error of the published quantiles.
+            max_buckets (int, optional): The maximum number of sketch buckets kept per sign.
+        """
+        self.quantiles = tuple(quantiles)
+        super().__init__(name, ("count", *map(self._statistic, self.quantiles)))
+        self.sketch = Sketch(relative_accuracy, max_buckets)
+        # the sketch of the last collect, merged back if it couldn't be published
+        self._collected: Sketch | None = None
+
+    @staticmethod
+    def _statistic(q: float) -> str:
+        return f"p{q * 100:g}"
+
+    def observe(self, value: float) -> None:
+        """Record an observation.
+
+        Args:
+            value (float): The observed value.
+        """
+        with self._lock:
+            self.sketch.add(value)
+
+    def collect(self) -> list[Sample]:
+        """Collect the quantiles and count of the observations since the last collect.
+
+        Returns:
+            The quantiles followed by the count, or nothing if there were no observations.
+        """
+        with self._lock:
+            sketch = self._collected = self.sketch
+            self.sketch = Sketch(sketch.relative_accuracy, sketch.max_buckets)
+
+        if not sketch.count:
+            return []
+
+        samples = [Sample(self.title(self._statistic(q)), sketch.quantile(q)) for q in self.quantiles]  # type: ignore
+        samples.append(Sample(self.title("count"), sketch.count, increment=True))
+        return samples
+
+    def restore(self, samples: list[Sample]) -> None:
+        """Merge the observations of the last collect back, unless its count was published.
+
+        Args:
+            samples (list[Sample]): The unsent samples.
+        """
+        collected = self._collected
+        if collected is None or not samples or not samples[-1].increment:
+            return
+        self._collected = None
+        with self._lock:
+            self.sketch.merge(collected)
+
+
+class Summary(Metric):
+    """A stream of observations, published as the count, sum, mean, min and max of each interval."""
+
+    __slots__ = ("count", "sum", "min", "max")
+
+    STATISTICS = ("count", "sum", "mean", "min", "max")
+
+    def __init__(self, name: str) -> None:
+        """Initialize the summary.
+
+        Args:
+            name (str): The name of the summary, used as the prefix of its insight titles.
+        """
+        super().__init__(name)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def observe(self, value: float) -> None:
+        """Record an observation.
+
+        Args:
+            value (float): The observed value.
+        """
+        with self._lock:
+            self.count += 1
+            self.sum += value
+            self.min = min(self.min, value)
+            self.max = max(self.max, value)
+
+    def collect(self) -> list[Sample]:
+        """Collect the statistics of the observations since the last collect.
+
+        Returns:
+            The mean, min and max followed by the count and sum, or nothing if there is nothing to send.
+        """
+        with self._lock:
+            count, total, low, high = self.count, self.sum, self.min, self.max
+            self.count = 0
+            self.sum = 0.0
+            self.min = math.inf
+            self.max = -math.inf
+
+        if not count and not total:
+            return []
+
+        samples = []
+        if count:
+            samples = [
+                Sample(self.title("mean"), total / count),
+                Sample(self.title("min"), low),
+                Sample(self.title("max"), high),
+            ]
+        # a sum restored after its count was published still has to be sent
+        samples.append(Sample(self.title("count"), count, increment=True))
+        samples.append(Sample(self.title("sum"), total, increment=True))
+        return samples
+
+    def restore(self, samples: list[Sample]) -> None:
+        """Merge the unsent count, sum, min and max back.
+
+        Args:
+            samples (list[Sample]): The unsent samples.
+        """
+        statistics = {sample.title[len(self.name) + 1 :]: sample.value for sample in samples}
+        with self._lock:
+            self.count += int(statistics.get("count", 0))
+            self.sum += statistics.get("sum", 0.0)
+            self.min = min(self.min, statistics.get("min", math.inf))
+            self.max = max(self.max, statistics.get("max", -math.inf))
@@ -0,0 +1,391 @@
+"""lawg.py local SQLite mirror of feeds, for querying events without downloading them again."""
+
+from __future__ import annotations
+
+import itertools
+import json
+import sqlite3
+import threading
+import typing as t
+
+from lawg import pika
+
+if t.TYPE_CHECKING:
+    from lawg.base.event import BaseEvent
+    from lawg.typings import PATH, STR_DICT
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id TEXT PRIMARY KEY,
+    snowflake INTEGER NOT NULL,
+    feed TEXT NOT NULL,
+    project_id TEXT NOT NULL,
+    feed_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT,
+    emoji TEXT,
+    tags TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS events_snowflake ON events (snowflake);
+CREATE INDEX IF NOT EXISTS events_feed_snowflake ON events (feed, snowflake);
+CREATE INDEX IF NOT EXISTS events_feed_title ON events (feed, title);
+CREATE TABLE IF NOT EXISTS event_tags (
+    event_id TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value,
+    PRIMARY KEY (event_id, key)
+);
+CREATE INDEX IF NOT EXISTS event_tags_key_value ON event_tags (key, value);
+CREATE TABLE IF NOT EXISTS feeds (
+    name TEXT PRIMARY KEY,
+    last_id TEXT,
+    last_snowflake INTEGER
+);
+"""
+
+# an external content index over the events table, kept in sync by triggers; the tags column holds
+# JSON text, which the tokenizer splits into the tags' keys and values
+_FULL_TEXT_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5 (
+    title, description, tags, content = 'events', content_rowid = 'snowflake'
+);
+CREATE TRIGGER IF NOT EXISTS events_fts_insert AFTER INSERT ON events BEGIN
+    INSERT INTO events_fts (rowid, title, description, tags)
+    VALUES (new.snowflake, new.title, new.description, new.tags);
+END;
+CREATE TRIGGER IF NOT EXISTS events_fts_delete AFTER DELETE ON events BEGIN
+    INSERT INTO events_fts (events_fts, rowid, title, description, tags)
+    VALUES ('delete', old.snowflake, old.title, old.description, old.tags);
+END;
+CREATE TRIGGER IF NOT EXISTS events_fts_update AFTER UPDATE ON events BEGIN
+    INSERT INTO events_fts (events_fts, rowid, title, description, tags)
+    VALUES ('delete', old.snowflake, old.title, old.description, old.tags);
+    INSERT INTO events_fts (rowid, title, description, tags)
+    VALUES (new.snowflake, new.title, new.description, new.tags);
+END;
+"""
+
+_COLUMNS = ("id", "feed", "project_id", "feed_id", "title", "description", "emoji", "tags")
+_SELECT = f"SELECT {', '.join(_COLUMNS)} FROM events"  # noqa: S608 (constant column names)
+
+# the clauses a query's WHERE is joined from, every value they compare to is a bound parameter
+_FEED = "feed = ?"
+_SINCE = "snowflake >= ?"
+_UNTIL = "snowflake < ?"
+_MATCH = "snowflake IN (SELECT rowid FROM events_fts WHERE events_fts MATCH ?)"
+_LIKE = "(title LIKE ? ESCAPE '\\' OR description LIKE ? ESCAPE '\\' OR tags LIKE ? ESCAPE '\\')"
+_TITLE = "title = ?"
+_TAG = "id IN (SELECT event_id FROM event_tags WHERE key = ? AND value = ?)"
+
+
+class EventMirror:
+    """A local SQLite copy of feeds' events, indexed by time, title and tags.
+
+    `Client.sync_mirror()` copies the events created since the feed's last sync, so keeping a
+    mirror up to date costs one request per page of new events. Queries then run against the
+    local database instead of paging through the API.
+
+    Titles, descriptions and tags are indexed for full-text search with SQLite's FTS5 extension,
+    or scanned if the extension isn't available. A client created with the mirror keeps it up to
+    date as it edits and deletes events.
+
+    Events are ordered by their id, which encodes their creation time. Events deleted or edited
+    through other clients aren't noticed by incremental syncs; `clear()` a feed to copy it afresh.
+
+    Example:
+        >>> mirror = EventMirror("events.db")
+        >>> client.sync_mirror(mirror, feed="signups")
+        >>> mirror.events("signups", tags={"plan": "pro"}, limit=10)
+        >>> mirror.events("signups", query="refund failed")
+    """
+
+    VERSION = 2
+
+    __slots__ = ("path", "batch_size", "connection", "full_text", "_lock")
+
+    def __init__(self, path: PATH = ":memory:", *, batch_size: int = 500) -> None:
+        """Initialize the mirror, creating the database if needed.
+
+        Args:
+            path (str | os.PathLike, optional): The database file. Defaults to an in-memory database.
+            batch_size (int, optional): The number of events written per transaction.
+        """
+        self.path = path
+        self.batch_size = batch_size
+        # shared with the executor threads of async clients, every use is serialized by the lock
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self.connection:
+            version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+            if version > self.VERSION:
+                msg = f"unsupported mirror version {version}"
+                raise ValueError(msg)
+            self.connection.executescript(_SCHEMA)
+            self.full_text = self._create_full_text()
+            self.connection.execute(f"PRAGMA user_version = {self.VERSION}")
+
+    def _create_full_text(self) -> bool:
+        exists = self.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'events_fts'"
+        ).fetchone()
+        if exists:
+            return True
+        try:
+            self.connection.executescript(_FULL_TEXT_SCHEMA)
+        except sqlite3.OperationalError:
+            # sqlite was built without fts5
+            return False
+        # index the events stored before the index existed
+        self.connection.execute("INSERT INTO events_fts (events_fts) VALUES ('rebuild')")
+        return True
+
+    def __repr__(self) -> str:
+        """Represent the mirror by its database path."""
+        return f"<{self.__class__.__name__} path={self.path!r}>"
+
+    def __enter__(self) -> EventMirror:
+        """Enter a block that closes the database on exit."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Close the database."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self.connection.close()
+
+    # --- SYNC STATE --- #
+
+    def last_id(self, feed: str) -> str | None:
+        """Get the id of the newest event synced from a feed.
+
+        Args:
+            feed (str): The name of the feed.
+        """
+        with self._lock:
+            row = self.connection.execute("SELECT last_id FROM feeds WHERE name = ?", (feed,)).fetchone()
+        return None if row is None else row[0]
+
+    def advance(self, feed: str, last_id: str) -> None:
+        """Record that a feed was synced up to an event, unless it was already synced further.
+
+        Args:
+            feed (str): The name of the feed.
+            last_id (str): The id of the newest synced event.
+        """
+        snowflake = pika.snowflake(last_id)
+        with self._lock, self.connection:
+            self.connection.execute(
+                "INSERT INTO feeds (name, last_id, last_snowflake) VALUES (?, ?, ?)"
+                " ON CONFLICT (name) DO UPDATE SET last_id = excluded.last_id, last_snowflake = excluded.last_snowflake"
+                " WHERE last_snowflake IS NULL OR excluded.last_snowflake > last_snowflake",
+                (feed, last_id, snowflake),
+            )
+
+    def feeds(self) -> list[str]:
+        """Get the names of the synced feeds."""
+        with self._lock:
+            return [row[0] for row in self.connection.execute("SELECT name FROM feeds ORDER BY name")]
+
+    # --- WRITES --- #
+
+    def store(self, feed: str, events: t.Iterable[BaseEvent[t.Any]]) -> int:
+        """Write events, replacing any stored under the same id.
+
+        The events are consumed lazily and written in transactions of `batch_size` events, so
+        an iterator paging through the API is stored as it's fetched.
+
+        Args:
+            feed (str): The name of the feed.
+            events (Iterable[Event]): The events.
+
+        Returns:
+            The number of events written.
+        """
+        count = 0
+        iterator = iter(events)
+        while True:
+            batch = list(itertools.islice(iterator, self.batch_size))
+            if not batch:
+                return count
+            self._write(feed, batch)
+            count += len(batch)
+
+    def _write(self, feed: str, events: list[BaseEvent[t.Any]]) -> None:
+        rows = []
+        tag_rows = []
+        for event in events:
+            tags = event.tags
+            rows.append(
+                (
+                    event.id,
+                    pika.snowflake(event.id),
+                    feed,
+                    event.project_id,
+                    event.feed_id,
+                    event.title,
+                    event.description,
+                    event.emoji,
+                    None if tags is None else json.dumps(tags, ensure_ascii=False),
+                )
+            )
+            if tags:
+                tag_rows += [(event.id, key, value) for key, value in tags.items()]
+
+        with self._lock, self.connection:
+            self.connection.executemany(
+                "DELETE FROM event_tags WHERE event_id = ?", [(event.id,) for event in events]
+            )
+            # an upsert rather than a replace, which would skip the full-text index's delete trigger
+            self.connection.executemany(
+                "INSERT INTO events (id, snowflake, feed, project_id, feed_id, title, description, emoji, tags)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (id) DO UPDATE SET feed = excluded.feed, project_id = excluded.project_id,"
+                " feed_id = excluded.feed_id, title = excluded.title, description = excluded.description,"
+                " emoji = excluded.emoji, tags = excluded.tags",
+                rows,
+            )
+            self.connection.executemany("INSERT INTO event_tags (event_id, key, value) VALUES (?, ?, ?)", tag_rows)
+
+    def delete(self, ids: t.Iterable[str]) -> None:
+        """Delete events.
+
+        Args:
+            ids (Iterable[str]): The ids of the events.
+        """
+        params = [(event_id,) for event_id in ids]
+        with self._lock, self.connection:
+            self.connection.executemany("DELETE FROM event_tags WHERE event_id = ?", params)
+            self.connection.executemany("DELETE FROM events WHERE id = ?", params)
+
+    def clear(self, feed: str) -> None:
+        """Delete a feed's events and sync state, so the next sync copies it afresh.
+
+        Args:
+            feed (str): The name of the feed.
+        """
+        with self._lock, self.connection:
+            self.connection.execute(
+                "DELETE FROM event_tags WHERE event_id IN (SELECT id FROM events WHERE feed = ?)", (feed,)
+            )
+            self.connection.execute("DELETE FROM events WHERE feed = ?", (feed,))
+            self.connection.execute("DELETE FROM feeds WHERE name = ?", (feed,))
+
+    # --- QUERIES --- #
+
+    def events(
+        self,
+        feed: str,
+        *,
+        since: pika.Bound | None = None,
+        until: pika.Bound | None = None,
+        query: str | None = None,
+        title: str | None = None,
+        tags: t.Mapping[str, str | int | float | bool] | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[STR_DICT]:
+        """Query a feed's events, newest first.
+
+        Args:
+            feed (str): The name of the feed.
+            since (str | datetime.datetime, optional): Only events after this event id, or at or after this time.
+            until (str | datetime.datetime, optional): Only events before this event id or time.
+            query (str, optional): Only events whose title, description or tags contain all of these words.
+            title (str, optional): Only events with this title.
+            tags (Mapping[str, str | int | float | bool], optional): Only events with all of these tags.
+            limit (int, optional): The maximum number of events.
+            offset (int, optional): The number of events to skip.
+
+        Returns:
+            The events' data as loaded by `EventSchema`, with the name of their feed.
+        """
+        where, params = self._where(feed, since=since, until=until, query=query, title=title, tags=tags)
+        # only constant clauses are interpolated, the values are bound
+        sql = f"{_SELECT} WHERE {where} ORDER BY snowflake DESC LIMIT ? OFFSET ?"
+        params += [-1 if limit is None else limit, offset]
+        with self._lock:
+            rows = self.connection.execute(sql, params).fetchall()
+        return [self._event_data(row) for row in rows]
+
+    def count(
+        self,
+        feed: str,
+        *,
+        since: pika.Bound | None = None,
+        until: pika.Bound | None = None,
+        query: str | None = None,
+        title: str | None = None,
+        tags: t.Mapping[str, str | int | float | bool] | None = None,
+    ) -> int:
+        """Count a feed's events, filtered like `events()`.
+
+        Args:
+            feed (str): The name of the feed.
+            since (str | datetime.datetime, optional): Only events after this event id, or at or after this time.
+            until (str | datetime.datetime, optional): Only events before this event id or time.
+            query (str, optional): Only events whose title, description or tags contain all of these words.
+            title (str, optional): Only events with this title.
+            tags (Mapping[str, str | int | float | bool], optional): Only events with all of these tags.
+        """
+        where, params = self._where(feed, since=since, until=until, query=query, title=title, tags=tags)
+        with self._lock:
+            # only constant clauses are interpolated, the values are bound
+            return self.connection.execute(f"SELECT COUNT(*) FROM events WHERE {where}", params).fetchone()[0]  # noqa: S608
+
+    def event(self, id: str) -> STR_DICT | None:
+        """Get an event's data by id.
+
+        Args:
+            id (str): The id of the event.
+        """
+        with self._lock:
+            row = self.connection.execute(f"{_SELECT} WHERE id = ?", (id,)).fetchone()
+        return None if row is None else self._event_data(row)
+
+    def _where(
+        self,
+        feed: str,
+        *,
+        since: pika.Bound | None,
+        until: pika.Bound | None,
+        query: str | None,
+        title: str | None,
+        tags: t.Mapping[str, t.Any] | None,
+    ) -> tuple[str, list[t.Any]]:
+        lower, upper = pika.window(since, until)
+        conditions = [_FEED]
+        params: list[t.Any] = [feed]
+        if lower:
+            conditions.append(_SINCE)
+            params.append(lower)
+        if upper is not None:
+            conditions.append(_UNTIL)
+            params.append(upper)
+        words = query.split() if query else []
+        if words and self.full_text:
+            # every word quoted, so they're matched as plain text rather than as query syntax
+            match = " ".join('"{}"'.format(word.replace('"', '""')) for word in words)
+            conditions.append(_MATCH)
+            params.append(match)
+        elif words:
+            for word in words:
+                pattern = "%{}%".format(word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_"))
+                conditions.append(_LIKE)
+                params += [pattern, pattern, pattern]
+        if title is not None:
+            conditions.append(_TITLE)
+            params.append(title)
+        for key, value in (tags or {}).items():
+            conditions.append(_TAG)
+            params += [key, value]
+        return " AND ".join(conditions), params
+
+    @staticmethod
+    def _event_data(row: tuple[t.Any, ...]) -> STR_DICT:
+        event_data = {column: row[index] for index, column in enumerate(_COLUMNS)}
+        if event_data["tags"] is not None:
+            event_data["tags"] = json.loads(event_data["tags"])
+        return event_data
@@ -0,0 +1,176 @@
+"""lawg.py pika id decoding.
+
+Pika ids are a prefix and the base64url-encoded decimal string of a snowflake:
+
+    event_NjM1MDU0Njk5Mzk2OTkzMDI3 -> event, 635054699396993027
+
+The snowflake holds the milliseconds since the pika epoch (2022-01-01), the id of the node that
+generated it and a per-millisecond sequence, so ids sort by creation time and can be compared
+against times without fetching anything.
+"""
+
+from __future__ import annotations
+
+import base64
+import datetime
+import typing as t
+
+from lawg.exceptions import LawgInvalidPikaError
+
+# 2022-01-01T00:00:00Z, in unix milliseconds
+EPOCH = 1640995200000
+
+TIMESTAMP_SHIFT = 22
+NODE_SHIFT = 12
+NODE_MASK = 0x3FF
+SEQUENCE_MASK = 0xFFF
+
+# a bound for filtering by id: a pika id, or an aware or utc datetime
+Bound = t.Union[str, datetime.datetime]
+
+
+class PikaParts(t.NamedTuple):
+    """A decoded pika id."""
+
+    prefix: str
+    snowflake: int
+    # unix milliseconds
+    timestamp: int
+    node: int
+    sequence: int
+
+    @property
+    def datetime(self) -> datetime.datetime:
+        """The time the id was generated at, in utc."""
+        return datetime.datetime.fromtimestamp(self.timestamp / 1000, tz=datetime.timezone.utc)
+
+
+def snowflake(id: str) -> int:
+    """Get the snowflake of a pika id.
+
+    Args:
+        id (str): The pika id.
+
+    Raises:
+        LawgInvalidPikaError: If the id isn't a valid pika id.
+    """
+    prefix, _, tail = id.rpartition("_")
+    if not prefix or not tail:
+        raise LawgInvalidPikaError(id)
+    try:
+        text = base64.urlsafe_b64decode(tail + "=" * (-len(tail) % 4)).decode("ascii")
+    except ValueError as exc:
+        raise LawgInvalidPikaError(id) from exc
+    # secure ids encode "s_<random>_<snowflake>"
+    if text.startswith("s_"):
+        text = text.rpartition("_")[2]
+    if not text.isdigit():
+        raise LawgInvalidPikaError(id)
+    return int(text)
+
+
+def decode(id: str) -> PikaParts:
+    """Decode a pika id.
+
+    Args:
+        id (str): The pika id.
+
+    Raises:
+        LawgInvalidPikaError: If the id isn't a valid pika id.
+    """
+    value = snowflake(id)
+    return PikaParts(
+        prefix=id.rpartition("_")[0],
+        snowflake=value,
+        timestamp=(value >> TIMESTAMP_SHIFT) + EPOCH,
+        node=(value >> NODE_SHIFT) & NODE_MASK,
+        sequence=value & SEQUENCE_MASK,
+    )
+
+
+def encode(prefix: str, snowflake: int) -> str:
+    """Encode a snowflake as a pika id.
+
+    Args:
+        prefix (str): The prefix of the id, e.g. "event".
+        snowflake (int): The snowflake.
+    """
+    tail = base64.urlsafe_b64encode(str(snowflake).encode("ascii")).decode("ascii").rstrip("=")
+    return f"{prefix}_{tail}"
+
+
+def decode_many(ids: t.Iterable[str]) -> list[PikaParts]:
+    """Decode many pika ids.
+
+    Args:
+        ids (Iterable[str]): The pika ids.
+
+    Raises:
+        LawgInvalidPikaError: If any id isn't a valid pika id.
+    """
+    return [decode(pika_id) for pika_id in ids]
+
+
+def snowflakes(ids: t.Iterable[str]) -> list[int]:
+    """Get the snowflakes of many pika ids, e.g. to sort them by creation time.
+
+    Args:
+        ids (Iterable[str]): The pika ids.
+
+    Raises:
+        LawgInvalidPikaError: If any id isn't a valid pika id.
+    """
+    return [snowflake(pika_id) for pika_id in ids]
+
+
+def timestamp(id: str) -> datetime.datetime:
+    """Get the time a pika id was generated at, in utc.
+
+    Args:
+        id (str): The pika id.
+
+    Raises:
+        LawgInvalidPikaError: If the id isn't a valid pika id.
+    """
+    return decode(id).datetime
+
+
+def snowflake_at(when: datetime.datetime) -> int:
+    """Get the smallest snowflake generated at or after a time.
+
+    Args:
+        when (datetime.datetime): The time; naive datetimes are taken as utc.
+    """
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=datetime.timezone.utc)
+    milliseconds = int(when.timestamp() * 1000)
+    return max(0, milliseconds - EPOCH) << TIMESTAMP_SHIFT
+
+
+def window(since: Bound | None = None, until: Bound | None = None) -> tuple[int, int | None]:
+    """Get the snowflake range between two bounds.
+
+    A datetime `since` is inclusive and a datetime `until` exclusive; pika id bounds are both
+    exclusive, selecting the ids generated strictly after or before them.
+
+    Args:
+        since (str | datetime.datetime, optional): The lower bound.
+        until (str | datetime.datetime, optional): The upper bound.
+
+    Returns:
+        The inclusive lower and exclusive upper snowflake, None if there's no upper bound.
+    """
+    if since is None:
+        lower = 0
+    elif isinstance(since, str):
+        lower = snowflake(since) + 1
+    else:
+        lower = snowflake_at(since)
+
+    if until is None:
+        upper = None
+    elif isinstance(until, str):
+        upper = snowflake(until)
+    else:
+        upper = snowflake_at(until)
+    return lower, upper
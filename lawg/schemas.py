@@ -75,6 +75,11 @@ EventTagsSchema = functools.partial(
     keys=fields.Str(validate=validate.Length(min=1, max=175)),
     values=Union([fields.Str(), fields.Int(), fields.Float(), fields.Bool()]),
 )
+EventMetadataSchema = functools.partial(
+    fields.Dict,
+    keys=fields.Str(validate=validate.Length(min=1, max=175)),
+    values=Union([fields.Str(), fields.Int(), fields.Float(), fields.Bool()]),
+)
 
 # --- INSIGHTS --- #
 
@@ -169,7 +174,7 @@ class FeedDeleteSlugSchema(Schema):
     """Feed delete slug validation schema."""
 
     namespace = ProjectNamespaceSchema(required=True)
-    feed_name = FeedNameSchema(required=True)
+    feed = FeedNameSchema(required=True)
 
 
 class FeedPatchBodySchema(Schema):
@@ -184,14 +189,14 @@ class FeedPatchSlugSchema(Schema):
     """Feed patch slug validation schema."""
 
     namespace = ProjectNamespaceSchema(required=True)
-    feed_name = FeedNameSchema(required=True)
+    feed = FeedNameSchema(required=True)
 
 
 class FeedReadSlugSchema(Schema):
     """Feed read slug validation schema."""
 
     namespace = ProjectNamespaceSchema(required=True)
-    feed_name = FeedNameSchema(required=True)
+    feed = FeedNameSchema(required=True)
 
 
 # --- EVENTS --- #
@@ -213,6 +218,7 @@ class EventCreateBodySchema(Schema):
     tags = EventTagsSchema(required=False, allow_none=True)
     timestamp = fields.DateTime(required=False, allow_none=True)
     notify = fields.Boolean(required=False, allow_none=True)
+    metadata = EventMetadataSchema(required=False, allow_none=True)
 
 
 class EventDeleteSlugSchema(Schema):
@@ -234,7 +240,7 @@ class EventDeleteMultipleSlugSchema(Schema):
     """Event delete multiple slug validation schema."""
 
     namespace = ProjectNamespaceSchema(required=True)
-    feed_name = FeedNameSchema(required=True)
+    feed = FeedNameSchema(required=True)
     event_id = PikaId(prefix="event", required=True)
 
 
@@ -242,7 +248,7 @@ class EventGetSlugSchema(Schema):
     """Event get slug validation schema."""
 
     namespace = ProjectNamespaceSchema(required=True)
-    feed_name = FeedNameSchema(required=True)
+    feed = FeedNameSchema(required=True)
     event_id = PikaId(prefix="event", required=True)
 
 
@@ -257,7 +263,7 @@ class EventGetMultipleSlugSchema(Schema):
     """Event get multiple slug validation schema."""
 
     namespace = ProjectNamespaceSchema(required=True)
-    feed_name = FeedNameSchema(required=True)
+    feed = FeedNameSchema(required=True)
 
 
 class EventPatchBodySchema(Schema):
@@ -274,7 +280,7 @@ class EventPatchSlugSchema(Schema):
     """Event patch slug validation schema."""
 
     namespace = ProjectNamespaceSchema(required=True)
-    feed_name = FeedNameSchema(required=True)
+    feed = FeedNameSchema(required=True)
     event_id = PikaId(prefix="event", required=True)
 
 
@@ -285,6 +291,7 @@ class InsightCreateBodySchema(Schema):
     """Insight create body validation schema."""
 
     title = InsightTitleSchema(required=True)
+    description = InsightDescriptionSchema(required=False, allow_none=True)
     emoji = EmojiSchema(required=False, allow_none=True)
     value = fields.Float(required=False, allow_none=True)
 
@@ -359,7 +366,8 @@ class APISuccessSchema(Schema):
     """API success validation schema."""
 
     success = fields.Boolean(required=True, validate=validate.Equal(True))
-    data = fields.Dict(required=True)
+    # list endpoints return an array, so data can't be restricted to a mapping
+    data = fields.Raw(required=True)
 
 
 # ----- API RESPONSE SCHEMAS ----- #
@@ -419,6 +427,7 @@ class EventSchema(Schema):
     title = EventTitleSchema(required=True)
     description = EventDescriptionSchema(required=True, allow_none=True)
     emoji = EmojiSchema(required=True, allow_none=True)
+    tags = EventTagsSchema(required=False, allow_none=True, load_default=None)
 
     class Meta:
         """Marshmallow schema meta options."""
@@ -445,6 +454,8 @@ class InsightSchema(Schema):
 
 # --- WEBSOCKET SCHEMAS --- #
 
+WEBSOCKET_EVENT_TYPES = ("EVENT_CREATE", "EVENT_DELETE", "EVENT_UPDATE")
+
 
 class WebsocketEventData(Schema):
     """Websocket event data validation schema."""
@@ -458,6 +469,52 @@ class WebsocketEvent(Schema):
     """Websocket event validation schema."""
 
     # event
-    e = fields.Str(required=True, validate=validate.OneOf(("EVENT_CREATE", "EVENT_DELETE", "EVENT_UPDATE")))
+    e = fields.Str(required=True, validate=validate.OneOf(WEBSOCKET_EVENT_TYPES))
     # data
     d = fields.Nested(WebsocketEventData(), required=True)
+
+
+class WebsocketFeedEventData(Schema):
+    """Websocket feed event data validation schema."""
+
+    project = fields.Str(required=True)
+    feed = fields.Str(required=True)
+    event = fields.Nested(EventSchema(), required=True)
+
+    class Meta:
+        """Marshmallow schema meta options."""
+
+        unknown = EXCLUDE
+
+
+class WebsocketFeedEvent(Schema):
+    """Websocket feed event validation schema, for frames pushed to feed subscriptions."""
+
+    # event
+    e = fields.Str(required=True, validate=validate.OneOf(WEBSOCKET_EVENT_TYPES))
+    # data
+    d = fields.Nested(WebsocketFeedEventData(), required=True)
+
+    class Meta:
+        """Marshmallow schema meta options."""
+
+        unknown = EXCLUDE
+
+
+# --- PREBUILT SCHEMAS --- #
+
+S = t.TypeVar("S", bound=Schema)
+
+
+@functools.lru_cache(maxsize=None)
+def prebuilt(schema: type[S], *, many: bool = False) -> S:
+    """Get the shared instance of a schema.
+
+    Building a schema binds a copy of every one of its fields, so requests share one instance
+    per schema instead of building it every time. Shared instances must not be modified.
+
+    Args:
+        schema (type[Schema]): The schema class.
+        many (bool, optional): Whether the instance loads lists.
+    """
+    return schema(many=many)
@@ -0,0 +1,165 @@
+"""lawg.py project snapshots, for warm starts without a burst of API requests."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+import typing as t
+
+from marshmallow import ValidationError
+
+from lawg.schemas import InsightSchema, ProjectSchema, prebuilt
+
+if t.TYPE_CHECKING:
+    from lawg.typings import PATH, STR_DICT
+
+
+class ProjectSnapshot:
+    """A project with its feeds, members and insights, indexed for local lookups.
+
+    Snapshots are taken by `Client.warm()` and can be persisted to disk, so workers can
+    answer feed-existence checks and insight lookups without contacting the API.
+    """
+
+    VERSION = 1
+
+    __slots__ = ("project", "feeds", "members", "insights", "insight_ids", "taken_at")
+
+    def __init__(self, project_data: STR_DICT, insights_data: list[STR_DICT], taken_at: float | None = None) -> None:
+        """Initialize the snapshot.
+
+        Args:
+            project_data (dict[str, Any]): The project, as loaded by `ProjectSchema`.
+            insights_data (list[dict[str, Any]]): The insights, as loaded by `InsightSchema`.
+            taken_at (float, optional): The unix time the snapshot was taken at. Defaults to now.
+        """
+        self.project = project_data
+        self.feeds: dict[str, STR_DICT] = {feed["name"]: feed for feed in project_data["feeds"]}
+        self.members: dict[str, STR_DICT] = {member["username"]: member for member in project_data["members"]}
+        self.insights: dict[str, STR_DICT] = {insight["id"]: insight for insight in insights_data}
+        self.insight_ids: dict[str, str] = {insight["title"]: insight["id"] for insight in insights_data}
+        self.taken_at = time.time() if taken_at is None else taken_at
+
+    def __repr__(self) -> str:
+        """Represent the snapshot by its project, size and age."""
+        return (
+            f"<{self.__class__.__name__} project={self.project['namespace']!r} feeds={len(self.feeds)}"
+            f" insights={len(self.insights)} age={self.age:.0f}s>"
+        )
+
+    @property
+    def age(self) -> float:
+        """Seconds since the snapshot was taken."""
+        return time.time() - self.taken_at
+
+    # --- LOOKUPS --- #
+
+    def has_feed(self, name: str) -> bool:
+        """Check whether the project has a feed.
+
+        Args:
+            name (str): The name of the feed.
+        """
+        return name in self.feeds
+
+    def feed(self, name: str) -> STR_DICT | None:
+        """Get a feed's data by name.
+
+        Args:
+            name (str): The name of the feed.
+        """
+        return self.feeds.get(name)
+
+    def member(self, username: str) -> STR_DICT | None:
+        """Get a member's data by username.
+
+        Args:
+            username (str): The username of the member.
+        """
+        return self.members.get(username)
+
+    def insight(self, id: str) -> STR_DICT | None:
+        """Get an insight's data by id.
+
+        Args:
+            id (str): The id of the insight.
+        """
+        return self.insights.get(id)
+
+    def insight_by_title(self, title: str) -> STR_DICT | None:
+        """Get an insight's data by title.
+
+        Args:
+            title (str): The title of the insight.
+        """
+        insight_id = self.insight_ids.get(title)
+        return None if insight_id is None else self.insights.get(insight_id)
+
+    def forget_insight(self, id: str) -> None:
+        """Drop an insight that no longer exists.
+
+        Args:
+            id (str): The id of the insight.
+        """
+        if self.insights.pop(id, None) is not None:
+            self.insight_ids = {title: insight_id for title, insight_id in self.insight_ids.items() if insight_id != id}
+
+    # --- PERSISTENCE --- #
+
+    def save(self, path: PATH) -> None:
+        """Persist the snapshot to disk.
+
+        Args:
+            path (str | os.PathLike): The file to write.
+        """
+        data = {
+            "version": self.VERSION,
+            "taken_at": self.taken_at,
+            "project": prebuilt(ProjectSchema).dump(self.project),
+            "insights": prebuilt(InsightSchema, many=True).dump(list(self.insights.values())),
+        }
+        # write then rename, so concurrent workers never read a truncated snapshot, through a file
+        # of its own as other threads of the process may be saving to the same path
+        path = os.fspath(path)
+        fd, tmp_path = tempfile.mkstemp(prefix=f"{os.path.basename(path)}.", suffix=".tmp", dir=os.path.dirname(path) or None)
+        try:
+            with open(fd, "w", encoding="utf-8") as file:
+                json.dump(data, file)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: PATH, *, max_age: float | None = None) -> ProjectSnapshot | None:
+        """Load a snapshot from disk.
+
+        Args:
+            path (str | os.PathLike): The file to read.
+            max_age (float, optional): The maximum age of the snapshot in seconds.
+
+        Returns:
+            The snapshot, or None if the file is missing, unreadable, from another version, doesn't
+            match the schemas or is too old.
+        """
+        try:
+            with open(path, encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get("version") != cls.VERSION:
+            return None
+        try:
+            project_data: STR_DICT = prebuilt(ProjectSchema).load(data["project"])  # type: ignore
+            insights_data: list[STR_DICT] = prebuilt(InsightSchema, many=True).load(data["insights"])  # type: ignore
+            snapshot = cls(project_data, insights_data, taken_at=float(data["taken_at"]))
+        except (KeyError, TypeError, ValueError, ValidationError):
+            # truncated, or written with a schema that has changed since
+            return None
+
+        if max_age is not None and snapshot.age > max_age:
+            return None
+        return snapshot
@@ -0,0 +1,196 @@
+"""lawg.py incremental decoding of streamed JSON responses."""
+
+from __future__ import annotations
+
+import json
+import re
+import typing as t
+
+from lawg.exceptions import LawgStreamDecodeError
+
+# characters that change the structure outside of strings, and that end or escape inside them
+_STRUCTURE = re.compile(r'["\[\]{},]')
+_STRING_END = re.compile(r'["\\]')
+
+
+class JSONArrayDecoder:
+    """Decodes the items of an array held by a top-level key of a streamed JSON object.
+
+    Text is fed in chunks as it arrives, and each item is decoded as soon as its last character
+    was fed. Only the text of the item being received is buffered, so memory stays proportional
+    to the largest item rather than to the whole response.
+
+    Example:
+        >>> decoder = JSONArrayDecoder("data")
+        >>> decoder.feed('{"success": true, "data": [{"id": 1}, {"i')
+        [{'id': 1}]
+        >>> decoder.feed('d": 2}]}')
+        [{'id': 2}]
+        >>> decoder.close()
+    """
+
+    __slots__ = (
+        "key",
+        "_buffer",
+        "_position",
+        "_depth",
+        "_in_string",
+        "_string_start",
+        "_last_string",
+        "_state",
+        "_item_start",
+        "_emitted",
+        "_ended",
+    )
+
+    # states
+    _SEEK = 0  # looking for the key in the top-level object
+    _ITEMS = 1  # inside the array, between or inside items
+    _DONE = 2  # the array was closed
+
+    def __init__(self, key: str = "data") -> None:
+        """Initialize the decoder.
+
+        Args:
+            key (str, optional): The top-level key holding the array.
+        """
+        self.key = key
+        self._buffer = ""
+        self._position = 0
+        self._depth = 0
+        self._in_string = False
+        self._string_start = 0
+        self._last_string: str | None = None
+        self._state = self._SEEK
+        self._item_start: int | None = None
+        self._emitted = False
+        # an array or object item was decoded and its separator hasn't been scanned yet
+        self._ended = False
+
+    def __repr__(self) -> str:
+        """Represent the decoder by the key of its array."""
+        return f"<{self.__class__.__name__} key={self.key!r}>"
+
+    @property
+    def done(self) -> bool:
+        """Whether the whole array was decoded."""
+        return self._state == self._DONE
+
+    def feed(self, text: str) -> list[t.Any]:
+        """Feed the next chunk of the response.
+
+        Args:
+            text (str): The chunk of text.
+
+        Returns:
+            The items completed by this chunk.
+        """
+        return list(self._scan(text))
+
+    def _scan(self, text: str) -> t.Iterator[t.Any]:
+        if self._state == self._DONE or not text:
+            return
+        self._buffer += text
+        buffer = self._buffer
+
+        while True:
+            if self._in_string:
+                match = _STRING_END.search(buffer, self._position)
+                if match is None:
+                    self._position = len(buffer)
+                    break
+                if match.group() == "\\":
+                    if match.end() >= len(buffer):
+                        # the escaped character hasn't arrived yet
+                        self._position = match.start()
+                        break
+                    self._position = match.end() + 1
+                    continue
+                self._in_string = False
+                self._position = match.end()
+                if self._state == self._SEEK and self._depth == 1:
+                    self._last_string = json.loads(buffer[self._string_start : self._position])
+                continue
+
+            match = _STRUCTURE.search(buffer, self._position)
+            if match is None:
+                self._position = len(buffer)
+                break
+            char = match.group()
+            index = match.start()
+            self._position = match.end()
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = index
+                if self._state == self._ITEMS and self._depth == 2 and self._item_start is None:
+                    self._item_start = index
+            elif char in "[{":
+                if self._state == self._SEEK:
+                    if self._depth == 0 and char != "{":
+                        msg = "expected a JSON object"
+                        raise LawgStreamDecodeError(msg)
+                    if self._depth == 1 and char == "[" and self._last_string == self.key:
+                        self._state = self._ITEMS
+                elif self._depth == 2 and self._item_start is None:
+                    self._item_start = index
+                self._depth += 1
+            elif char in "]}":
+                if self._state == self._ITEMS and self._depth == 2:
+                    # the end of the array, which may also end a scalar item
+                    yield from self._emit(buffer, index, closing=True)
+                    self._state = self._DONE
+                    self._buffer = ""
+                    return
+                self._depth -= 1
+                if self._state == self._ITEMS and self._depth == 2:
+                    yield from self._emit(buffer, self._position)
+                    self._ended = True
+            elif char == ",":
+                if self._state == self._ITEMS and self._depth == 2:
+                    yield from self._emit(buffer, index)
+                elif self._state == self._SEEK and self._depth == 1:
+                    self._last_string = None
+
+            if self._state == self._ITEMS and self._depth == 2 and self._item_start is None:
+                # between items nothing has to be kept, drop what was already scanned
+                buffer = self._buffer = buffer[self._position :]
+                self._position = 0
+
+        if self._state == self._SEEK and not self._in_string:
+            self._buffer = buffer[self._position :]
+            self._position = 0
+
+    def close(self) -> None:
+        """Check that the whole array was received.
+
+        Raises:
+            LawgStreamDecodeError: If the response ended before the array did, or held no such array.
+        """
+        if self._state != self._DONE:
+            msg = f"response ended before the {self.key!r} array was complete"
+            raise LawgStreamDecodeError(msg)
+
+    def _emit(self, buffer: str, end: int, *, closing: bool = False) -> t.Iterator[t.Any]:
+        start = self._item_start
+        msg = f"invalid item in the {self.key!r} array"
+        if start is None:
+            # a scalar item, the separator after an array or object item, or the bracket of an empty array
+            text = buffer[:end].strip()
+            ended, self._ended = self._ended, False
+            if not text:
+                if ended or (closing and not self._emitted):
+                    return
+                # a missing item, e.g. a doubled or trailing comma
+                raise LawgStreamDecodeError(msg)
+            if ended:
+                # a scalar right after an array or object item, without a comma
+                raise LawgStreamDecodeError(msg)
+        else:
+            text = buffer[start:end]
+        self._item_start = None
+        self._emitted = True
+        try:
+            yield json.loads(text)
+        except ValueError as exc:
+            raise LawgStreamDecodeError(msg) from exc
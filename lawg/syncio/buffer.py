@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import atexit
+import functools
+import itertools
+import logging
+import threading
+import typing as t
+import weakref
+
+from lawg.base.buffer import BaseIncrementBuffer
+from lawg.exceptions import LawgBufferClosedError, LawgNotFoundError
+
+if t.TYPE_CHECKING:
+    from lawg.syncio.client import Client
+
+
+logger = logging.getLogger(__name__)
+
+
+def _close_at_exit(ref: weakref.ref[IncrementBuffer]) -> None:
+    buffer = ref()
+    if buffer is not None:
+        buffer.close()
+
+
+class _Shard:
+    __slots__ = ("lock", "pending", "count")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.pending: dict[str, float] = {}
+        self.count = 0
+
+
+class IncrementBuffer(BaseIncrementBuffer["Client"]):
+    """
+    A thread-safe increment buffer, flushed by a background thread.
+
+    Threads add into one of several locked shards picked by thread id, so concurrent
+    increments rarely contend on the same lock. The pending increments of every shard count
+    towards `threshold`.
+    """
+
+    def __init__(self, client: Client, *, interval: float = 1.0, threshold: int = 1000, shards: int = 16) -> None:
+        super().__init__(client, interval=interval, threshold=threshold)
+        self._shards = [_Shard() for _ in range(shards)]
+        # increments added and increments taken by flushes, across every shard
+        self._added = itertools.count(1)
+        self._taken = 0
+        self._wake = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        # weak, so an idle buffer isn't kept alive by the hook, a running thread keeps it alive anyway
+        self._exit_hook = functools.partial(_close_at_exit, weakref.ref(self))
+        atexit.register(self._exit_hook)
+
+    def add(self, id: str, value: float) -> None:
+        if self._closed:
+            raise LawgBufferClosedError
+        self._add(id, value)
+
+    def _add(self, id: str, value: float) -> None:
+        shard = self._shards[threading.get_ident() % len(self._shards)]
+        with shard.lock:
+            shard.pending[id] = shard.pending.get(id, 0.0) + value
+            shard.count += 1
+            # next() on a count is atomic, so the total needs no lock shared by the shards
+            added = next(self._added)
+        full = added - self._taken >= self.threshold
+
+        if self._thread is None:
+            self._start()
+        if full:
+            self._wake.set()
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            totals: dict[str, float] = {}
+            for shard in self._shards:
+                with shard.lock:
+                    pending, shard.pending = shard.pending, {}
+                    self._taken += shard.count
+                    shard.count = 0
+                self._merge(totals, pending)
+
+            unsent = [(insight_id, total) for insight_id, total in totals.items() if total]
+            try:
+                while unsent:
+                    insight_id, total = unsent[-1]
+                    try:
+                        insight_data = self.client.rest.edit_insight(
+                            project=self.client.project,
+                            insight_id=insight_id,
+                            value={"increment": total},
+                        )
+                    except LawgNotFoundError:
+                        # the insight is gone, retrying would never succeed
+                        logger.warning("dropping increments of deleted insight %s", insight_id)
+                        unsent.pop()
+                        continue
+                    unsent.pop()
+                    if self.client.identity_map is not None:
+                        self.client._construct_insight(insight_data)
+            finally:
+                # put anything that wasn't sent back, so a failed flush doesn't lose increments
+                for insight_id, total in unsent:
+                    self._add(insight_id, total)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self._exit_hook)
+
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is not None or self._closed:
+                return
+            self._thread = threading.Thread(target=self._run, name="lawg-increment-buffer", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if self._closed:
+                return
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("failed to flush insight increments, retrying next interval")
@@ -1,33 +1,96 @@
 from __future__ import annotations
 
 
+import contextlib
+import functools
+import os
+import threading
 import typing as t
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
+from lawg import pika
 from lawg.base.client import BaseClient
+from lawg.batch import EventBatch
+from lawg.export import FeedExport, encode_page, export_path
 from lawg.syncio.rest import Rest
+from lawg.exceptions import LawgConflictError, LawgNotFoundError
+from lawg.snapshot import ProjectSnapshot
 from lawg.typings import STR_DICT, UNDEFINED, Undefined
 
 from lawg.syncio.feed import Feed
 from lawg.syncio.event import Event
 from lawg.syncio.insight import Insight
+from lawg.syncio.buffer import IncrementBuffer
+from lawg.syncio.counter import ShardedCounter
+from lawg.syncio.metrics import Metrics
+from lawg.syncio.shared import SharedIncrements
+from lawg.syncio.subscription import Subscription
+from lawg.syncio.tail import FeedPoller
 
 if t.TYPE_CHECKING:
     import datetime
+    from lawg.cache import ResponseCache
+    from lawg.decoders import RecordDecoder
+    from lawg.mirror import EventMirror
+    from lawg.typings import PATH
 
 
-class Client(BaseClient["Feed", "Event", "Insight", "Rest"]):
+class Client(BaseClient["Feed", "Event", "Insight", "Rest", "IncrementBuffer"]):
     """
     The syncio client for lawg.
     """
 
+    shared_increments: SharedIncrements | None
+
     def __init__(
         self,
         *,
         token: str,
         project: str,
+        cache: ResponseCache | None = None,
+        identity_map: bool = False,
+        insight_cache_path: PATH | None = None,
+        auto_create_feeds: bool = False,
+        max_retries: int = 0,
+        record_decoder: RecordDecoder | None = None,
+        mirror: EventMirror | None = None,
     ):
-        super().__init__(token, project)
-        self.rest = Rest(self)
+        super().__init__(token, project, identity_map, insight_cache_path, auto_create_feeds, mirror)
+        self.rest = Rest(self, cache=cache, max_retries=max_retries, record_decoder=record_decoder)
+        self._feeds_lock = threading.Lock()
+        self._feed_locks: dict[str, threading.Lock] = {}
+        self._titles_lock = threading.Lock()
+        self._title_locks: dict[str, threading.Lock] = {}
+        # the poller of each tailed feed, shared by its tails
+        self._pollers: dict[str, FeedPoller] = {}
+        self._pollers_lock = threading.Lock()
+        # the counter of each insight, shared by its callers
+        self._counters: dict[str, ShardedCounter] = {}
+        self._counters_lock = threading.Lock()
+
+    # --- CONTEXT MANAGER --- #
+
+    def __enter__(self) -> Client:
+        return self
+
+    def __exit__(self, _exc_type, _exc_value, _traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for poller in list(self._pollers.values()):
+            poller.close()
+        for counter in list(self._counters.values()):
+            counter.close()
+        self._counters.clear()
+        if self._metrics is not None:
+            self._metrics.close()
+        if self.shared_increments is not None:
+            self.shared_increments.close()
+        if self.increment_buffer is not None:
+            self.increment_buffer.close()
+            # increments made after closing are sent straight away
+            self.increment_buffer = None
+        self.rest.http_client.close()
 
     # --- MANAGERS --- #
 
@@ -35,6 +98,45 @@ class Client(BaseClient["Feed", "Event", "Insight", "Rest"]):
         # TODO(<hexiro>): figure out why pylance is erroring here.
         return Feed(client=self, name=name)  # type: ignore
 
+    # --- SNAPSHOT --- #
+
+    def warm(self, *, path: PATH | None = None, max_age: float | None = None):
+        if path is not None:
+            snapshot = ProjectSnapshot.load(path, max_age=max_age)
+            if snapshot is not None:
+                return self._use_snapshot(snapshot, None)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            project_future = executor.submit(self.rest.fetch_project, project=self.project)
+            insights_future = executor.submit(self.rest.fetch_insights, project=self.project)
+            snapshot = ProjectSnapshot(project_future.result(), insights_future.result())
+
+        return self._use_snapshot(snapshot, path)
+
+    # --- FEEDS --- #
+
+    def ensure_feed(self, name: str) -> None:
+        known_feeds = self.known_feeds
+        if known_feeds is None:
+            with self._feeds_lock:
+                if self.known_feeds is None:
+                    project_data = self.rest.fetch_project(project=self.project)
+                    self.known_feeds = {feed["name"] for feed in project_data["feeds"]}
+                known_feeds = self.known_feeds
+
+        if name in known_feeds:
+            return
+
+        with self._feeds_lock:
+            lock = self._feed_locks.setdefault(name, threading.Lock())
+        with lock:
+            if name in known_feeds:
+                return
+            # a conflict means another client created it in the meantime
+            with contextlib.suppress(LawgConflictError):
+                self.rest.create_feed(project=self.project, feed=name)
+            known_feeds.add(name)
+
     # --- EVENTS --- #
 
     def event(
@@ -48,8 +150,10 @@ class Client(BaseClient["Feed", "Event", "Insight", "Rest"]):
         timestamp: datetime.datetime | None = None,
         notify: bool | None = None,
         metadata: dict[str, str | int | float | bool] | None = None,
+        idempotency_key: str | None = None,
     ):
-        event_data = self.rest.create_event(
+        create_event = functools.partial(
+            self.rest.create_event,
             project=self.project,
             feed=feed,
             title=title,
@@ -59,7 +163,19 @@ class Client(BaseClient["Feed", "Event", "Insight", "Rest"]):
             timestamp=timestamp,
             notify=notify,
             metadata=metadata,
+            idempotency_key=idempotency_key or self.rest.new_idempotency_key(),
         )
+        if not self.auto_create_feeds:
+            return self._construct_event(feed, create_event())
+
+        self.ensure_feed(feed)
+        try:
+            event_data = create_event()
+        except LawgNotFoundError:
+            # the feed was deleted since it was last seen, create it again and replay the event
+            self.known_feeds.discard(feed)  # type: ignore
+            self.ensure_feed(feed)
+            event_data = create_event()
         return self._construct_event(feed, event_data)
 
     def edit_event(
@@ -83,7 +199,9 @@ class Client(BaseClient["Feed", "Event", "Insight", "Rest"]):
             tags=tags,
             timestamp=timestamp,
         )
-        return self._construct_event(feed, event_data)
+        event = self._construct_event(feed, event_data)
+        self._mirror_store(event)
+        return event
 
     def fetch_event(self, *, feed: str, id: str):
         event_data = self.rest.fetch_event(
@@ -100,15 +218,203 @@ class Client(BaseClient["Feed", "Event", "Insight", "Rest"]):
         )
         return self._construct_events(feed, events_data)
 
+    def stream_events(self, *, feed: str, limit: int | None = None, offset: int | None = None):
+        for event_data in self.rest.stream_events(project=self.project, feed=feed, limit=limit, offset=offset):
+            yield self._construct_event(feed, event_data)
+
+    def fetch_event_batch(self, *, feed: str, limit: int | None = None, offset: int | None = None):
+        events_data = self.rest.stream_events(project=self.project, feed=feed, limit=limit, offset=offset)
+        return EventBatch(self, feed, events_data)
+
+    def export_events(
+        self,
+        *,
+        feed: str,
+        path: PATH,
+        format: str = "ndjson",
+        compression: str | None = None,
+        page_size: int = 100,
+        resume: bool = True,
+    ):
+        export = FeedExport(
+            path, feed=feed, format=format, compression=compression, page_size=page_size, resume=resume
+        )
+        while not export.done:
+            export.add(self.fetch_event_batch(feed=feed, limit=page_size, offset=export.offset))
+        return export.finish()
+
+    def export_project(
+        self,
+        directory: PATH,
+        *,
+        format: str = "ndjson",
+        compression: str | None = None,
+        page_size: int = 100,
+        resume: bool = True,
+        connections: int = 4,
+        processes: int | None = None,
+    ):
+        project_data = self.rest.fetch_project(project=self.project)
+        feeds = [feed["name"] for feed in project_data["feeds"]]
+        os.makedirs(directory, exist_ok=True)
+        # a thread per connection fetches and writes its feeds, the processes encode and compress them
+        with ProcessPoolExecutor(max_workers=processes) as pool, ThreadPoolExecutor(max_workers=connections) as executor:
+            futures = {
+                feed: executor.submit(
+                    self._export_feed,
+                    feed,
+                    export_path(directory, feed, format, compression),
+                    pool,
+                    format=format,
+                    compression=compression,
+                    page_size=page_size,
+                    resume=resume,
+                )
+                for feed in feeds
+            }
+            return {feed: future.result() for feed, future in futures.items()}
+
+    def _export_feed(
+        self,
+        feed: str,
+        path: str,
+        pool: ProcessPoolExecutor,
+        *,
+        format: str,
+        compression: str | None,
+        page_size: int,
+        resume: bool,
+    ) -> int:
+        export = FeedExport(path, feed=feed, format=format, compression=compression, page_size=page_size, resume=resume)
+        encode = functools.partial(encode_page, format=export.format, compression=export.compression)
+        offset = export.offset
+        batch = None if export.done else self.fetch_event_batch(feed=feed, limit=page_size, offset=offset)
+        while batch is not None:
+            start = export.start(batch)
+            encoded = pool.submit(encode, batch, start, header=export.header) if start < len(batch) else None
+            # the next page is fetched while this one is encoded
+            offset += len(batch)
+            next_batch = None
+            if len(batch) == page_size:
+                next_batch = self.fetch_event_batch(feed=feed, limit=page_size, offset=offset)
+            export.write(batch, start, None if encoded is None else encoded.result())
+            batch = next_batch
+        return export.finish()
+
+    def iter_events(
+        self,
+        *,
+        feed: str,
+        since: pika.Bound | None = None,
+        until: pika.Bound | None = None,
+        page_size: int = 100,
+    ):
+        lower, upper = pika.window(since, until)
+        offset = 0
+        while True:
+            count = 0
+            events = self.rest.stream_events(project=self.project, feed=feed, limit=page_size, offset=offset)
+            try:
+                for event_data in events:
+                    count += 1
+                    snowflake = pika.snowflake(event_data["id"])
+                    if upper is not None and snowflake >= upper:
+                        continue
+                    if snowflake < lower:
+                        return
+                    yield self._construct_event(feed, event_data)
+            finally:
+                events.close()
+            if count < page_size:
+                return
+            offset += count
+
+    def sync_mirror(self, mirror: EventMirror, *, feed: str, page_size: int = 100):
+        newest: list[str] = []
+
+        def fetched() -> t.Iterator[Event]:
+            for event in self.iter_events(feed=feed, since=mirror.last_id(feed), page_size=page_size):
+                if not newest:
+                    newest.append(event.id)
+                yield event
+
+        count = mirror.store(feed, fetched())
+        # only advance once everything older was stored, an interrupted sync is simply repeated
+        if newest:
+            mirror.advance(feed, newest[0])
+        return count
+
+    def subscribe(
+        self,
+        *,
+        feed: str,
+        mirror: EventMirror | None = None,
+        since: str | None = None,
+        url: str | None = None,
+    ):
+        return Subscription(self, feed, mirror=mirror, since=since, url=url)
+
+    def tail(
+        self,
+        *,
+        feed: str,
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        page_size: int = 100,
+    ):
+        with self._pollers_lock:
+            poller = self._pollers.get(feed)
+            if poller is not None:
+                return poller.attach()
+
+        # found the newest event without holding the lock, so tails of other feeds aren't held up
+        started = FeedPoller(self, feed, min_interval=min_interval, max_interval=max_interval, page_size=page_size)
+        started.start()
+        with self._pollers_lock:
+            # a concurrent tail of the feed may have registered its poller meanwhile
+            poller = self._pollers.setdefault(feed, started)
+            return poller.attach()
+
     def delete_event(self, *, feed: str, id: str):
         self.rest.delete_event(
             project=self.project,
             feed=feed,
             event_id=id,
         )
+        self._forget(id)
+        self._mirror_delete(id)
 
     # --- INSIGHTS --- #
 
+    def buffer_increments(self, *, interval: float = 1.0, threshold: int = 1000):
+        if self.increment_buffer is None:
+            self.increment_buffer = IncrementBuffer(self, interval=interval, threshold=threshold)
+        return self.increment_buffer
+
+    def share_increments(
+        self,
+        *,
+        ids: t.Iterable[str],
+        name: str | None = None,
+        interval: float = 1.0,
+        processes: int = 64,
+    ):
+        if self.shared_increments is None:
+            self.shared_increments = SharedIncrements(self, ids, name=name, interval=interval, processes=processes)
+        return self.shared_increments
+
+    def counter(self, *, id: str, interval: float | None = None):
+        with self._counters_lock:
+            counter = self._counters.get(id)
+            if counter is None:
+                counter = self._counters[id] = ShardedCounter(self, id, interval=interval)
+        return counter
+
+    def metrics(self, *, interval: float = 10.0) -> Metrics:
+        if self._metrics is None:
+            self._metrics = Metrics(self, interval=interval)
+        return self._metrics
+
     def insight(self, *, title: str, description: str, value: int, emoji: str | None = None):
         insight_data = self.rest.create_insight(
             project=self.project,
@@ -117,8 +423,52 @@ class Client(BaseClient["Feed", "Event", "Insight", "Rest"]):
             value=value,
             emoji=emoji,
         )
+        self.insight_titles.update({insight_data["title"]: insight_data["id"]})
         return self._construct_insight(insight_data)
 
+    def insight_by_title(
+        self,
+        title: str,
+        *,
+        create: bool = True,
+        description: str | None = None,
+        emoji: str | None = None,
+        value: float = 0,
+    ):
+        insight = self._insight_from_cache(title)
+        if insight is None:
+            insights = self.fetch_insights()
+            self.insight_titles.update({insight.title: insight.id for insight in insights})
+            insight = next((insight for insight in insights if insight.title == title), None)
+        if insight is not None or not create:
+            return insight
+
+        # one thread creates a missing insight, the others wait for it and find it cached
+        with self._titles_lock:
+            lock = self._title_locks.setdefault(title, threading.Lock())
+        with lock:
+            insight = self._insight_from_cache(title)
+            if insight is not None:
+                return insight
+            return self.insight(title=title, description=description, value=value, emoji=emoji)  # type: ignore
+
+    def _insight_from_cache(self, title: str) -> Insight | None:
+        insight_id = self.insight_titles.get(title)
+        if insight_id is None:
+            return None
+        # only contacts the API when neither the identity map nor the snapshot holds the insight
+        insight = self._cached_insight(insight_id)
+        if insight is None:
+            try:
+                insight = self.fetch_insight(id=insight_id)
+            except LawgNotFoundError:
+                return None
+        if insight.title != title:
+            # renamed since it was cached
+            self.insight_titles.discard(title)
+            return None
+        return insight
+
     def edit_insight(
         self,
         *,
@@ -127,36 +477,47 @@ class Client(BaseClient["Feed", "Event", "Insight", "Rest"]):
         description: str | None | Undefined = UNDEFINED,
         emoji: str | None | Undefined = UNDEFINED,
     ):
-        insight_data = self.rest.edit_insight(
-            project=self.project,
-            insight_id=id,
-            title=title,
-            description=description,
-            emoji=emoji,
-        )
+        with self._invalidating(id):
+            insight_data = self.rest.edit_insight(
+                project=self.project,
+                insight_id=id,
+                title=title,
+                description=description,
+                emoji=emoji,
+            )
         return self._construct_insight(insight_data)
 
     def increment_insight(self, *, id: str, value: float):
-        insight_data = self.rest.edit_insight(
-            project=self.project,
-            insight_id=id,
-            value={"increment": value},
-        )
+        if self.shared_increments is not None and id in self.shared_increments:
+            self.shared_increments.add(id, value)
+            return self._recall(id)
+        if self.increment_buffer is not None:
+            self.increment_buffer.add(id, value)
+            return self._recall(id)
+
+        with self._invalidating(id):
+            insight_data = self.rest.edit_insight(
+                project=self.project,
+                insight_id=id,
+                value={"increment": value},
+            )
         return self._construct_insight(insight_data)
 
     def set_insight(self, *, id: str, value: int):
-        insight_data = self.rest.edit_insight(
-            project=self.project,
-            insight_id=id,
-            value={"set": value},
-        )
+        with self._invalidating(id):
+            insight_data = self.rest.edit_insight(
+                project=self.project,
+                insight_id=id,
+                value={"set": value},
+            )
         return self._construct_insight(insight_data)
 
     def fetch_insight(self, *, id: str):
-        insight_data = self.rest.fetch_insight(
-            project=self.project,
-            insight_id=id,
-        )
+        with self._invalidating(id):
+            insight_data = self.rest.fetch_insight(
+                project=self.project,
+                insight_id=id,
+            )
         return self._construct_insight(insight_data)
 
     def fetch_insights(self):
@@ -165,11 +526,16 @@ class Client(BaseClient["Feed", "Event", "Insight", "Rest"]):
         )
         return self._construct_insights(insights_data)
 
+    def stream_insights(self):
+        for insight_data in self.rest.stream_insights(project=self.project):
+            yield self._construct_insight(insight_data)
+
     def delete_insight(self, *, id: str):
         self.rest.delete_insight(
             project=self.project,
             insight_id=id,
         )
+        self._forget_insight(id)
 
     # --- MANAGER CONSTRUCTORS --- #
 
@@ -180,8 +546,9 @@ class Client(BaseClient["Feed", "Event", "Insight", "Rest"]):
         title = event_data["title"]
         description = event_data["description"]
         emoji = event_data["emoji"]
-        return Event(
-            self,
+        tags = event_data["tags"]
+        return self._identity(
+            Event,
             feed=feed,
             id=id,
             project_id=project_id,
@@ -189,6 +556,7 @@ class Client(BaseClient["Feed", "Event", "Insight", "Rest"]):
             title=title,
             description=description,
             emoji=emoji,
+            tags=tags,
         )
 
     def _construct_insight(
@@ -203,8 +571,8 @@ class Client(BaseClient["Feed", "Event", "Insight", "Rest"]):
         updated_at = insight_data["updated_at"]
         created_at = insight_data["created_at"]
 
-        return Insight(
-            self,
+        return self._identity(
+            Insight,
             id=id,
             title=title,
             description=description,
@@ -216,7 +584,6 @@ class Client(BaseClient["Feed", "Event", "Insight", "Rest"]):
 
 
 if __name__ == "__main__":
-    import os
     from rich import print
 
     token = os.getenv("LAWG_DEV_API_TOKEN")
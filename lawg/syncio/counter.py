@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import atexit
+import functools
+import logging
+import threading
+import typing as t
+import weakref
+
+from lawg.base.counter import BaseShardedCounter
+from lawg.exceptions import LawgNotFoundError
+
+if t.TYPE_CHECKING:
+    from lawg.syncio.client import Client
+
+
+logger = logging.getLogger(__name__)
+
+
+def _close_at_exit(ref: weakref.ref[ShardedCounter]) -> None:
+    counter = ref()
+    if counter is not None:
+        counter.close()
+
+
+class ShardedCounter(BaseShardedCounter["Client"]):
+    """
+    A sharded insight counter, flushed explicitly or every `interval` seconds by a background thread.
+
+    Example:
+        >>> signups = client.counter(id="insight_...", interval=5.0)
+        >>> signups.add()  # from any number of threads
+    """
+
+    __slots__ = ("_flush_lock", "_wake", "_thread", "_closed", "_exit_hook", "__weakref__")
+
+    def __init__(self, client: Client, id: str, *, interval: float | None = None) -> None:
+        super().__init__(client, id, interval=interval)
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        if interval is not None:
+            self._thread = threading.Thread(target=self._run, name=f"lawg-counter-{id}", daemon=True)
+            self._thread.start()
+        # weak, so an idle counter isn't kept alive by the hook, a running thread keeps it alive anyway
+        self._exit_hook = functools.partial(_close_at_exit, weakref.ref(self))
+        atexit.register(self._exit_hook)
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            delta = self._collect() - self._flushed
+            if not delta:
+                return
+            try:
+                # through the increment buffer, if the client has one
+                self.client.increment_insight(id=self.id, value=delta)
+            except LawgNotFoundError:
+                # the insight is gone, retrying would never succeed
+                logger.warning("dropping increments of deleted insight %s", self.id)
+            self._flushed += delta
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self._exit_hook)
+
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.interval)
+            if self._closed:
+                return
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("failed to flush insight counter %s, retrying next interval", self.id)
@@ -19,6 +19,7 @@ class Event(BaseEvent["Client"]):
         title: str | Undefined | None = UNDEFINED,
         description: str | Undefined | None = UNDEFINED,
         emoji: str | Undefined | None = UNDEFINED,
+        tags: dict[str, str | int | float | bool] | Undefined | None = UNDEFINED,
     ) -> None:
         event_data = self.client.rest.edit_event(
             project=self.client.project,
@@ -27,11 +28,14 @@ class Event(BaseEvent["Client"]):
             title=title,
             description=description,
             emoji=emoji,
+            tags=tags,
         )
 
         self.title = event_data["title"]
         self.description = event_data["description"]
         self.emoji = event_data["emoji"]
+        self.tags = event_data["tags"]
+        self.client._mirror_store(self)
 
     def delete(self) -> None:
         if self.is_deleted:
@@ -39,3 +43,5 @@ class Event(BaseEvent["Client"]):
 
         self.client.rest.delete_event(project=self.client.project, feed=self.feed, event_id=self.id)
         self.is_deleted = True
+        self.client._forget(self.id)
+        self.client._mirror_delete(self.id)
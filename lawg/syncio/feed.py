@@ -5,8 +5,11 @@ from lawg.syncio.event import Event
 from lawg.typings import UNDEFINED, Undefined
 
 if t.TYPE_CHECKING:
+    from lawg import pika
+    from lawg.mirror import EventMirror
     from lawg.syncio.client import Client
     from lawg.syncio.event import Event
+    from lawg.typings import PATH
 
 
 class Feed(BaseFeed["Client", "Event"]):
@@ -14,11 +17,12 @@ class Feed(BaseFeed["Client", "Event"]):
 
     # --- EVENTS --- #
 
-    def event(self, *, title: str, description: str):
+    def event(self, *, title: str, description: str, idempotency_key: str | None = None):
         return self.client.event(
             feed=self.name,
             title=title,
             description=description,
+            idempotency_key=idempotency_key,
         )
 
     def edit_event(
@@ -28,6 +32,7 @@ class Feed(BaseFeed["Client", "Event"]):
         title: str | Undefined | None = UNDEFINED,
         description: str | Undefined | None = UNDEFINED,
         emoji: str | Undefined | None = UNDEFINED,
+        tags: "dict[str, str | int | float | bool] | Undefined | None" = UNDEFINED,
     ):
         return self.client.edit_event(
             feed=self.name,
@@ -35,6 +40,7 @@ class Feed(BaseFeed["Client", "Event"]):
             title=title,
             description=description,
             emoji=emoji,
+            tags=tags,
         )
 
     def fetch_event(self, *, id: str):
@@ -43,5 +49,49 @@ class Feed(BaseFeed["Client", "Event"]):
     def fetch_events(self):
         return self.client.fetch_events(feed=self.name)
 
+    def stream_events(self, *, limit: int | None = None, offset: int | None = None):
+        return self.client.stream_events(feed=self.name, limit=limit, offset=offset)
+
+    def fetch_event_batch(self, *, limit: int | None = None, offset: int | None = None):
+        return self.client.fetch_event_batch(feed=self.name, limit=limit, offset=offset)
+
+    def export(
+        self,
+        path: "PATH",
+        *,
+        format: str = "ndjson",
+        compression: str | None = None,
+        page_size: int = 100,
+        resume: bool = True,
+    ):
+        return self.client.export_events(
+            feed=self.name,
+            path=path,
+            format=format,
+            compression=compression,
+            page_size=page_size,
+            resume=resume,
+        )
+
+    def iter_events(
+        self,
+        *,
+        since: "pika.Bound | None" = None,
+        until: "pika.Bound | None" = None,
+        page_size: int = 100,
+    ):
+        return self.client.iter_events(feed=self.name, since=since, until=until, page_size=page_size)
+
+    def sync_mirror(self, mirror: "EventMirror", *, page_size: int = 100):
+        return self.client.sync_mirror(mirror, feed=self.name, page_size=page_size)
+
+    def subscribe(self, *, mirror: "EventMirror | None" = None, since: str | None = None, url: str | None = None):
+        return self.client.subscribe(feed=self.name, mirror=mirror, since=since, url=url)
+
+    def tail(self, *, min_interval: float = 1.0, max_interval: float = 60.0, page_size: int = 100):
+        return self.client.tail(
+            feed=self.name, min_interval=min_interval, max_interval=max_interval, page_size=page_size
+        )
+
     def delete_event(self, *, id: str):
         return self.client.delete_event(feed=self.name, id=id)
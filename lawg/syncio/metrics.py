@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import typing as t
+
+from lawg.base.metrics import BaseMetrics
+from lawg.exceptions import LawgNotFoundError
+
+if t.TYPE_CHECKING:
+    from lawg.metrics import Sample
+    from lawg.syncio.client import Client
+
+
+logger = logging.getLogger(__name__)
+
+
+class Metrics(BaseMetrics["Client"]):
+    """
+    A metrics registry, published by a background thread.
+    """
+
+    def __init__(self, client: Client, *, interval: float = 10.0) -> None:
+        super().__init__(client, interval=interval)
+        self._stop = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="lawg-metrics", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            for metric in list(self._metrics.values()):
+                samples = metric.collect()
+                for index, sample in enumerate(samples):
+                    try:
+                        self._send(sample)
+                    except BaseException:
+                        # the next flush publishes them
+                        metric.restore(samples[index:])
+                        raise
+
+    def close(self) -> None:
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        atexit.unregister(self.close)
+        self._thread.join()
+        self.flush()
+
+    def _send(self, sample: Sample) -> None:
+        try:
+            self._publish(sample)
+        except LawgNotFoundError:
+            # the insight was deleted, create it again
+            self.client.insight_titles.discard(sample.title)
+            self._publish(sample)
+
+    def _publish(self, sample: Sample) -> None:
+        value = {"increment": sample.value} if sample.increment else {"set": sample.value}
+        self.client.rest.edit_insight(
+            project=self.client.project,
+            insight_id=self._resolve(sample.title),
+            value=value,
+        )
+
+    def _resolve(self, title: str) -> str:
+        insight_id = self.client.insight_titles.get(title)
+        if insight_id is None:
+            insight = self.client.insight_by_title(title)
+            insight_id = insight.id  # type: ignore
+        return insight_id
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("failed to publish metrics")
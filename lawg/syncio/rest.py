@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import threading
+import time
 import typing as t
+from concurrent.futures import Future
 
 import httpx
 
@@ -11,6 +14,8 @@ if t.TYPE_CHECKING:
     import datetime
     from marshmallow import Schema
     from lawg.syncio.client import Client
+    from lawg.cache import CacheEntry, ResponseCache
+    from lawg.decoders import RecordDecoder
 
 
 from lawg.schemas import (
@@ -25,7 +30,7 @@ from lawg.schemas import (
     InsightGetSlugSchema,
     InsightPatchBodySchema,
     InsightPatchSlugSchema,
-    InsightValueSchema,
+    InsightDeleteSlugSchema,
     EventCreateBodySchema,
     EventCreateSlugSchema,
     EventDeleteSlugSchema,
@@ -43,16 +48,26 @@ from lawg.schemas import (
     EventSchema,
     InsightSchema,
     ProjectCreateBodySchema,
+    prebuilt,
 )
 
 
 class Rest(BaseRest["Client", httpx.Client]):
     """The syncio rest manager."""
 
-    def __init__(self, client: Client) -> None:
-        super().__init__(client)
+    def __init__(
+        self,
+        client: Client,
+        cache: ResponseCache | None = None,
+        max_retries: int = 0,
+        retry_backoff: float = 0.5,
+        record_decoder: RecordDecoder | None = None,
+    ) -> None:
+        super().__init__(client, cache, max_retries, retry_backoff, record_decoder)
         self.http_client = httpx.Client()
         self.http_client.headers.update(self.headers)
+        self._flights: dict[str, Future[STR_DICT]] = {}
+        self._flights_lock = threading.Lock()
 
     def request(
         self,
@@ -62,12 +77,95 @@ class Rest(BaseRest["Client", httpx.Client]):
         body_with_schema: DataWithSchema | None = None,
         slugs_with_schema: DataWithSchema | None = None,
         response_schema: Schema | None = None,
+        headers: dict[str, str] | None = None,
     ) -> STR_DICT:
+        endpoint = url
+        url, body_dict = self.prepare_request(url, body_with_schema, slugs_with_schema)
+
+        key, entry, cached = self.cache_lookup(method, url, body_dict)
+        if cached is not None:
+            return cached
+
+        flight_key = self.flight_key(method, url, body_dict, headers)
+        if flight_key is None:
+            return self.send(
+                method, url, body_dict, response_schema, endpoint=endpoint, key=key, entry=entry, headers=headers
+            )
+
+        # single-flight: the first caller sends the request, identical concurrent callers wait for its result
+        with self._flights_lock:
+            flight = self._flights.get(flight_key)
+            is_leader = flight is None
+            if flight is None:
+                flight = self._flights[flight_key] = Future()
+
+        if not is_leader:
+            return flight.result()
+
+        try:
+            result = self.send(
+                method, url, body_dict, response_schema, endpoint=endpoint, key=key, entry=entry, headers=headers
+            )
+        except BaseException as exc:
+            flight.set_exception(exc)
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            with self._flights_lock:
+                del self._flights[flight_key]
+
+    def stream(
+        self,
+        *,
+        url: str,
+        method: str,
+        item_schema: Schema,
+        body_with_schema: DataWithSchema | None = None,
+        slugs_with_schema: DataWithSchema | None = None,
+    ) -> t.Iterator[STR_DICT]:
         url, body_dict = self.prepare_request(url, body_with_schema, slugs_with_schema)
 
-        resp = self.http_client.request(method=method, url=url, json=body_dict)
+        with self.http_client.stream(method=method, url=url, json=body_dict) as resp:
+            if resp.is_error:
+                resp.read()
+            decoder = self.prepare_stream(resp)
+            for chunk in resp.iter_text():
+                yield from self.load_stream_chunk(decoder, chunk, item_schema)
+            decoder.close()
 
-        return self.prepare_response(resp, response_schema=response_schema)
+    def send(
+        self,
+        method: str,
+        url: str,
+        body: STR_DICT | None,
+        response_schema: Schema | None,
+        *,
+        endpoint: str,
+        key: str | None,
+        entry: CacheEntry | None,
+        headers: dict[str, str] | None = None,
+    ) -> STR_DICT:
+        can_retry = self.can_retry(method, headers)
+        headers = self.cache_headers(entry, headers)
+        attempt = 0
+
+        while True:
+            attempt += 1
+            retry = can_retry and attempt <= self.max_retries
+            resp = None
+            try:
+                resp = self.http_client.request(method=method, url=url, json=body, headers=headers)
+            except httpx.TransportError:
+                if not retry:
+                    raise
+            else:
+                if not retry or resp.status_code not in self.RETRY_STATUSES:
+                    break
+            time.sleep(self.retry_delay(attempt, resp))
+
+        return self.prepare_cached_response(resp, response_schema, endpoint=endpoint, key=key, entry=entry)
 
     # --- PROJECTS --- #
 
@@ -79,8 +177,8 @@ class Rest(BaseRest["Client", httpx.Client]):
         project_data = self.request(
             url=self.API_CREATE_PROJECT,
             method="POST",
-            body_with_schema=DataWithSchema(body, ProjectCreateBodySchema()),
-            response_schema=ProjectSchema(),
+            body_with_schema=DataWithSchema(body, prebuilt(ProjectCreateBodySchema)),
+            response_schema=prebuilt(ProjectSchema),
         )
         return project_data
 
@@ -91,8 +189,8 @@ class Rest(BaseRest["Client", httpx.Client]):
         project_data = self.request(
             url=self.API_GET_PROJECT,
             method="GET",
-            slugs_with_schema=DataWithSchema(slugs, ProjectGetSlugSchema()),
-            response_schema=ProjectSchema(),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(ProjectGetSlugSchema)),
+            response_schema=prebuilt(ProjectSchema),
         )
         return project_data
 
@@ -106,9 +204,9 @@ class Rest(BaseRest["Client", httpx.Client]):
         project_data = self.request(
             url=self.API_EDIT_PROJECT,
             method="PATCH",
-            slugs_with_schema=DataWithSchema(slugs, ProjectPatchSlugSchema()),
-            body_with_schema=DataWithSchema(body, ProjectPatchBodySchema()),
-            response_schema=ProjectSchema(),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(ProjectPatchSlugSchema)),
+            body_with_schema=DataWithSchema(body, prebuilt(ProjectPatchBodySchema)),
+            response_schema=prebuilt(ProjectSchema),
         )
         return project_data
 
@@ -119,7 +217,7 @@ class Rest(BaseRest["Client", httpx.Client]):
         self.request(
             url=self.API_DELETE_PROJECT,
             method="DELETE",
-            slugs_with_schema=DataWithSchema(slugs, ProjectDeleteSlugSchema()),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(ProjectDeleteSlugSchema)),
         )
 
     # --- FEEDS --- #
@@ -142,9 +240,9 @@ class Rest(BaseRest["Client", httpx.Client]):
         feed_data = self.request(
             url=self.API_CREATE_FEED,
             method="POST",
-            body_with_schema=DataWithSchema(data, FeedCreateBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, FeedCreateSlugSchema()),
-            response_schema=FeedSchema(),
+            body_with_schema=DataWithSchema(data, prebuilt(FeedCreateBodySchema)),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(FeedCreateSlugSchema)),
+            response_schema=prebuilt(FeedSchema),
         )
         return feed_data
 
@@ -168,9 +266,9 @@ class Rest(BaseRest["Client", httpx.Client]):
         feed_data = self.request(
             url=self.API_EDIT_FEED,
             method="PATCH",
-            body_with_schema=DataWithSchema(data, FeedPatchBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, FeedPatchSlugSchema()),
-            response_schema=FeedSchema(),
+            body_with_schema=DataWithSchema(data, prebuilt(FeedPatchBodySchema)),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(FeedPatchSlugSchema)),
+            response_schema=prebuilt(FeedSchema),
         )
         return feed_data
 
@@ -182,7 +280,7 @@ class Rest(BaseRest["Client", httpx.Client]):
         self.request(
             url=self.API_DELETE_FEED,
             method="DELETE",
-            slugs_with_schema=DataWithSchema(slugs, FeedDeleteSlugSchema()),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(FeedDeleteSlugSchema)),
         )
 
     # --- EVENTS --- #
@@ -198,7 +296,15 @@ class Rest(BaseRest["Client", httpx.Client]):
         timestamp: datetime.datetime | None = None,
         notify: bool | None = None,
         metadata: dict[str, str | int | float | bool] | None = None,
+        idempotency_key: str | None = None,
     ):
+        if idempotency_key is None:
+            idempotency_key = self.new_idempotency_key()
+        else:
+            acknowledged = self.acknowledged.get(idempotency_key)
+            if acknowledged is not None:
+                return acknowledged
+
         slugs = {
             "namespace": project,
             "feed": feed,
@@ -215,10 +321,12 @@ class Rest(BaseRest["Client", httpx.Client]):
         event_data = self.request(
             url=self.API_CREATE_EVENT,
             method="POST",
-            body_with_schema=DataWithSchema(data, EventCreateBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, EventCreateSlugSchema()),
-            response_schema=EventSchema(),
+            body_with_schema=DataWithSchema(data, prebuilt(EventCreateBodySchema)),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(EventCreateSlugSchema)),
+            response_schema=prebuilt(EventSchema),
+            headers={self.IDEMPOTENCY_HEADER: idempotency_key},
         )
+        self.acknowledged.add(idempotency_key, event_data)
         return event_data
 
     def fetch_event(self, project: str, feed: str, event_id: str):
@@ -230,8 +338,8 @@ class Rest(BaseRest["Client", httpx.Client]):
         event_data = self.request(
             url=self.API_GET_EVENT,
             method="GET",
-            slugs_with_schema=DataWithSchema(slugs, EventGetSlugSchema()),
-            response_schema=EventSchema(),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(EventGetSlugSchema)),
+            response_schema=prebuilt(EventSchema),
         )
         return event_data
 
@@ -250,15 +358,41 @@ class Rest(BaseRest["Client", httpx.Client]):
             "limit": limit,
             "offset": offset,
         }
+        data = {key: value for key, value in data.items() if value is not None}
         events_data: list[STR_DICT] = self.request(
             url=self.API_GET_EVENTS,
             method="GET",
-            body_with_schema=DataWithSchema(data, EventGetMultipleBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, EventGetMultipleSlugSchema()),
-            response_schema=EventSchema(many=True),
+            body_with_schema=DataWithSchema(data, prebuilt(EventGetMultipleBodySchema)) if data else None,
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(EventGetMultipleSlugSchema)),
+            response_schema=prebuilt(EventSchema, many=True),
         )  # type: ignore
         return events_data
 
+    def stream_events(
+        self,
+        project: str,
+        feed: str,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> t.Iterator[STR_DICT]:
+        slugs = {
+            "namespace": project,
+            "feed": feed,
+        }
+        data = {
+            "limit": limit,
+            "offset": offset,
+        }
+        data = {key: value for key, value in data.items() if value is not None}
+        for event_data in self.stream(
+            url=self.API_GET_EVENTS,
+            method="GET",
+            item_schema=prebuilt(EventSchema),
+            body_with_schema=DataWithSchema(data, prebuilt(EventGetMultipleBodySchema)) if data else None,
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(EventGetMultipleSlugSchema)),
+        ):
+            yield event_data
+
     def edit_event(
         self,
         project: str,
@@ -285,9 +419,9 @@ class Rest(BaseRest["Client", httpx.Client]):
         event_data = self.request(
             url=self.API_EDIT_EVENT,
             method="PATCH",
-            body_with_schema=DataWithSchema(data, EventPatchBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, EventPatchSlugSchema()),
-            response_schema=EventSchema(),
+            body_with_schema=DataWithSchema(data, prebuilt(EventPatchBodySchema)),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(EventPatchSlugSchema)),
+            response_schema=prebuilt(EventSchema),
         )
         return event_data
 
@@ -300,7 +434,7 @@ class Rest(BaseRest["Client", httpx.Client]):
         self.request(
             url=self.API_DELETE_EVENT,
             method="DELETE",
-            slugs_with_schema=DataWithSchema(slugs, EventDeleteSlugSchema()),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(EventDeleteSlugSchema)),
         )
 
     # --- INSIGHTS --- #
@@ -325,9 +459,9 @@ class Rest(BaseRest["Client", httpx.Client]):
         insight_data = self.request(
             url=self.API_CREATE_INSIGHT,
             method="POST",
-            body_with_schema=DataWithSchema(data, InsightCreateBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, InsightCreateSlugSchema()),
-            response_schema=InsightSchema(),
+            body_with_schema=DataWithSchema(data, prebuilt(InsightCreateBodySchema)),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(InsightCreateSlugSchema)),
+            response_schema=prebuilt(InsightSchema),
         )
         return insight_data
 
@@ -341,10 +475,10 @@ class Rest(BaseRest["Client", httpx.Client]):
             "insight_id": insight_id,
         }
         insight_data = self.request(
-            url=self.API_GET_INSIGHTS,
+            url=self.API_GET_INSIGHT,
             method="GET",
-            slugs_with_schema=DataWithSchema(slugs, InsightGetSlugSchema()),
-            response_schema=InsightSchema(),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(InsightGetSlugSchema)),
+            response_schema=prebuilt(InsightSchema),
         )
         return insight_data
 
@@ -358,11 +492,26 @@ class Rest(BaseRest["Client", httpx.Client]):
         insights_data: list[STR_DICT] = self.request(
             url=self.API_GET_INSIGHTS,
             method="GET",
-            slugs_with_schema=DataWithSchema(slugs, InsightGetMultipleBodySchema()),
-            response_schema=InsightSchema(many=True),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(InsightGetMultipleBodySchema)),
+            response_schema=prebuilt(InsightSchema, many=True),
         )  # type: ignore
         return insights_data
 
+    def stream_insights(
+        self,
+        project: str,
+    ) -> t.Iterator[STR_DICT]:
+        slugs = {
+            "namespace": project,
+        }
+        for insight_data in self.stream(
+            url=self.API_GET_INSIGHTS,
+            method="GET",
+            item_schema=prebuilt(InsightSchema),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(InsightGetMultipleBodySchema)),
+        ):
+            yield insight_data
+
     def edit_insight(
         self,
         project: str,
@@ -385,9 +534,9 @@ class Rest(BaseRest["Client", httpx.Client]):
         insight_data = self.request(
             url=self.API_EDIT_INSIGHT,
             method="PATCH",
-            body_with_schema=DataWithSchema(data, InsightPatchBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, InsightPatchSlugSchema()),
-            response_schema=InsightSchema(),
+            body_with_schema=DataWithSchema(data, prebuilt(InsightPatchBodySchema)),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(InsightPatchSlugSchema)),
+            response_schema=prebuilt(InsightSchema),
         )
         return insight_data
 
@@ -403,5 +552,5 @@ class Rest(BaseRest["Client", httpx.Client]):
         self.request(
             url=self.API_DELETE_INSIGHT,
             method="DELETE",
-            slugs_with_schema=DataWithSchema(slugs, InsightValueSchema()),
+            slugs_with_schema=DataWithSchema(slugs, prebuilt(InsightDeleteSlugSchema)),
         )
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import typing as t
+
+from lawg.base.shared import BaseSharedIncrements
+from lawg.exceptions import LawgNotFoundError
+
+if t.TYPE_CHECKING:
+    from lawg.syncio.client import Client
+
+
+logger = logging.getLogger(__name__)
+
+
+class SharedIncrements(BaseSharedIncrements["Client"]):
+    """
+    Shared increments, flushed every `interval` seconds by a background thread of the flusher.
+
+    The thread of every other process tries to become the flusher at the same interval.
+
+    Example:
+        >>> # in each worker, e.g. gunicorn's post_fork hook
+        >>> client.share_increments(ids=["insight_...", "insight_..."])
+        >>> client.increment_insight(id="insight_...", value=1)
+    """
+
+    __slots__ = ("_flush_lock", "_wake", "_thread")
+
+    def __init__(
+        self,
+        client: Client,
+        ids: t.Iterable[str],
+        *,
+        name: str | None = None,
+        interval: float = 1.0,
+        processes: int = 64,
+    ) -> None:
+        super().__init__(client, ids, name=name, interval=interval, processes=processes)
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._start()
+        atexit.register(self.close)
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            if not self._elect():
+                return
+            for column, insight_id, total, delta in self._deltas():
+                try:
+                    insight_data = self.client.rest.edit_insight(
+                        project=self.client.project,
+                        insight_id=insight_id,
+                        value={"increment": delta},
+                    )
+                except LawgNotFoundError:
+                    # the insight is gone, retrying would never succeed
+                    logger.warning("dropping increments of deleted insight %s", insight_id)
+                else:
+                    if self.client.identity_map is not None:
+                        self.client._construct_insight(insight_data)
+                # only once sent, so a failed request is sent again by the next flush, and as the
+                # total rather than adding the delta, which could leave a rounding error pending
+                self._sent[column] = total
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+        try:
+            self.flush()
+            while not self._leave():
+                self.flush()
+        except BaseException:
+            self._leave(flush=False)
+            raise
+
+    def _start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name=f"lawg-shared-{self.name}", daemon=True)
+        self._thread.start()
+
+    def _forked(self) -> None:
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._start()
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.interval)
+            if self._closed:
+                return
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("failed to flush shared insight increments, retrying next interval")
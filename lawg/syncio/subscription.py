@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import contextlib
+import logging
+import threading
+import typing as t
+
+from lawg.base.subscription import BaseSubscription, FeedChange
+
+try:
+    import websockets.exceptions
+    import websockets.sync.client
+except ImportError:  # pragma: no cover - optional dependency
+    websockets = None  # type: ignore[assignment]
+
+if t.TYPE_CHECKING:
+    from lawg.mirror import EventMirror
+    from lawg.syncio.client import Client
+    from lawg.syncio.event import Event  # noqa: F401
+
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription(BaseSubscription["Client", "Event"]):
+    """
+    A feed subscription iterated in a thread, blocking until the next change.
+
+    Closing it from another thread ends the iteration.
+
+    Example:
+        >>> with client.subscribe(feed="signups") as subscription:
+        ...     for change in subscription:
+        ...         print(change.type, change.event.title)
+    """
+
+    __slots__ = ("_connection", "_lock", "_wake")
+
+    def __init__(
+        self,
+        client: Client,
+        feed: str,
+        *,
+        mirror: EventMirror | None = None,
+        since: str | None = None,
+        url: str | None = None,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+    ) -> None:
+        super().__init__(
+            client,
+            feed,
+            mirror=mirror,
+            since=since,
+            url=url,
+            reconnect_delay=reconnect_delay,
+            max_reconnect_delay=max_reconnect_delay,
+        )
+        self._connection: t.Any = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+
+    def __enter__(self) -> Subscription:
+        return self
+
+    def __exit__(self, _exc_type, _exc_value, _traceback) -> None:
+        self.close()
+
+    def __iter__(self) -> t.Iterator[FeedChange]:
+        attempt = 0
+        while not self._closed:
+            # entered as a context manager, which newer websockets versions require to connect
+            stack = contextlib.ExitStack()
+            try:
+                connection = stack.enter_context(websockets.sync.client.connect(self.url, **self._connect_options()))  # type: ignore
+            except (OSError, websockets.exceptions.WebSocketException) as exc:  # type: ignore
+                self._check_rejection(exc)
+                logger.warning("failed to connect the %r subscription: %s", self.feed, exc)
+                self._wake.wait(self._reconnect_delay(attempt))
+                attempt += 1
+                continue
+
+            with self._lock:
+                if self._closed:
+                    stack.close()
+                    return
+                self._connection = connection
+            try:
+                attempt = 0
+                # frames pushed meanwhile are buffered by the connection
+                if self.last_id is not None:
+                    yield from self._caught_up(list(self.client.iter_events(feed=self.feed, since=self.last_id)))
+                for message in connection:
+                    change = self._change(message)
+                    if change is not None:
+                        yield change
+            except (OSError, websockets.exceptions.ConnectionClosed) as exc:  # type: ignore
+                logger.warning("the %r subscription was disconnected: %s", self.feed, exc)
+            finally:
+                with self._lock:
+                    self._connection = None
+                stack.close()
+
+            if not self._closed:
+                self._wake.wait(self._reconnect_delay(attempt))
+                attempt += 1
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            connection = self._connection
+        self._wake.set()
+        if connection is not None:
+            connection.close()
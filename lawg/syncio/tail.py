@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import queue
+import threading
+import typing as t
+
+import httpx
+
+from lawg.base.tail import BaseFeedPoller, BaseTail
+from lawg.exceptions import LawgError
+
+if t.TYPE_CHECKING:
+    from lawg.syncio.client import Client
+    from lawg.syncio.event import Event
+
+
+class Tail(BaseTail["Event"]):
+    """
+    A tail of a feed, iterated in a thread, blocking until the next new event.
+
+    Closing it from another thread ends the iteration.
+
+    Example:
+        >>> with client.tail(feed="signups") as tail:
+        ...     for event in tail:
+        ...         print(event.title)
+    """
+
+    __slots__ = ("_poller", "_queue")
+
+    def __init__(self, poller: FeedPoller) -> None:
+        super().__init__(poller.feed)
+        self._poller = poller
+        self._queue: queue.SimpleQueue[list[Event] | None] = queue.SimpleQueue()
+
+    def __enter__(self) -> Tail:
+        return self
+
+    def __exit__(self, _exc_type, _exc_value, _traceback) -> None:
+        self.close()
+
+    def __iter__(self) -> t.Iterator[Event]:
+        while True:
+            events = self._queue.get()
+            if events is None:
+                return
+            yield from events
+
+    def put(self, events: list[Event]) -> None:
+        self._queue.put(events)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._poller.detach(self)
+        self._queue.put(None)
+
+
+class FeedPoller(BaseFeedPoller["Client", "Event"]):
+    """
+    A feed poller running in a background thread while any tail is attached.
+    """
+
+    __slots__ = ("_tails", "_wake", "_thread")
+
+    def __init__(
+        self,
+        client: Client,
+        feed: str,
+        *,
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        page_size: int = 100,
+    ) -> None:
+        super().__init__(client, feed, min_interval=min_interval, max_interval=max_interval, page_size=page_size)
+        self._tails: list[Tail] = []
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def tails(self) -> int:
+        return len(self._tails)
+
+    def start(self) -> None:
+        """Find the newest event, which tails start after."""
+        if self._started:
+            return
+        events = self.client.iter_events(feed=self.feed, page_size=1)
+        try:
+            self._start(next(events, None))
+        finally:
+            events.close()
+
+    def attach(self) -> Tail:
+        """Attach a tail, starting the polling thread if it isn't running. Called holding the client's pollers lock."""
+        tail = Tail(self)
+        self._tails.append(tail)
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=f"lawg-tail-{self.feed}", daemon=True)
+            self._thread.start()
+        return tail
+
+    def detach(self, tail: Tail) -> None:
+        with self.client._pollers_lock:
+            if tail in self._tails:
+                self._tails.remove(tail)
+            if not self._tails:
+                self._wake.set()
+
+    def poll(self) -> list[Event]:
+        """Fetch the events created since the last poll, oldest first, and adapt the interval."""
+        events = self.client.iter_events(feed=self.feed, since=self.last_id, page_size=self.page_size)
+        return self._seen(list(events))
+
+    def close(self) -> None:
+        """Close every tail, which stops the poller."""
+        for tail in list(self._tails):
+            tail.close()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            with self.client._pollers_lock:
+                if not self._tails:
+                    # a tail attaching later starts a new poller
+                    if self.client._pollers.get(self.feed) is self:
+                        del self.client._pollers[self.feed]
+                    return
+                tails = list(self._tails)
+            try:
+                events = self.poll()
+            except (LawgError, httpx.HTTPError) as exc:
+                self._failed(exc)
+                continue
+            if events:
+                for tail in tails:
+                    tail.put(events)
@@ -7,6 +7,7 @@ import typing as t
 import httpx
 
 if t.TYPE_CHECKING:
+    import os
     from marshmallow import Schema
     from lawg.syncio.client import Client
     from lawg.asyncio.client import AsyncClient
@@ -18,9 +19,12 @@ if t.TYPE_CHECKING:
     from lawg.asyncio.event import AsyncEvent
     from lawg.syncio.insight import Insight
     from lawg.asyncio.insight import AsyncInsight
+    from lawg.syncio.buffer import IncrementBuffer
+    from lawg.asyncio.buffer import AsyncIncrementBuffer
 
 
 STR_DICT: t.TypeAlias = "dict[str, t.Any]"
+PATH: t.TypeAlias = "str | os.PathLike[str]"
 
 Undefined = t.NewType("Undefined", object)
 UNDEFINED = Undefined(object)
@@ -32,6 +36,7 @@ R = t.TypeVar("R", "Rest", "AsyncRest")
 H = t.TypeVar("H", httpx.Client, httpx.AsyncClient)
 E = t.TypeVar("E", "Event", "AsyncEvent")
 I = t.TypeVar("I", "Insight", "AsyncInsight")
+B = t.TypeVar("B", "IncrementBuffer", "AsyncIncrementBuffer")
 
 
 ErrorCode: t.TypeAlias = (
@@ -47,6 +52,9 @@ ErrorCode: t.TypeAlias = (
 )
 
 
+ProgressCallback: t.TypeAlias = "t.Callable[[int, int], None]"
+
+
 class DataWithSchema(t.NamedTuple):
     """Data with schema."""
 
@@ -0,0 +1 @@
+"""lawg.py tests, run with `python -m pytest` from the repository root."""
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+from tests.fakes import FakeAPI, StandInServer
+
+
+@pytest.fixture()
+def api() -> FakeAPI:
+    api = FakeAPI()
+    api.add_feed("signups")
+    api.add_feed("orders")
+    return api
+
+
+@pytest.fixture()
+def server() -> t.Iterator[StandInServer]:
+    pytest.importorskip("websockets")
+    server = StandInServer()
+    yield server
+    server.close()
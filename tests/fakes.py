@@ -0,0 +1,210 @@
+"""In-memory stand-ins for the lawg API, served over `httpx.MockTransport` and a local websocket server."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import itertools
+import json
+import threading
+import time
+import typing as t
+
+import httpx
+
+from lawg.asyncio.client import AsyncClient
+from lawg.syncio.client import Client
+
+if t.TYPE_CHECKING:
+    from websockets.asyncio.server import Server, ServerConnection
+
+EPOCH = 1640995200000
+_sequence = itertools.count()
+
+
+def pika(prefix: str) -> str:
+    snowflake = ((int(time.time() * 1000) - EPOCH) << 22) | (1 << 12) | (next(_sequence) & 0xFFF)
+    return f"{prefix}_{base64.urlsafe_b64encode(str(snowflake).encode()).decode().rstrip('=')}"
+
+
+class FakeAPI:
+    """The feeds and events of one project, newest event first."""
+
+    def __init__(self, project: str = "project") -> None:
+        self.project = project
+        self.project_id = pika("project")
+        self.feeds: dict[str, dict[str, t.Any]] = {}
+        self.events: dict[str, list[dict[str, t.Any]]] = {}
+        self.insights: dict[str, dict[str, t.Any]] = {}
+        # the method and path of every request
+        self.requests: list[tuple[str, str]] = []
+        # the number of requests to come that fail with a server error
+        self.failures = 0
+        self.lock = threading.Lock()
+
+    def add_feed(self, name: str) -> dict[str, t.Any]:
+        feed = {"id": pika("feed"), "project_id": self.project_id, "name": name, "description": None, "emoji": None}
+        self.feeds[name] = feed
+        self.events.setdefault(name, [])
+        return feed
+
+    def add_event(self, feed: str, title: str) -> dict[str, t.Any]:
+        event = {
+            "id": pika("event"),
+            "project_id": self.project_id,
+            "feed_id": self.feeds[feed]["id"],
+            "title": title,
+            "description": None,
+            "emoji": None,
+            "tags": None,
+        }
+        self.events[feed].insert(0, event)
+        return event
+
+    def add_insight(self, title: str, value: float = 0.0) -> dict[str, t.Any]:
+        insight: dict[str, t.Any] = {
+            "id": pika("insight"),
+            "title": title,
+            "description": None,
+            "value": value,
+            "emoji": None,
+            "updated_at": None,
+            "created_at": "2023-01-01T00:00:00+00:00",
+        }
+        self.insights[insight["id"]] = insight
+        return insight
+
+    @staticmethod
+    def ok(data: t.Any) -> httpx.Response:
+        return httpx.Response(200, json={"success": True, "data": data})
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.requests.append((request.method, request.url.path))
+            if self.failures:
+                self.failures -= 1
+                return httpx.Response(500, json={"success": False, "error": {"code": "internal", "message": "x"}})
+            # /v1/projects/{project}/feeds/{feed}/events[/{id}] or /v1/projects/{project}/insights[/{id}]
+            parts = request.url.path.split("/")[3:]
+            body = json.loads(request.content) if request.content else {}
+            if len(parts) > 1 and parts[1] == "insights":
+                return self._handle_insights(request.method, parts[2:], body)
+            if len(parts) < 4 or parts[1] != "feeds" or parts[2] not in self.feeds:
+                return httpx.Response(404, json={"success": False, "error": {"code": "not_found", "message": "x"}})
+            events = self.events[parts[2]]
+            if len(parts) == 4 and request.method == "GET":
+                offset = body.get("offset", 0)
+                return self.ok(events[offset : offset + body.get("limit", 25)])
+            if len(parts) == 4 and request.method == "POST":
+                event = self.add_event(parts[2], body["title"])
+                event.update(body)
+                return self.ok(event)
+            event = next(event for event in events if event["id"] == parts[4])
+            return self.ok(event)
+
+    def _handle_insights(self, method: str, parts: list[str], body: dict[str, t.Any]) -> httpx.Response:
+        if not parts:
+            if method == "POST":
+                return self.ok(self.add_insight(body["title"], body.get("value") or 0.0))
+            return self.ok(list(self.insights.values()))
+        insight = self.insights.get(parts[0])
+        if insight is None:
+            return httpx.Response(404, json={"success": False, "error": {"code": "not_found", "message": "x"}})
+        value = body.pop("value", None) or {}
+        insight["value"] = value.get("set", insight["value"] + value.get("increment", 0.0))
+        insight.update(body)
+        return self.ok(insight)
+
+    def client(self, **options: t.Any) -> Client:
+        client = Client(token="token", project=self.project, **options)
+        client.rest.http_client = httpx.Client(transport=httpx.MockTransport(self.handle), headers=client.rest.headers)
+        return client
+
+    def async_client(self) -> AsyncClient:
+        async def handle(request: httpx.Request) -> httpx.Response:
+            return self.handle(request)
+
+        client = AsyncClient(token="token", project=self.project)
+        client.rest.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handle), headers=client.rest.headers)
+        return client
+
+
+class StandInServer:
+    """A local websocket server pushing feed events, run by an event loop in a background thread."""
+
+    def __init__(self) -> None:
+        from websockets.asyncio.server import serve
+
+        self.connections: set[ServerConnection] = set()
+        self.handshakes: list[dict[str, str]] = []
+        # a status code to refuse handshakes with
+        self.refuse: int | None = None
+        self.loop = asyncio.new_event_loop()
+        self._server: Server | None = None
+        ready = threading.Event()
+
+        async def start() -> None:
+            self._server = await serve(self._handler, "127.0.0.1", 0, process_request=self._process)
+            ready.set()
+
+        self._thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(start(), self.loop)
+        ready.wait(5)
+        assert self._server is not None
+        port = self._server.sockets[0].getsockname()[1]
+        self.url: str = f"ws://127.0.0.1:{port}/v1/projects/project/feeds/signups/ws"
+
+    def _process(self, _connection: ServerConnection, request: t.Any) -> t.Any:
+        from websockets.datastructures import Headers
+        from websockets.http11 import Response
+
+        self.handshakes.append(dict(request.headers))
+        if self.refuse is not None:
+            return Response(self.refuse, "Refused", Headers(), b"")
+        return None
+
+    async def _handler(self, connection: ServerConnection) -> None:
+        self.connections.add(connection)
+        try:
+            await connection.wait_closed()
+        finally:
+            self.connections.discard(connection)
+
+    def _call(self, coroutine: t.Coroutine[t.Any, t.Any, None]) -> None:
+        asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(5)
+
+    def send(self, message: str) -> None:
+        async def send() -> None:
+            for connection in list(self.connections):
+                await connection.send(message)
+
+        self._call(send())
+
+    def push(self, type: str, event: dict[str, t.Any], feed: str = "signups") -> None:
+        self.send(json.dumps({"e": type, "d": {"project": "project", "feed": feed, "event": event}}))
+
+    def drop(self) -> None:
+        """Abort every connection without a closing handshake, like a network failure."""
+
+        async def drop() -> None:
+            for connection in list(self.connections):
+                connection.transport.abort()
+
+        self._call(drop())
+
+    def wait_connected(self, timeout: float = 5.0) -> None:
+        deadline = time.monotonic() + timeout
+        while not self.connections:
+            assert time.monotonic() < deadline, "nothing connected to the stand-in server"
+            time.sleep(0.01)
+
+    def close(self) -> None:
+        async def close() -> None:
+            assert self._server is not None
+            self._server.close()
+            await self._server.wait_closed()
+
+        self._call(close())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(5)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import threading
+import time
+import typing as t
+
+import pytest
+
+from lawg.exceptions import LawgBufferClosedError
+
+if t.TYPE_CHECKING:
+    from tests.fakes import FakeAPI
+
+
+def test_threshold_counts_every_shard(api: FakeAPI) -> None:
+    insight = api.add_insight("signups")
+    client = api.client()
+    buffer = client.buffer_increments(interval=3600, threshold=1000)
+
+    def patches() -> int:
+        return sum(1 for method, _ in api.requests if method == "PATCH")
+
+    # one busy thread, paced so the flushing thread would wake up in between, stays below the threshold
+    for _ in range(9):
+        for _ in range(111):
+            buffer.add(insight["id"], 1.0)
+        time.sleep(0.01)
+    assert patches() == 0
+
+    # and threads on other shards reach it together
+    threads = [threading.Thread(target=lambda: buffer.add(insight["id"], 1.0)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    deadline = time.monotonic() + 5
+    while not patches() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert patches() == 1
+    assert insight["value"] >= 1000
+
+    client.close()
+    assert insight["value"] == 1003
+
+
+def test_closed_buffer_refuses_increments(api: FakeAPI) -> None:
+    insight = api.add_insight("signups")
+    client = api.client()
+    buffer = client.buffer_increments(interval=3600)
+    buffer.add(insight["id"], 1.0)
+    buffer.close()
+
+    with pytest.raises(LawgBufferClosedError):
+        buffer.add(insight["id"], 1.0)
+    assert insight["value"] == 1
+
+
+def test_client_close_drops_the_buffer(api: FakeAPI) -> None:
+    insight = api.add_insight("signups")
+    client = api.client()
+    client.buffer_increments(interval=3600)
+    client.increment_insight(id=insight["id"], value=2.0)
+    client.close()
+
+    assert insight["value"] == 2
+    # so increments made after closing are not parked in it
+    assert client.increment_buffer is None
+
+
+def test_async_close_flushes_every_loop(api: FakeAPI) -> None:
+    insight = api.add_insight("signups")
+    client = api.async_client()
+    buffer = client.buffer_increments(interval=3600)
+
+    async def add() -> None:
+        buffer.add(insight["id"], 1.0)
+
+    # a loop that is still running in another thread
+    running = asyncio.new_event_loop()
+    thread = threading.Thread(target=running.run_forever)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(add(), running).result(5)
+    # and one that has finished and been collected
+    asyncio.run(add())
+    gc.collect()
+
+    async def close() -> None:
+        buffer.add(insight["id"], 1.0)
+        await client.close()
+
+    try:
+        asyncio.run(close())
+    finally:
+        running.call_soon_threadsafe(running.stop)
+        thread.join()
+        running.close()
+    assert insight["value"] == 3
+    assert client.increment_buffer is None
+    with pytest.raises(LawgBufferClosedError):
+        buffer.add(insight["id"], 1.0)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import asyncio
+import typing as t
+
+if t.TYPE_CHECKING:
+    from tests.fakes import FakeAPI
+
+
+def test_bulk_calls_on_separate_loops(api: FakeAPI) -> None:
+    client = api.async_client()
+    client.max_concurrency = 2
+    events = [{"title": f"signup {i}", "description": "x"} for i in range(6)]
+
+    # each run waits on the limiter, which must not stay bound to the first loop
+    for _ in range(2):
+        results = asyncio.run(client.events_many(feed="signups", events=events, concurrency=4))
+        assert not [result for result in results if isinstance(result, Exception)]
+    assert len(api.events["signups"]) == 12
+
+
+def test_concurrency_is_capped_by_max_concurrency(api: FakeAPI) -> None:
+    client = api.async_client()
+    client.max_concurrency = 3
+    in_flight = peak = 0
+
+    async def slow_event(**_: t.Any) -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    async def main() -> None:
+        client.event = slow_event  # type: ignore[method-assign]
+        events = [{"title": f"signup {i}"} for i in range(20)]
+        before = len(asyncio.all_tasks())
+        gathering = asyncio.ensure_future(client.events_many(feed="signups", events=events, concurrency=10))
+        await asyncio.sleep(0)
+        # the gathering task and a worker for each request the limit lets through
+        assert len(asyncio.all_tasks()) - before == 1 + client.max_concurrency
+        await gathering
+
+    asyncio.run(main())
+    assert peak == 3
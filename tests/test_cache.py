@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import typing as t
+
+import pytest
+
+from lawg.cache import InsightTitleCache
+from lawg.exceptions import LawgNotFoundError
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+    from tests.fakes import FakeAPI
+
+CALLERS = 8
+
+
+def created(api: FakeAPI) -> int:
+    return api.requests.count(("POST", f"/v1/projects/{api.project}/insights"))
+
+
+def test_concurrent_saves_leave_a_whole_cache(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "titles.json"
+    caches = [InsightTitleCache(path) for _ in range(CALLERS)]
+    threads = [
+        threading.Thread(target=lambda cache=cache: [cache.update({f"title {i}": f"id {i}"}) for i in range(50)])
+        for cache in caches
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert json.loads(path.read_text()) == {f"title {i}": f"id {i}" for i in range(50)}
+    assert [file.name for file in tmp_path.iterdir()] == ["titles.json"]
+
+
+def test_concurrent_lookups_create_one_insight(api: FakeAPI) -> None:
+    client = api.client()
+    fetch_insights = client.fetch_insights
+    listed = threading.Barrier(CALLERS)
+
+    def fetch_after_every_caller() -> t.Any:
+        insights = fetch_insights()
+        # every caller has found the insight missing before any creates it
+        listed.wait(5)
+        return insights
+
+    client.fetch_insights = fetch_after_every_caller  # type: ignore[method-assign]
+    insights: list[t.Any] = []
+    threads = [
+        threading.Thread(target=lambda: insights.append(client.insight_by_title("requests"))) for _ in range(CALLERS)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert created(api) == 1
+    assert len({insight.id for insight in insights}) == 1
+
+
+def test_concurrent_async_lookups_create_one_insight(api: FakeAPI) -> None:
+    async def main() -> list[t.Any]:
+        client = api.async_client()
+        fetch_insights = client.fetch_insights
+        waiting = 0
+        listed = asyncio.Event()
+
+        async def fetch_after_every_caller() -> t.Any:
+            nonlocal waiting
+            insights = await fetch_insights()
+            waiting += 1
+            if waiting == CALLERS:
+                listed.set()
+            await listed.wait()
+            return insights
+
+        client.fetch_insights = fetch_after_every_caller  # type: ignore[method-assign]
+        return await asyncio.gather(*(client.insight_by_title("requests") for _ in range(CALLERS)))
+
+    insights = asyncio.run(main())
+    assert created(api) == 1
+    assert len({insight.id for insight in insights}) == 1
+
+
+def test_renamed_insight_is_looked_up_again(api: FakeAPI) -> None:
+    client = api.client()
+    insight = api.add_insight("requests")
+    client.insight_titles.update({"requests": insight["id"]})
+    insight["title"] = "responses"
+
+    assert client.insight_by_title("requests", create=False) is None
+    assert "requests" not in client.insight_titles
+    assert client.insight_by_title("responses", create=False).id == insight["id"]
+
+
+def test_cached_title_is_looked_up_locally(api: FakeAPI) -> None:
+    client = api.client(identity_map=True)
+    insight = client.insight_by_title("requests")
+    requests = len(api.requests)
+
+    assert client.insight_by_title("requests") is insight
+    assert len(api.requests) == requests
+
+    # deleted elsewhere, and noticed by the next request about it
+    del api.insights[insight.id]
+    with pytest.raises(LawgNotFoundError):
+        client.increment_insight(id=insight.id, value=1.0)
+    assert insight.is_deleted
+    assert "requests" not in client.insight_titles
+    assert client.insight_by_title("requests", create=False) is None
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import math
+import random
+import typing as t
+
+import pytest
+from marshmallow import Schema, ValidationError, fields, validate
+from marshmallow_union import Union
+
+from lawg import compiler, schemas
+
+SCHEMAS = [
+    schema
+    for _, schema in inspect.getmembers(schemas, inspect.isclass)
+    if issubclass(schema, Schema) and schema.__module__ == schemas.__name__
+]
+SAMPLES = 300
+# values any field may be handed
+COMMON: list[t.Any] = [None, "", "x", 0, 1, -1, 1.5, True, False, [], {}, math.nan, math.inf, 2**70]
+
+
+def values(field: fields.Field, rng: random.Random, depth: int = 0) -> list[t.Any]:
+    """Values around the constraints of a field, valid and invalid alike."""
+    pool = list(COMMON)
+    kind = type(field)
+    if kind is schemas.PikaId:
+        pool += [f"{field.prefix}_MTIzNDU", f"other_{field.prefix}", f"{field.prefix}_"]  # type: ignore
+    if isinstance(field, fields.String):
+        pool += ["an ok-value_1", "é\U0001f600"]
+    if isinstance(field, fields.Float):
+        pool += [-0.0, 1e308, -math.inf]
+    if isinstance(field, fields.DateTime):
+        pool += ["2023-01-01T00:00:00+00:00", "2023-01-01", "yesterday"]
+    for validator in field.validators:
+        if type(validator) is validate.Length:
+            for size in (validator.min, validator.max, validator.equal):
+                if size is not None:
+                    pool += ["a" * (size - 1) if size else "", "a" * size, "a" * (size + 1)]
+        elif type(validator) is validate.Range:
+            pool += [bound for bound in (validator.min, validator.max) if bound is not None]
+        elif type(validator) is validate.Regexp:
+            pool += ["my-project_1", "My Project"]
+        elif type(validator) is validate.OneOf:
+            pool += [*validator.choices, "other"]
+        elif type(validator) is validate.Equal:
+            pool.append(validator.comparable)
+    if depth > 2:
+        return pool
+    if kind is Union:
+        for candidate in field._candidate_fields:  # type: ignore
+            pool += values(candidate, rng, depth + 1)
+    elif kind is fields.Nested:
+        pool += [sample(field.schema, rng, depth + 1) for _ in range(5)]  # type: ignore
+    elif kind is fields.List:
+        inner = values(field.inner, rng, depth + 1)  # type: ignore
+        pool += [[rng.choice(inner) for _ in range(rng.randint(1, 3))] for _ in range(5)]
+    elif kind is fields.Dict:
+        keys = values(field.key_field, rng, depth + 1) if field.key_field else ["key"]  # type: ignore
+        items = values(field.value_field, rng, depth + 1) if field.value_field else COMMON  # type: ignore
+        keys = [key for key in keys if isinstance(key, (str, int, float, bool)) or key is None]
+        pool += [{rng.choice(keys): rng.choice(items) for _ in range(rng.randint(1, 3))} for _ in range(5)]
+    return pool
+
+
+def accepts(field: fields.Field, value: t.Any) -> bool:
+    try:
+        field.deserialize(value)
+    except ValidationError:
+        return False
+    return True
+
+
+# the values of each field, and those it accepts, by field
+_pools: dict[fields.Field, tuple[list[t.Any], list[t.Any]]] = {}
+
+
+def sample(schema: Schema, rng: random.Random, depth: int = 0) -> dict[str, t.Any]:
+    data = {}
+    for name, field in schema.load_fields.items():
+        if field not in _pools:
+            pool = values(field, rng, depth)
+            _pools[field] = pool, [value for value in pool if accepts(field, value)]
+        pool, valid = _pools[field]
+        # mostly values the field accepts, so most samples get past the first checks
+        if valid and rng.random() < 0.9:
+            pool = valid
+        if rng.random() > 0.05:
+            data[name] = rng.choice(pool)
+    if rng.random() < 0.05:
+        data["unknown"] = 1
+    return data
+
+
+def identical(first: t.Any, second: t.Any) -> bool:
+    """Equal with the same types throughout, unlike `0 == False`."""
+    if type(first) is not type(second):
+        return False
+    if isinstance(first, dict):
+        return first.keys() == second.keys() and all(identical(first[key], second[key]) for key in first)
+    if isinstance(first, list):
+        return len(first) == len(second) and all(identical(first[i], second[i]) for i in range(len(first)))
+    # nan is identical to itself here
+    return first == second or (first != first and second != second)
+
+
+def outcome(load: t.Callable[[], t.Any]) -> tuple[str, t.Any]:
+    try:
+        return "loaded", load()
+    except ValidationError as exc:
+        return "invalid", exc.messages
+
+
+@pytest.mark.parametrize("schema_cls", SCHEMAS, ids=lambda schema: schema.__name__)
+@pytest.mark.parametrize("many", [False, True], ids=["one", "many"])
+def test_compiled_load_matches_marshmallow(schema_cls: type[Schema], many: bool) -> None:
+    schema = schema_cls(many=many)
+    template = schema_cls()
+    rng = random.Random(schema_cls.__name__)
+    loaded = 0
+    for _ in range(SAMPLES):
+        data: t.Any = sample(template, rng)
+        if many:
+            data = [data, sample(template, rng)] if rng.random() < 0.9 else data
+        expected = outcome(functools.partial(schema.load, data))
+        got = outcome(functools.partial(compiler.load, schema, data))
+        assert got[0] == expected[0] and identical(got[1], expected[1]), data
+        loaded += expected[0] == "loaded"
+    if not many:
+        # the samples reach the compiled checks, rather than all failing on the same one
+        assert loaded, "no sample was valid"
+
+
+def exact(field: fields.Field, value: t.Any) -> bool:
+    """Whether a field loads a value as is, so its compiled checks must accept it without falling back."""
+    try:
+        return identical(field.deserialize(value), value)
+    except ValidationError:
+        return False
+
+
+@pytest.mark.parametrize("schema_cls", SCHEMAS, ids=lambda schema: schema.__name__)
+def test_compiled_checks_accept_every_exact_value(schema_cls: type[Schema]) -> None:
+    schema = schema_cls()
+    compiled = compiler.compile_schema(schema)
+    if compiled is None:
+        pytest.skip("not compiled")
+    rng = random.Random(schema_cls.__name__)
+    accepted = {
+        name: [value for value in values(field, rng) if exact(field, value)] for name, field in schema.load_fields.items()
+    }
+    if any(schema.load_fields[name].required and not found for name, found in accepted.items()):
+        pytest.skip("a required field loads no value as is")
+    base = {name: found[0] for name, found in accepted.items() if found}
+
+    # each accepted value in turn, e.g. strings at both ends of their length limits
+    for name, found in accepted.items():
+        for value in found:
+            data = {**base, name: value}
+            result = compiled(data)
+            assert result is not compiler.FALLBACK, data
+            assert identical(result, schema.load(data))
+    compiled_many = compiler.compile_schema(schema_cls(many=True))
+    assert compiled_many is not None
+    assert identical(compiled_many([base, base]), [schema.load(base)] * 2)
+
+
+def test_response_and_request_schemas_are_compiled() -> None:
+    for schema_cls in (schemas.EventSchema, schemas.FeedSchema, schemas.ProjectSchema, schemas.EventCreateBodySchema):
+        assert compiler.compile_schema(schema_cls()) is not None
+        assert compiler.compile_schema(schema_cls(many=True)) is not None
+    # created_at is a datetime, which only marshmallow loads
+    assert compiler.compile_schema(schemas.InsightSchema()) is None
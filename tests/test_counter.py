@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import gc
+import threading
+import typing as t
+import weakref
+
+from lawg.syncio.counter import ShardedCounter
+
+if t.TYPE_CHECKING:
+    from tests.fakes import FakeAPI
+
+
+def test_one_counter_per_insight(api: FakeAPI) -> None:
+    insight = api.add_insight("signups")
+    client = api.client()
+    threads = threading.active_count()
+
+    counters = [client.counter(id=insight["id"], interval=3600) for _ in range(10)]
+    for counter in counters:
+        counter.add()
+    assert all(counter is counters[0] for counter in counters)
+    assert threading.active_count() == threads + 1
+
+    client.close()
+    assert insight["value"] == 10
+    assert threading.active_count() == threads
+
+
+def test_idle_counter_is_not_kept_alive(api: FakeAPI) -> None:
+    counter = ShardedCounter(api.client(), api.add_insight("signups")["id"])
+    ref = weakref.ref(counter)
+    del counter
+    gc.collect()
+
+    assert ref() is None
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import json
+import os
+import typing as t
+
+import pytest
+
+from lawg.export import FeedExport
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+    from tests.fakes import FakeAPI
+
+
+def add_events(api: FakeAPI, *titles: str) -> list[str]:
+    """Add events oldest first, returning their ids newest first as the API lists them."""
+    for title in titles:
+        event = api.add_event("signups", title)
+        if title.startswith("legacy"):
+            # an id from before pika, which has no snowflake
+            event["id"] = f"event_{title}"
+    return [event["id"] for event in api.events["signups"]]
+
+
+def exported_ids(path: pathlib.Path) -> list[str]:
+    return [json.loads(line)["id"] for line in path.read_text().splitlines()]
+
+
+def test_page_ending_with_irregular_id(api: FakeAPI, tmp_path: pathlib.Path) -> None:
+    ids = add_events(api, "first", "second", "legacy", "fourth")
+    assert ids[1] == "event_legacy"
+    path = tmp_path / "signups.ndjson"
+
+    assert api.client().export_events(feed="signups", path=path, page_size=2) == 4
+    assert exported_ids(path) == ids
+
+
+def test_events_created_during_export_are_not_written_twice(api: FakeAPI, tmp_path: pathlib.Path) -> None:
+    ids = add_events(api, "first", "legacy-one", "third", "legacy-two", "fifth")
+    client = api.client()
+    path = tmp_path / "signups.ndjson"
+    export = FeedExport(path, feed="signups", page_size=2)
+
+    export.add(client.fetch_event_batch(feed="signups", limit=2, offset=export.offset))
+    # shifts the written events onto the next pages, irregular ones included
+    add_events(api, "created", "legacy-created")
+    while not export.done:
+        export.add(client.fetch_event_batch(feed="signups", limit=2, offset=export.offset))
+
+    assert export.finish() == 5
+    assert exported_ids(path) == ids
+
+
+def test_resume_cuts_the_file_back_to_the_checkpoint(api: FakeAPI, tmp_path: pathlib.Path) -> None:
+    ids = add_events(api, "first", "second", "third")
+    client = api.client()
+    path = tmp_path / "signups.ndjson"
+    export = FeedExport(path, feed="signups", page_size=2)
+    export.add(client.fetch_event_batch(feed="signups", limit=2, offset=0))
+    # a page written after the last checkpoint, by an export that was then interrupted
+    with open(path, "a") as file:
+        file.write('{"id": "event_partial"')
+
+    assert client.export_events(feed="signups", path=path, page_size=2) == 3
+    assert exported_ids(path) == ids
+    assert not os.path.exists(f"{path}.checkpoint")
+
+
+def test_restart_ignores_the_checkpoint(api: FakeAPI, tmp_path: pathlib.Path) -> None:
+    ids = add_events(api, "first", "second", "third")
+    client = api.client()
+    path = tmp_path / "signups.ndjson"
+    FeedExport(path, feed="signups", page_size=2).add(client.fetch_event_batch(feed="signups", limit=2, offset=0))
+
+    assert client.export_events(feed="signups", path=path, page_size=2, resume=False) == 3
+    assert exported_ids(path) == ids
+
+
+def test_parquet_parts_are_merged(api: FakeAPI, tmp_path: pathlib.Path) -> None:
+    parquet = pytest.importorskip("pyarrow.parquet")
+    ids = add_events(api, "first", "second", "legacy", "fourth", "fifth")
+    path = tmp_path / "signups.parquet"
+
+    assert api.client().export_events(feed="signups", path=path, format="parquet", page_size=2) == 5
+    file = parquet.ParquetFile(path)
+    assert file.num_row_groups == 3
+    assert file.read().column("id").to_pylist() == ids
+    assert not os.path.exists(f"{path}.parts")
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+from lawg.exceptions import LawgInternalServerError
+from lawg.metrics import Histogram, Summary
+
+if t.TYPE_CHECKING:
+    from tests.fakes import FakeAPI
+
+
+def values(api: FakeAPI) -> dict[str, float]:
+    return {insight["title"]: insight["value"] for insight in api.insights.values()}
+
+
+def test_failed_publish_keeps_unsent_samples(api: FakeAPI) -> None:
+    client = api.client()
+    metrics = client.metrics(interval=3600)
+    histogram = metrics.histogram("latency", quantiles=(0.5,))
+    summary = metrics.summary("size")
+    for value in (1.0, 2.0, 3.0):
+        histogram.observe(value)
+        summary.observe(value)
+    # resolves and publishes every insight, then fails on the second one
+    metrics.flush()
+    summary.observe(4.0)
+    histogram.observe(4.0)
+
+    api.failures = 1
+    with pytest.raises(LawgInternalServerError):
+        metrics.flush()
+    for insight in api.insights.values():
+        insight["value"] = 0.0
+
+    # the histogram failed first, and the summary wasn't collected yet
+    metrics.flush()
+    assert values(api)["latency count"] == 1
+    assert values(api)["size count"] == 1
+    assert values(api)["size sum"] == 4.0
+    client.close()
+
+
+def test_partly_published_metric_counts_once(api: FakeAPI) -> None:
+    client = api.client()
+    metrics = client.metrics(interval=3600)
+    summary = metrics.summary("size")
+    summary.observe(1.0)
+    metrics.flush()
+    summary.observe(2.0)
+    summary.observe(3.0)
+
+    # mean, min, max and count go through, sum fails
+    sent: list[str] = []
+    publish = metrics._publish
+
+    def flaky(sample: t.Any) -> None:
+        if sample.title == "size sum" and "size sum" not in sent:
+            sent.append(sample.title)
+            raise LawgInternalServerError(status_code=500)
+        publish(sample)
+
+    metrics._publish = flaky  # type: ignore
+    with pytest.raises(LawgInternalServerError):
+        metrics.flush()
+    assert values(api)["size count"] == 3
+    assert values(api)["size sum"] == 1.0
+
+    metrics.flush()
+    assert values(api)["size count"] == 3
+    assert values(api)["size sum"] == 6.0
+    client.close()
+
+
+def test_histogram_titles_fit_the_insight_limit() -> None:
+    Histogram("a" * 26, quantiles=(0.5, 0.99))
+    with pytest.raises(ValueError, match="between 1 and 25"):
+        Histogram("a" * 26, quantiles=(0.5, 0.9999))
+    Summary("a" * 26)
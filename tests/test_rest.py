@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import typing as t
+
+import httpx
+import pytest
+
+from lawg.exceptions import LawgHTTPError, LawgNotFoundError
+
+if t.TYPE_CHECKING:
+    from tests.fakes import FakeAPI
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        pytest.param(b"<html>bad gateway</html>", id="not-json"),
+        pytest.param(b'{"message": "Not Found"}', id="fastify"),
+        pytest.param(b'{"error": {"code": ["not_found"], "message": "x"}}', id="list-code"),
+        pytest.param(b'{"error": {"code": {"not": "found"}, "message": {"x": 1}}}', id="object-code"),
+        pytest.param(b'{"error": {"code": "teapot", "message": "x"}}', id="unknown-code"),
+    ],
+)
+def test_malformed_error_falls_back_to_the_status(api: FakeAPI, body: bytes) -> None:
+    error = api.client().rest.classify_error(httpx.Response(404, content=body))
+
+    assert type(error) is LawgNotFoundError
+
+
+def test_error_code_names_the_error(api: FakeAPI) -> None:
+    body = b'{"error": {"code": "not_found", "message": "no such feed"}}'
+    error = api.client().rest.classify_error(httpx.Response(400, content=body))
+
+    assert isinstance(error, LawgNotFoundError)
+    assert isinstance(error, LawgHTTPError)
+    assert str(error) == "no such feed"
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import typing as t
+import uuid
+from multiprocessing import shared_memory
+
+import pytest
+
+if t.TYPE_CHECKING:
+    from tests.fakes import FakeAPI
+
+# segments are shared across processes forked with the posix locks they're elected by
+pytest.importorskip("fcntl")
+
+
+@pytest.fixture()
+def name() -> t.Iterator[str]:
+    name = f"lawg-test-{uuid.uuid4().hex[:12]}"
+    yield name
+    # nothing left behind, neither the segment nor increments in it
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name)
+
+
+def fork(target: t.Callable[[], None]) -> None:
+    process = multiprocessing.get_context("fork").Process(target=target)
+    process.start()
+    process.join()
+    assert process.exitcode == 0
+
+
+def test_flusher_hands_over_on_close(api: FakeAPI, name: str) -> None:
+    insight = api.add_insight("requests")
+    first, second = api.client(), api.client()
+    shared = [client.share_increments(ids=[insight["id"]], name=name, interval=3600) for client in (first, second)]
+
+    first.increment_insight(id=insight["id"], value=1)
+    second.increment_insight(id=insight["id"], value=2)
+    shared[0].flush()
+    shared[1].flush()
+    assert shared[0].flusher and not shared[1].flusher
+    assert insight["value"] == 3
+
+    second.increment_insight(id=insight["id"], value=4)
+    # the flusher sends what's pending before leaving, and the other process takes over
+    first.close()
+    assert insight["value"] == 7
+    second.increment_insight(id=insight["id"], value=8)
+    shared[1].flush()
+    assert shared[1].flusher
+    assert insight["value"] == 15
+    second.close()
+
+
+def test_forked_workers_are_sent_by_the_flusher(api: FakeAPI, name: str) -> None:
+    insight = api.add_insight("requests")
+    client = api.client()
+    shared = client.share_increments(ids=[insight["id"]], name=name, interval=3600)
+    shared.flush()
+    assert shared.flusher
+
+    def worker(close: bool) -> None:
+        # a row of its own, while the parent stays the flusher
+        assert shared._slot != parent_slot and not shared.flusher
+        client.increment_insight(id=insight["id"], value=5)
+        if close:
+            client.close()
+        # otherwise it exits without flushing or leaving
+        os._exit(0)
+
+    parent_slot = shared._slot
+    fork(lambda: worker(close=True))
+    fork(lambda: worker(close=False))
+
+    # the parent's api never saw the children's requests, they only added into the segment
+    assert insight["value"] == 0
+    assert shared.pending == {insight["id"]: 10}
+    shared.flush()
+    assert insight["value"] == 10
+    client.close()
+
+
+def test_increments_outlive_their_process(api: FakeAPI, name: str) -> None:
+    insight = api.add_insight("requests")
+
+    def worker() -> None:
+        api.client().share_increments(ids=[insight["id"]], name=name, interval=3600).add(insight["id"], 7)
+        os._exit(0)
+
+    fork(worker)
+    # the segment is kept for the next process, which takes the exited one's row and sends its values
+    client = api.client()
+    shared = client.share_increments(ids=[insight["id"]], name=name, interval=3600)
+    assert shared.pending == {insight["id"]: 7}
+    client.close()
+    assert insight["value"] == 7
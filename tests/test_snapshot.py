@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+import threading
+import typing as t
+
+import pytest
+
+from lawg.schemas import InsightSchema, ProjectSchema, prebuilt
+from lawg.snapshot import ProjectSnapshot
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+    from tests.fakes import FakeAPI
+
+
+@pytest.fixture()
+def snapshot(api: FakeAPI) -> ProjectSnapshot:
+    project_data = {
+        "id": api.project_id,
+        "namespace": api.project,
+        "name": "Project",
+        "flags": 0,
+        "icon": None,
+        "feeds": list(api.feeds.values()),
+        "members": [],
+    }
+    insight_data = prebuilt(InsightSchema).load(api.add_insight("requests"))
+    return ProjectSnapshot(prebuilt(ProjectSchema).load(project_data), [insight_data])  # type: ignore
+
+
+def test_snapshot_round_trip(snapshot: ProjectSnapshot, tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "snapshot.json"
+    snapshot.save(path)
+
+    loaded = ProjectSnapshot.load(path, max_age=60)
+    assert loaded is not None
+    assert set(loaded.feeds) == {"signups", "orders"}
+    assert loaded.insight_ids == snapshot.insight_ids
+    assert ProjectSnapshot.load(path, max_age=-1) is None
+
+
+def test_concurrent_saves_leave_a_whole_snapshot(snapshot: ProjectSnapshot, tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "snapshot.json"
+    errors: list[Exception] = []
+
+    def save() -> None:
+        try:
+            for _ in range(20):
+                snapshot.save(path)
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=save) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert ProjectSnapshot.load(path) is not None
+    assert [file.name for file in tmp_path.iterdir()] == ["snapshot.json"]
+
+
+@pytest.mark.parametrize(
+    "edit",
+    [
+        pytest.param(lambda data: data.pop("taken_at"), id="truncated"),
+        pytest.param(lambda data: data.update(taken_at="yesterday"), id="bad-time"),
+        pytest.param(lambda data: data["project"].pop("flags"), id="stale-project"),
+        pytest.param(lambda data: data["insights"][0].update(value="high"), id="stale-insight"),
+        pytest.param(lambda data: data.update(project=None), id="not-an-object"),
+    ],
+)
+def test_unusable_snapshot_loads_as_none(
+    snapshot: ProjectSnapshot, tmp_path: pathlib.Path, edit: t.Callable[[dict[str, t.Any]], object]
+) -> None:
+    path = tmp_path / "snapshot.json"
+    snapshot.save(path)
+    data = json.loads(path.read_text())
+    edit(data)
+    path.write_text(json.dumps(data))
+
+    assert ProjectSnapshot.load(path) is None
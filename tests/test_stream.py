@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import json
+import typing as t
+
+import pytest
+
+from lawg.exceptions import LawgStreamDecodeError
+from lawg.stream import JSONArrayDecoder
+
+BODIES = {
+    "objects": {"success": True, "data": [{"id": 1, "title": "a"}, {"id": 2, "title": "b"}]},
+    "escapes": {
+        "success": True,
+        "data": [{"title": 'say "hi" \\ [not] {an} item, ok', "emoji": "é\U0001f600", "tab": "\t\n"}],
+    },
+    "nested": {"success": True, "data": [[1, [2, []]], {"tags": {"a": [{"b": {}}]}}, []]},
+    "scalars": {"success": True, "data": [1, -2.5e3, "three", True, False, None, "", "]"]},
+    "empty": {"success": True, "data": []},
+    "decoys": {"data ": [0], "meta": {"data": [0]}, "note": "data", "data": [{"data": [1]}], "after": [0]},
+}
+
+
+def decode(chunks: t.Iterable[str]) -> list[t.Any]:
+    decoder = JSONArrayDecoder("data")
+    items = [item for chunk in chunks for item in decoder.feed(chunk)]
+    decoder.close()
+    assert decoder.done
+    return items
+
+
+@pytest.mark.parametrize("body", BODIES.values(), ids=BODIES.keys())
+def test_every_split_decodes_the_same_items(body: dict[str, t.Any]) -> None:
+    text = json.dumps(body, ensure_ascii=False)
+    for offset in range(len(text) + 1):
+        assert decode([text[:offset], text[offset:]]) == body["data"], offset
+    assert decode(text) == body["data"]
+
+
+def test_items_are_decoded_as_soon_as_they_end() -> None:
+    text = '{"success": true, "data": [{"id": 1}, [2], "three", 4]}'
+    decoder = JSONArrayDecoder("data")
+    decoded = [(index, item) for index, character in enumerate(text) for item in decoder.feed(character)]
+
+    # arrays and objects end on their last character, strings and other scalars on the separator after them
+    assert decoded == [
+        (text.index("}"), {"id": 1}),
+        (text.index("]"), [2]),
+        (text.index('", 4') + 1, "three"),
+        (text.rindex("]"), 4),
+    ]
+    assert decoder.done
+
+
+def test_escaped_quote_split_from_its_backslash() -> None:
+    text = '{"data": ["a\\"b", "c\\\\", "d"]}'
+    backslash = text.index("\\")
+    assert decode([text[: backslash + 1], text[backslash + 1 :]]) == ['a"b', "c\\", "d"]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        pytest.param('{"success": true, "data": [{"id": 1}, {"id"', id="inside-an-item"),
+        pytest.param('{"success": true, "data": [1, 2', id="between-items"),
+        pytest.param('{"success": true, "da', id="before-the-array"),
+        pytest.param('{"success": true}', id="no-array"),
+        pytest.param("", id="empty"),
+    ],
+)
+def test_truncated_body(text: str) -> None:
+    decoder = JSONArrayDecoder("data")
+    decoder.feed(text)
+    with pytest.raises(LawgStreamDecodeError):
+        decoder.close()
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        pytest.param('[{"data": []}]', id="not-an-object"),
+        pytest.param('{"data": [{"id": 1}, nope]}', id="invalid-item"),
+        pytest.param('{"data": [{"id": 1},, 2]}', id="doubled-comma"),
+        pytest.param('{"data": [1, 2,]}', id="trailing-comma"),
+        pytest.param('{"data": [,]}', id="only-a-comma"),
+        pytest.param('{"data": [{"id": 1} 2]}', id="missing-comma"),
+    ],
+)
+def test_malformed_body(text: str) -> None:
+    with pytest.raises(LawgStreamDecodeError):
+        decode(text)
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+import typing as t
+
+import pytest
+
+from lawg.exceptions import LawgForbiddenError, LawgUnauthorizedError
+from lawg.mirror import EventMirror
+
+if t.TYPE_CHECKING:
+    from lawg.syncio.subscription import Subscription
+    from tests.fakes import FakeAPI, StandInServer
+
+
+def consume(subscription: Subscription) -> tuple[queue.Queue[t.Any], threading.Thread]:
+    changes: queue.Queue[t.Any] = queue.Queue()
+
+    def run() -> None:
+        for change in subscription:
+            changes.put(change)
+        changes.put(None)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return changes, thread
+
+
+def test_pushed_events(api: FakeAPI, server: StandInServer) -> None:
+    client = api.client()
+    subscription = client.subscribe(feed="signups", url=server.url)
+    changes, thread = consume(subscription)
+    server.wait_connected()
+    assert server.handshakes[-1]["authorization"] == "token"
+
+    event = api.add_event("signups", "created")
+    server.push("EVENT_CREATE", event)
+    change = changes.get(timeout=5)
+    assert change.type == "EVENT_CREATE"
+    assert change.event.id == event["id"]
+    assert change.event.title == "created"
+    assert subscription.last_id == event["id"]
+
+    subscription.close()
+    thread.join(5)
+    assert changes.get(timeout=1) is None
+
+
+def test_other_feeds_and_malformed_frames_are_skipped(api: FakeAPI, server: StandInServer) -> None:
+    client = api.client()
+    subscription = client.subscribe(feed="signups", url=server.url)
+    changes, thread = consume(subscription)
+    server.wait_connected()
+
+    server.push("EVENT_CREATE", api.add_event("orders", "elsewhere"), feed="orders")
+    server.send("not json")
+    server.send('{"e": "EVENT_CREATE"}')
+    server.send('{"e": "LOG_CREATE", "d": {}}')
+    event = api.add_event("signups", "after")
+    server.push("EVENT_CREATE", event)
+
+    assert changes.get(timeout=5).event.id == event["id"]
+    assert changes.empty()
+    subscription.close()
+    thread.join(5)
+
+
+def test_dropped_connection_resumes_through_iter_events(api: FakeAPI, server: StandInServer) -> None:
+    client = api.client()
+    subscription = client.subscribe(feed="signups", url=server.url)
+    subscription.reconnect_delay = 0.05
+    changes, thread = consume(subscription)
+    server.wait_connected()
+    first = api.add_event("signups", "first")
+    server.push("EVENT_CREATE", first)
+    assert changes.get(timeout=5).event.id == first["id"]
+
+    server.drop()
+    # created while disconnected, never pushed
+    missed = [api.add_event("signups", "missed 1"), api.add_event("signups", "missed 2")]
+    assert [changes.get(timeout=10).event.id for _ in missed] == [event["id"] for event in missed]
+
+    server.wait_connected()
+    # pushed again after the backfill already delivered it
+    server.push("EVENT_CREATE", missed[-1])
+    last = api.add_event("signups", "last")
+    server.push("EVENT_CREATE", last)
+    assert changes.get(timeout=5).event.id == last["id"]
+    assert changes.empty()
+    subscription.close()
+    thread.join(5)
+
+
+def test_mirror_updates(api: FakeAPI, server: StandInServer) -> None:
+    client = api.client()
+    mirror = EventMirror()
+    subscription = client.subscribe(feed="signups", mirror=mirror, url=server.url)
+    changes, thread = consume(subscription)
+    server.wait_connected()
+
+    event = api.add_event("signups", "created")
+    server.push("EVENT_CREATE", event)
+    changes.get(timeout=5)
+    assert mirror.event(event["id"]) == {**event, "feed": "signups"}
+    assert mirror.last_id("signups") == event["id"]
+
+    server.push("EVENT_UPDATE", {**event, "title": "edited"})
+    assert changes.get(timeout=5).type == "EVENT_UPDATE"
+    assert mirror.event(event["id"]) == {**event, "title": "edited", "feed": "signups"}
+
+    server.push("EVENT_DELETE", event)
+    assert changes.get(timeout=5).type == "EVENT_DELETE"
+    assert mirror.event(event["id"]) is None
+    subscription.close()
+    thread.join(5)
+
+    # a new subscription resumes after the mirror's newest event
+    missed = api.add_event("signups", "missed")
+    resumed = client.subscribe(feed="signups", mirror=mirror, url=server.url)
+    assert next(iter(resumed)).event.id == missed["id"]
+    resumed.close()
+
+
+def test_refused_handshake(api: FakeAPI, server: StandInServer) -> None:
+    server.refuse = 401
+    with pytest.raises(LawgUnauthorizedError):
+        next(iter(api.client().subscribe(feed="signups", url=server.url)))
+
+
+def test_async_subscription(api: FakeAPI, server: StandInServer) -> None:
+    async def main() -> None:
+        client = api.async_client()
+        mirror = EventMirror()
+        async with client.subscribe(feed="signups", mirror=mirror, url=server.url) as subscription:
+            subscription.reconnect_delay = 0.05
+            changes = subscription.__aiter__()
+            pending = asyncio.ensure_future(changes.__anext__())
+            while not server.connections:
+                await asyncio.sleep(0.01)
+
+            event = api.add_event("signups", "created")
+            server.send("not json")
+            server.push("EVENT_CREATE", event)
+            assert (await asyncio.wait_for(pending, 5)).event.id == event["id"]
+
+            server.drop()
+            missed = api.add_event("signups", "missed")
+            assert (await asyncio.wait_for(changes.__anext__(), 10)).event.id == missed["id"]
+            assert mirror.last_id("signups") == missed["id"]
+
+        server.refuse = 403
+        with pytest.raises(LawgForbiddenError):
+            async for _ in client.subscribe(feed="signups", url=server.url):
+                pass
+        await client.close()
+
+    asyncio.run(main())
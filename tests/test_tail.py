@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import threading
+import typing as t
+
+if t.TYPE_CHECKING:
+    from tests.fakes import FakeAPI
+
+
+def test_starting_a_tail_holds_up_no_other_feed(api: FakeAPI) -> None:
+    client = api.client()
+    iter_events = client.iter_events
+    requested = threading.Event()
+    release = threading.Event()
+    released: list[bool] = []
+
+    def slow_for_signups(*, feed: str, **options: t.Any) -> t.Any:
+        if feed == "signups":
+            requested.set()
+            released.append(release.wait(5))
+        return iter_events(feed=feed, **options)
+
+    client.iter_events = slow_for_signups  # type: ignore[method-assign]
+    tails = []
+    thread = threading.Thread(target=lambda: tails.append(client.tail(feed="signups")))
+    thread.start()
+    try:
+        assert requested.wait(5)
+        orders = client.tail(feed="orders")
+    finally:
+        release.set()
+        thread.join()
+    # released by the other feed's tail, rather than given up on
+    assert released == [True]
+
+    assert client.tail(feed="signups")._poller is tails[0]._poller
+    orders.close()
+    client.close()